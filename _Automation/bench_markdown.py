@@ -0,0 +1,178 @@
+"""
+Benchmark the portal's markdown renderer on large daily briefs.
+Compares md_render against the previous line-by-line converter and, when
+installed, python-markdown (tables + fenced_code + nl2br). Known-tricky
+inputs are checked against their expected HTML before timing.
+Run: python bench_markdown.py [--mb 1] [--repeat 5]
+"""
+import argparse, glob, html, os, re, sys, time
+
+import md_render
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEMOS = os.path.join(os.path.dirname(HERE), 'docs', 'demos')
+
+
+# ── Previous portal converter, kept verbatim for comparison ──
+def legacy_md_to_html(md):
+    esc = html.escape
+    lines = md.split('\n')
+    html_parts = []
+    in_table = False
+    in_list = False
+    in_code = False
+
+    for line in lines:
+        s = line.rstrip()
+        if s.startswith('```'):
+            if in_code:
+                html_parts.append('</code></pre>')
+                in_code = False
+            else:
+                in_code = True
+                html_parts.append('<pre><code>')
+            continue
+        if in_code:
+            html_parts.append(esc(s))
+            continue
+        if in_list and not s.startswith('- ') and not s.startswith('* ') and not re.match(r'^\d+\.', s):
+            html_parts.append('</ul>')
+            in_list = False
+        if in_table and '|' not in s:
+            html_parts.append('</table>')
+            in_table = False
+        m = re.match(r'^(#{1,4})\s+(.+)', s)
+        if m:
+            level = len(m.group(1))
+            html_parts.append(f'<h{level}>{esc(m.group(2))}</h{level}>')
+            continue
+        if '|' in s and s.strip().startswith('|'):
+            cells = [c.strip() for c in s.split('|')[1:-1]]
+            if all(re.match(r'^[-:]+$', c) for c in cells if c):
+                continue
+            if not in_table:
+                html_parts.append('<table>')
+                in_table = True
+                html_parts.append('<tr>' + ''.join(f'<th>{esc(c)}</th>' for c in cells) + '</tr>')
+            else:
+                html_parts.append('<tr>' + ''.join(f'<td>{_legacy_inline(c)}</td>' for c in cells) + '</tr>')
+            continue
+        if s.startswith('- ') or s.startswith('* '):
+            if not in_list:
+                html_parts.append('<ul>')
+                in_list = True
+            html_parts.append(f'<li>{_legacy_inline(s[2:])}</li>')
+            continue
+        mn = re.match(r'^(\d+)\.\s+(.+)', s)
+        if mn:
+            if not in_list:
+                html_parts.append('<ul>')
+                in_list = True
+            html_parts.append(f'<li>{_legacy_inline(mn.group(2))}</li>')
+            continue
+        if s.startswith('>'):
+            html_parts.append(f'<blockquote>{_legacy_inline(s[1:].strip())}</blockquote>')
+            continue
+        if re.match(r'^[-*_]{3,}$', s):
+            html_parts.append('<hr>')
+            continue
+        if s.strip():
+            html_parts.append(f'<p>{_legacy_inline(s)}</p>')
+
+    if in_table:
+        html_parts.append('</table>')
+    if in_list:
+        html_parts.append('</ul>')
+    if in_code:
+        html_parts.append('</code></pre>')
+    return '\n'.join(html_parts)
+
+
+def _legacy_inline(text):
+    text = html.escape(text)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+    text = re.sub(r'`(.+?)`', r'<code>\1</code>', text)
+    text = re.sub(r'~~(.+?)~~', r'<del>\1</del>', text)
+    return text
+
+
+# ── Parity: md_render output for inputs that have regressed before ──
+PARITY = [
+    ('paragraph after list',
+     '- a\n- b\n\nPara',
+     '<ul>\n<li>a</li>\n<li>b</li></ul>\n<p>Para</p>'),
+    ('lazy list continuation',
+     '- a\ncont',
+     '<ul>\n<li>a<br>\ncont</li></ul>'),
+    ('indented text after blank stays in item',
+     '- a\n\n  more',
+     '<ul>\n<li>a<br>\nmore</li></ul>'),
+]
+
+
+def check_parity():
+    failed = 0
+    for name, src, want in PARITY:
+        got = md_render.render(src)
+        if got != want:
+            failed += 1
+            print(f'  parity FAIL: {name}\n    want {want!r}\n    got  {got!r}')
+    print(f'Parity: {len(PARITY) - failed}/{len(PARITY)} ok\n')
+    return not failed
+
+
+def make_brief(mb):
+    """Concatenate the demo documents until the text reaches `mb` megabytes."""
+    parts = [open(p, encoding='utf-8').read() for p in sorted(glob.glob(os.path.join(DEMOS, '*.md')))]
+    if not parts:
+        sys.exit(f'No demo markdown found in {DEMOS}')
+    target = int(mb * 1024 * 1024)
+    out, size, i = [], 0, 0
+    while size < target:
+        chunk = parts[i % len(parts)] + '\n\n'
+        out.append(chunk)
+        size += len(chunk.encode('utf-8'))
+        i += 1
+    return ''.join(out)
+
+
+def engines():
+    yield 'md_render', md_render.render
+    yield 'legacy md_to_html', legacy_md_to_html
+    try:
+        import markdown
+    except ImportError:
+        print('  (python-markdown not installed — skipped)')
+        return
+    md = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br'])
+
+    def convert(text):
+        md.reset()
+        return md.convert(text)
+    yield 'markdown.Markdown', convert
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('--mb', type=float, default=1.0, help='brief size in MB (default 1)')
+    ap.add_argument('--repeat', type=int, default=5, help='runs per engine; best is reported')
+    args = ap.parse_args()
+
+    if not check_parity():
+        sys.exit(1)
+    text = make_brief(args.mb)
+    mb = len(text.encode('utf-8')) / 1024 / 1024
+    print(f'Brief: {mb:.2f} MB, {text.count(chr(10)):,} lines, best of {args.repeat}\n')
+    print(f'  {"engine":<20} {"best ms":>10} {"MB/s":>8} {"html KB":>9}')
+    for name, fn in engines():
+        best = float('inf')
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            out = fn(text)
+            best = min(best, time.perf_counter() - t0)
+        print(f'  {name:<20} {best * 1000:>10.1f} {mb / best:>8.1f} {len(out) / 1024:>9.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+"""
+Brain OS — Portal benchmark suite
+Builds a synthetic workspace (project folders, signal history, briefs,
+action items) in a temp directory, loads serve_artifacts against it and
+times the portal's hot paths: scanner, parsers and page renderers.
+Runs offline; none of the PowerShell fetchers are needed.
+
+Run:     python bench_portal.py [--files 2000] [--depth 3] [--days 14]
+                                [--emails 40] [--actions 200] [--repeat 5]
+Compare: python bench_portal.py --compare OLD.json NEW.json
+Results are saved as JSON under _Automation/.cache/bench/ (see --out).
+"""
+import argparse, importlib.util, json, os, platform, random, shutil, statistics
+import subprocess, sys, tempfile, time, tracemalloc
+from datetime import datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEMO_BRIEF = os.path.join(os.path.dirname(HERE), 'docs', 'demos', 'demo_daily_brief.md')
+SOURCES = ('serve_artifacts.py', 'md_render.py')
+
+PROJECTS = [
+    ('alpha', 'Project Alpha', ['alpha', 'platform', 'core-api']),
+    ('beta', 'Project Beta', ['beta', 'partner', 'integration']),
+    ('gamma', 'Project Gamma', ['gamma', 'devex', 'SDK']),
+]
+FILE_EXTS = ['.md', '.md', '.docx', '.pptx', '.xlsx', '.pdf', '.html', '.png']
+WORDS = ('roadmap review spec sprint launch partner telemetry budget hiring retro design '
+         'migration latency rollout security notes status plan metrics escalation').split()
+PEOPLE = ['Alex Kim', 'Priya Shah', 'Marcus Lee', 'Dana Cruz', 'Sam Ortiz', 'Your Name']
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SYNTHETIC WORKSPACE
+# ═══════════════════════════════════════════════════════════════════════════
+def _phrase(rng, n=4):
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+def _write(path, text, mtime=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def _config():
+    return {
+        'pm_identity': {'name': 'Your Name'},
+        'projects': [{'name': name, 'slug': slug, 'folder': f'projects/project-{slug}',
+                      'description': f'{name} workstream', 'status': '🟢 Active',
+                      'metrics': [['Open Bugs', '42', '<30', 'y']], 'keywords': kw}
+                     for slug, name, kw in PROJECTS],
+        'charter_patterns': [{'name': name, 'keywords': kw} for _, name, kw in PROJECTS],
+        'portal': {'watch': 'off'},
+    }
+
+def _make_files(root, rng, count, depth, now):
+    folders = [f'projects/project-{slug}' for slug, _, _ in PROJECTS] + ['00_Daily_Intelligence/Knowledge_Base', '08_Archive']
+    dirs = []
+    for top in folders:
+        for i in range(3):
+            d = top
+            for level in range(depth):
+                d = f'{d}/{rng.choice(WORDS)}_{level}_{i}'
+                dirs.append(d)
+    dirs += folders
+    for i in range(count):
+        ext = FILE_EXTS[i % len(FILE_EXTS)]
+        name = f'{_phrase(rng, 3).title().replace(" ", "_")}_{i}{ext}'
+        body = f'# {_phrase(rng)}\n\n{_phrase(rng, 40)}\n' if ext == '.md' else _phrase(rng, 20)
+        _write(os.path.join(root, rng.choice(dirs), name), body, now - rng.uniform(0, 90 * 86400))
+
+def _emails(rng, date, n):
+    out = [f'# Email Signals - {date}', '', f'> Fetched at 07:{rng.randint(10, 59)}:00 | Lookback: 24h', '']
+    for i in range(n):
+        if i % 15 == 0:
+            out += [f'## {rng.choice(["Inbox", "Partners", "Leadership"])}', '']
+        kw = rng.choice(PROJECTS)[2][0]
+        out += [f'### [{date} {8 + i % 10:02d}:{i % 60:02d}] {_phrase(rng)} {kw}',
+                f'- **From:** {rng.choice(PEOPLE)} <someone@example.com>',
+                '- **To:** you@example.com', f'- **Preview:** {_phrase(rng, 12)}', '']
+    return '\n'.join(out)
+
+def _calendar(rng, date):
+    out = [f'# Calendar Signals - {date}', '']
+    for label in ('Today', 'Tomorrow'):
+        out += [f'## {label} - {date}', '', '| Time | Duration | Meeting | Organizer | Status |',
+                '|------|----------|---------|-----------|--------|']
+        for h in range(8, 18, 1 if label == 'Today' else 2):
+            out.append(f'| {h:02d}:00–{h:02d}:30 | 30m | {_phrase(rng, 3)} | {rng.choice(PEOPLE)} | Busy |')
+        out.append('')
+        if label == 'Today':
+            out += ['### Free Slots Today', '- 12:30–13:00 (30m)', '- 17:30–18:00 (30m)', '',
+                    '### [WARN] Conflicts',
+                    '- **Standup** (09:00–09:30) overlaps **Design Review** (09:00–09:30)', '']
+    return '\n'.join(out)
+
+def _rows(rng, title, n):
+    out = [f'# {title}', '', '## Items', '', '| ID | Title | State |', '|----|-------|-------|']
+    out += [f'| {1000 + i} | {_phrase(rng)} | {rng.choice(["Active", "New", "Resolved"])} |' for i in range(n)]
+    return '\n'.join(out) + '\n'
+
+def _actions(rng, n):
+    out = ['# Action Items', '', '## Active Items', '',
+           '| Status | Charter | Item | Owner | Due | Link |', '|---|---|---|---|---|---|']
+    for i in range(n):
+        status = ['🔴 THIS WEEK', '🟡 NEXT WEEK', 'TODO', '✅ DONE'][i % 4]
+        kw = rng.choice(PROJECTS)[2][0]
+        out.append(f'| {status} | [{kw}] | {_phrase(rng, 5)} {kw} | {rng.choice(PEOPLE)} | — | — |')
+    return '\n'.join(out) + '\n'
+
+def make_workspace(root, files=2000, depth=3, days=14, emails=40, actions=200, seed=7):
+    """Populate `root` with a synthetic Brain OS workspace. Signal files older
+    than a week are archived the way cleanup.ps1 does."""
+    rng = random.Random(seed)
+    now = time.time()
+    today = datetime.now()
+    auto = os.path.join(root, '_Automation')
+    os.makedirs(auto, exist_ok=True)
+    for name in SOURCES:
+        shutil.copy2(os.path.join(HERE, name), auto)
+    _write(os.path.join(auto, 'config.json'), json.dumps(_config(), indent=2))
+    _make_files(root, rng, files, depth, now)
+
+    brief = open(DEMO_BRIEF, encoding='utf-8').read() if os.path.exists(DEMO_BRIEF) else _rows(rng, 'Brief', 40)
+    intel = os.path.join(root, '00_Daily_Intelligence')
+    for n in range(days):
+        d = today - timedelta(days=n)
+        date = d.strftime('%Y-%m-%d')
+        sig = os.path.join(intel, 'Signals') if n < 7 else os.path.join(root, '08_Archive', 'Signals', d.strftime('%Y-%m'))
+        _write(os.path.join(sig, f'emails_{date}.md'), _emails(rng, date, emails))
+        _write(os.path.join(sig, f'calendar_{date}.md'), _calendar(rng, date))
+        _write(os.path.join(sig, f'ado_{date}.md'), _rows(rng, 'ADO Signals', 30))
+        _write(os.path.join(sig, f'chats_{date}.md'), _rows(rng, 'Chat Signals', 20))
+        briefs = os.path.join(intel, 'Daily_Briefs') if n < 7 else os.path.join(root, '08_Archive', 'Briefs', d.strftime('%Y-%m'))
+        _write(os.path.join(briefs, f'{date}_Brief.md'), brief)
+    _write(os.path.join(intel, 'Knowledge_Base', 'Action_Items.md'), _actions(rng, actions))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RUNNER
+# ═══════════════════════════════════════════════════════════════════════════
+def load_portal(root):
+    """Import the workspace's copy of serve_artifacts (ROOT resolves there)."""
+    auto = os.path.join(root, '_Automation')
+    sys.path.insert(0, auto)
+    sys.modules.pop('md_render', None)
+    spec = importlib.util.spec_from_file_location('serve_artifacts', os.path.join(auto, 'serve_artifacts.py'))
+    sa = importlib.util.module_from_spec(spec)
+    sys.modules['serve_artifacts'] = sa
+    spec.loader.exec_module(sa)
+    return sa
+
+def cases(sa):
+    """(name, setup, fn) triples; setup runs untimed before every call."""
+    today = datetime.now().strftime('%Y-%m-%d')
+    old = (datetime.now() - timedelta(days=10)).strftime('%Y-%m-%d')
+    slug = next(iter(sa.PROJECTS))
+
+    def nop():
+        pass
+
+    def fresh_index():
+        sa.ARTIFACTS.close()  # each index owns a scan pool; don't let threads pile up
+        sa.ARTIFACTS = sa.ArtifactIndex(sa.ROOT, workers=sa.ARTIFACTS.workers)
+
+    def cold_tails():
+        sa._tails.clear()
+
+    def cold_pages():
+        sa.CACHE.clear()
+        sa._tails.clear()
+
+    def forced_refresh():
+        sa.ARTIFACTS.refresh(force=True)
+        return sa.scan_artifacts()
+
+    brief = sa.parse_brief_md(today) or ''
+    return [
+        ('scan_artifacts.cold', fresh_index, sa.scan_artifacts),
+        ('scan_artifacts.rescan', nop, forced_refresh),
+        ('scan_artifacts.project', nop, lambda: sa.scan_artifacts(sa.PROJECTS[slug]['folder'])),
+        ('artifacts.search', nop, lambda: sa.ARTIFACTS.search('roadmap spec')),
+        ('parse_actions', nop, sa.parse_actions),
+        ('parse_calendar.cold', cold_tails, lambda: sa.parse_calendar(today)),
+        ('parse_calendar.warm', nop, lambda: sa.parse_calendar(today)),
+        ('parse_emails.cold', cold_tails, lambda: sa.parse_emails(today)),
+        ('parse_emails.warm', nop, lambda: sa.parse_emails(today)),
+        ('parse_emails.archived', nop, lambda: sa.parse_emails(old)),
+        ('parse_signal_counts.cold', cold_tails, lambda: sa.parse_signal_counts(today)),
+        ('md_to_html.brief', nop, lambda: sa.md_to_html(brief)),
+        ('render_brief', nop, lambda: sa.render_brief(today)),
+        ('render_home.cold', cold_pages, sa.render_home),
+        ('render_home.warm', nop, sa.render_home),
+        ('render_project', nop, lambda: sa.render_project(slug)),
+        ('render_tools', nop, sa.render_tools),
+    ]
+
+def measure(setup, fn, repeat):
+    """Wall times (ms) over `repeat` calls, then one traced call for the
+    allocation peak (KB) — kept separate so tracing doesn't skew timings."""
+    times = []
+    for _ in range(repeat):
+        setup()
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    setup()
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'min_ms': round(min(times), 3), 'median_ms': round(statistics.median(times), 3),
+        'mean_ms': round(statistics.fmean(times), 3), 'max_ms': round(max(times), 3),
+        'peak_kb': round(peak / 1024, 1), 'runs': repeat,
+    }
+
+def _git_rev():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def run(args):
+    params = {k: getattr(args, k) for k in ('files', 'depth', 'days', 'emails', 'actions', 'repeat', 'seed')}
+    root = tempfile.mkdtemp(prefix='brain-bench-')
+    try:
+        t0 = time.perf_counter()
+        make_workspace(root, args.files, args.depth, args.days, args.emails, args.actions, args.seed)
+        gen_s = time.perf_counter() - t0
+        sa = load_portal(root)
+        sa.STORE.sync()
+        print(f'Workspace: {root} ({args.files} files, depth {args.depth}, {args.days} signal days, '
+              f'{args.emails} emails/day, {args.actions} actions) built in {gen_s:.1f}s\n')
+        print(f'  {"benchmark":<28} {"min ms":>9} {"median ms":>10} {"peak KB":>9}')
+        results = {}
+        only = set(args.only.split(',')) if args.only else None
+        for name, setup, fn in cases(sa):
+            if only and name.split('.')[0] not in only and name not in only:
+                continue
+            r = results[name] = measure(setup, fn, args.repeat)
+            print(f'  {name:<28} {r["min_ms"]:>9.2f} {r["median_ms"]:>10.2f} {r["peak_kb"]:>9.0f}')
+    finally:
+        if args.keep:
+            print(f'\nKept workspace at {root}')
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    doc = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git': _git_rev(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'results': results,
+    }
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, f'portal_{datetime.now():%Y%m%d-%H%M%S}.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(doc, f, indent=2)
+    print(f'\nSaved {path}')
+    return path
+
+def compare(old_path, new_path):
+    """Print median deltas between two saved runs."""
+    with open(old_path, encoding='utf-8') as f:
+        old = json.load(f)
+    with open(new_path, encoding='utf-8') as f:
+        new = json.load(f)
+    if old['params'] != new['params']:
+        print(f'Warning: parameters differ\n  old {old["params"]}\n  new {new["params"]}\n')
+    print(f'  {"benchmark":<28} {"old ms":>9} {"new ms":>9} {"change":>8} {"peak KB":>14}')
+    for name, n in new['results'].items():
+        o = old['results'].get(name)
+        if not o:
+            print(f'  {name:<28} {"—":>9} {n["median_ms"]:>9.2f}')
+            continue
+        pct = (n['median_ms'] - o['median_ms']) / o['median_ms'] * 100 if o['median_ms'] else 0.0
+        mem = f'{o["peak_kb"]:.0f}→{n["peak_kb"]:.0f}'
+        print(f'  {name:<28} {o["median_ms"]:>9.2f} {n["median_ms"]:>9.2f} {pct:>+7.1f}% {mem:>14}')
+
+def main():
+    ap = argparse.ArgumentParser(description='Benchmark the portal against a synthetic workspace.')
+    ap.add_argument('--files', type=int, default=2000, help='artifact files to generate')
+    ap.add_argument('--depth', type=int, default=3, help='directory nesting under each folder')
+    ap.add_argument('--days', type=int, default=14, help='days of signal files and briefs')
+    ap.add_argument('--emails', type=int, default=40, help='emails per day')
+    ap.add_argument('--actions', type=int, default=200, help='rows in Action_Items.md')
+    ap.add_argument('--repeat', type=int, default=5, help='timed runs per benchmark')
+    ap.add_argument('--seed', type=int, default=7, help='workspace generator seed')
+    ap.add_argument('--only', help='comma-separated benchmark names or prefixes (e.g. render_home,parse_emails)')
+    ap.add_argument('--out', default=os.path.join(HERE, '.cache', 'bench'), help='results directory')
+    ap.add_argument('--keep', action='store_true', help='keep the generated workspace')
+    ap.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two saved result files')
+    args = ap.parse_args()
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
 """Convert markdown demo files to self-contained HTML pages for GitHub Pages."""
 import os
 import sys
-import markdown
+
+import md_render
 
 TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -212,7 +213,6 @@ DEMOS = [
 ]
 
 def convert(demos_dir):
-    md_ext = markdown.Markdown(extensions=["tables", "fenced_code", "nl2br"])
     for demo in DEMOS:
         md_path = os.path.join(demos_dir, demo["md"])
         html_path = os.path.join(demos_dir, demo["html"])
@@ -225,12 +225,8 @@ def convert(demos_dir):
         with open(md_path, "r", encoding="utf-8") as f:
             md_content = f.read()
         
-        # Convert checkbox syntax
-        md_content = md_content.replace("- [ ]", "- <input type='checkbox' disabled>")
-        md_content = md_content.replace("- [x]", "- <input type='checkbox' checked disabled>")
-        
-        md_ext.reset()
-        html_body = md_ext.convert(md_content)
+        # Task lists (- [ ] / - [x]) are rendered natively as checkboxes
+        html_body = md_render.render(md_content)
         
         full_html = TEMPLATE.format(
             title=demo["title"],
@@ -0,0 +1,265 @@
+"""
+Brain OS — Markdown renderer
+Single-pass markdown → HTML shared by the portal (serve_artifacts.py) and the
+demo page builder (build_demo_pages.py). Standard library only.
+
+Block rules are one precompiled pattern matched once per line; inline spans
+are one precompiled alternation scanned once per text run. Supports ATX
+headings (with anchors), paragraphs (line breaks kept), nested ordered /
+unordered / task lists, pipe tables, fenced code, blockquotes, horizontal
+rules, and inline code, links, images, bold, italic and strikethrough.
+Raw HTML is escaped.
+"""
+import html as _html
+import re
+
+_BLOCK = re.compile(r'''
+    (?P<fence>\s{0,3}(?P<ticks>`{3,}|~{3,})\s*(?P<lang>[\w+#.-]*).*)
+  | (?P<hr>\s{0,3}(?P<hrc>[-*_])(?:[ \t]*(?P=hrc)){2,}[ \t]*)
+  | (?P<heading>\s{0,3}(?P<hashes>\#{1,6})(?:[ \t]+(?P<htext>.*?))?(?:[ \t]+\#+)?[ \t]*)
+  | (?P<table>\s*\|.*)
+  | (?P<quote>\s{0,3}>[ ]?(?P<qtext>.*))
+  | (?P<item>(?P<indent>[ \t]*)(?P<marker>[-*+]|\d{1,9}[.)])(?:[ \t]+(?P<itext>.*)|[ \t]*))
+  | (?P<blank>\s*)
+''', re.X)
+
+_INLINE = re.compile(r'''(?=[`!\[<*_~])(?:
+    (?P<tick>`+)(?P<code>.+?)(?<!`)(?P=tick)(?!`)
+  | !\[(?P<alt>[^\]]*)\]\((?P<src>[^)\s]+)(?:\s+"[^"]*")?\)
+  | \[(?P<ltext>[^\]]+)\]\((?P<href>[^)\s]+)(?:\s+"[^"]*")?\)
+  | <(?P<auto>https?://[^>\s]+)>
+  | \*\*(?P<b1>\S(?:.*?\S)??)\*\*
+  | (?<!\w)__(?P<b2>\S(?:.*?\S)??)__(?!\w)
+  | ~~(?P<del>\S(?:.*?\S)??)~~
+  | \*(?P<i1>[^*\s](?:.*?[^*\s])??)\*
+  | (?<!\w)_(?P<i2>[^_\s](?:.*?[^_\s])??)_(?!\w)
+)''', re.X)
+_INLINE_CHARS = re.compile(r'[`!\[<*_~]')
+
+_CELL_SPLIT = re.compile(r'(?<!\\)\|')
+_SEPARATOR = re.compile(r'^\s*:?-+:?\s*$')
+_TASK = re.compile(r'^\[([ xX])\]\s+')
+_SLUG_DROP = re.compile(r'[^\w\s-]')
+_SLUG_SPACE = re.compile(r'\s+')
+_UNSAFE_URL = re.compile(r'^\s*(javascript|vbscript|data):', re.I)
+
+
+def esc(s):
+    return _html.escape(s)
+
+
+def slug(text):
+    """GitHub-style heading anchor."""
+    return _SLUG_SPACE.sub('-', _SLUG_DROP.sub('', text.strip().lower()))
+
+
+def _url(u):
+    return '#' if _UNSAFE_URL.match(u) else esc(u)
+
+
+def inline(text):
+    """Render inline spans in one left-to-right scan."""
+    if not _INLINE_CHARS.search(text):
+        return esc(text)
+    out = []
+    pos = 0
+    for m in _INLINE.finditer(text):
+        if m.start() > pos:
+            out.append(esc(text[pos:m.start()]))
+        pos = m.end()
+        g = m.group
+        if g('tick'):
+            out.append(f'<code>{esc(g("code").strip())}</code>')
+        elif g('src') is not None:
+            out.append(f'<img src="{_url(g("src"))}" alt="{esc(g("alt"))}">')
+        elif g('href') is not None:
+            out.append(f'<a href="{_url(g("href"))}">{inline(g("ltext"))}</a>')
+        elif g('auto'):
+            out.append(f'<a href="{_url(g("auto"))}">{esc(g("auto"))}</a>')
+        elif g('b1') is not None or g('b2') is not None:
+            out.append(f'<strong>{inline(g("b1") or g("b2"))}</strong>')
+        elif g('del') is not None:
+            out.append(f'<del>{inline(g("del"))}</del>')
+        else:
+            out.append(f'<em>{inline(g("i1") or g("i2"))}</em>')
+    if pos < len(text):
+        out.append(esc(text[pos:]))
+    return ''.join(out)
+
+
+def _cells(line):
+    s = line.strip()
+    if s.startswith('|'):
+        s = s[1:]
+    if s.endswith('|') and not s.endswith('\\|'):
+        s = s[:-1]
+    return [c.strip().replace('\\|', '|') for c in _CELL_SPLIT.split(s)]
+
+
+class _Renderer:
+    """Line-driven block state machine; each line is classified once."""
+
+    def __init__(self):
+        self.out = []
+        self.para = []
+        self.quote = []
+        self.table = []
+        self.lists = []       # [(tag, indent)] — innermost last, its <li> still open
+        self.fence = None     # closing fence marker while inside a code block
+        self.code = []
+        self.slugs = {}
+        self.blank = False    # previous line was blank
+
+    # ── closers ──
+    def close_para(self):
+        if self.para:
+            self.out.append('<p>' + '<br>\n'.join(inline(t) for t in self.para) + '</p>')
+            self.para = []
+
+    def close_quote(self):
+        if self.quote:
+            self.out.append('<blockquote><p>' + '<br>\n'.join(inline(t) for t in self.quote if t)
+                            + '</p></blockquote>')
+            self.quote = []
+
+    def close_table(self):
+        rows = self.table
+        if not rows:
+            return
+        self.table = []
+        align = []
+        head = _cells(rows[0])
+        body = rows[1:]
+        if body and all(_SEPARATOR.match(c) for c in _cells(body[0]) if c.strip()):
+            for c in _cells(body[0]):
+                c = c.strip()
+                align.append('center' if c.startswith(':') and c.endswith(':') else
+                             'right' if c.endswith(':') else 'left' if c.startswith(':') else None)
+            body = body[1:]
+
+        def row(cells, tag):
+            parts = []
+            for i, c in enumerate(cells):
+                a = align[i] if i < len(align) else None
+                attr = f' style="text-align:{a}"' if a else ''
+                parts.append(f'<{tag}{attr}>{inline(c)}</{tag}>')
+            return '<tr>' + ''.join(parts) + '</tr>'
+
+        out = ['<table>', '<thead>' + row(head, 'th') + '</thead>']
+        if body:
+            out.append('<tbody>')
+            out.extend(row(_cells(r), 'td') for r in body)
+            out.append('</tbody>')
+        out.append('</table>')
+        self.out.append('\n'.join(out))
+
+    def close_code(self):
+        self.out.append(self.code[0] + '\n'.join(self.code[1:]) + '</code></pre>')
+        self.code = []
+        self.fence = None
+
+    def close_lists(self, indent=-1):
+        """Close lists nested deeper than `indent` (all of them by default)."""
+        while self.lists and self.lists[-1][1] > indent:
+            self.out[-1] += f'</li></{self.lists.pop()[0]}>'
+
+    def close_blocks(self, keep_lists=False):
+        self.close_para()
+        self.close_quote()
+        self.close_table()
+        if not keep_lists:
+            self.close_lists()
+
+    # ── blocks ──
+    def heading(self, level, text):
+        base = slug(text) or 'section'
+        n = self.slugs.get(base, 0)
+        self.slugs[base] = n + 1
+        anchor = base if n == 0 else f'{base}-{n}'
+        self.out.append(f'<h{level} id="{anchor}">{inline(text)}</h{level}>')
+
+    def item(self, indent, marker, text):
+        tag = 'ol' if marker[0].isdigit() else 'ul'
+        self.close_lists(indent)
+        top = self.lists[-1] if self.lists else None
+        if top and top[1] == indent and top[0] == tag:
+            self.out[-1] += '</li>'
+        else:
+            if top and top[1] == indent:
+                self.out[-1] += f'</li></{self.lists.pop()[0]}>'
+            start = marker[:-1] if tag == 'ol' and marker[:-1] != '1' else None
+            self.out.append(f'<{tag} start="{start}">' if start else f'<{tag}>')
+            self.lists.append((tag, indent))
+        t = _TASK.match(text)
+        if t:
+            box = ' checked' if t.group(1) in 'xX' else ''
+            text = text[t.end():]
+            self.out.append(f'<li><input type="checkbox"{box} disabled> {inline(text)}')
+        else:
+            self.out.append(f'<li>{inline(text)}')
+
+    def feed(self, line):
+        if self.fence is not None:
+            if line.strip().startswith(self.fence) and not line.strip().strip(self.fence[0]):
+                self.close_code()
+            else:
+                self.code.append(esc(line))
+            return
+        m = _BLOCK.fullmatch(line)
+        kind = m.lastgroup if m else None
+        if m and m.group('fence') is not None:
+            kind = 'fence'
+        after_blank, self.blank = self.blank, kind == 'blank'
+        if kind == 'fence':
+            self.close_blocks()
+            self.fence = m.group('ticks')
+            lang = m.group('lang')
+            self.code = [f'<pre><code class="language-{esc(lang)}">' if lang else '<pre><code>']
+        elif kind == 'blank':
+            self.close_para()
+            self.close_quote()
+            self.close_table()
+        elif kind == 'hr':
+            self.close_blocks()
+            self.out.append('<hr>')
+        elif m and m.group('heading') is not None:
+            self.close_blocks()
+            self.heading(len(m.group('hashes')), m.group('htext') or '')
+        elif kind == 'table':
+            if not self.table:
+                self.close_blocks()
+            self.table.append(line)
+        elif m and m.group('quote') is not None:
+            if not self.quote:
+                self.close_blocks()
+            self.quote.append(m.group('qtext').strip())
+        elif m and m.group('item') is not None:
+            self.close_blocks(keep_lists=True)
+            indent = len(m.group('indent').expandtabs(4))
+            self.item(indent, m.group('marker'), m.group('itext') or '')
+        else:
+            text = line.strip()
+            if (self.lists and not self.para and not self.quote and not self.table
+                    and not (after_blank and line[:1] not in (' ', '\t'))):
+                # Lazy continuation of the open list item; unindented text
+                # after a blank line starts a paragraph outside the list
+                self.out[-1] += '<br>\n' + inline(text)
+                return
+            self.close_quote()
+            self.close_table()
+            self.close_lists()
+            self.para.append(text)
+
+    def finish(self):
+        if self.fence is not None:
+            self.close_code()
+        self.close_blocks()
+        return '\n'.join(self.out)
+
+
+def render(md):
+    """Markdown text → HTML fragment."""
+    r = _Renderer()
+    for line in md.split('\n'):
+        r.feed(line.rstrip('\r'))
+    return r.finish()
@@ -4,11 +4,17 @@ A one-page command center for your daily PM operating system.
 Run: python serve_artifacts.py → http://localhost:8765
 """
 import http.server, os, re, json, html as html_mod
-import urllib.parse, subprocess, time as _time
-import threading
+import urllib.parse, subprocess, time as _time, base64, email.utils
+import threading, bisect, heapq, itertools, hashlib, queue, zlib, zipfile, math
+import multiprocessing, collections, sys, functools, copy, sqlite3
+import concurrent.futures
+import cProfile, pstats, io, signal, gzip, mmap, struct, gc
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import md_render
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIG
 # ═══════════════════════════════════════════════════════════════════════════
@@ -17,6 +23,9 @@ ROOT = str(Path(__file__).resolve().parent.parent)
 AUTO = os.path.join(ROOT, "_Automation")
 SIG  = os.path.join(ROOT, "00_Daily_Intelligence", "Signals")
 KB   = os.path.join(ROOT, "00_Daily_Intelligence", "Knowledge_Base")
+BRIEFS = os.path.join(ROOT, "00_Daily_Intelligence", "Daily_Briefs")
+ARCHIVE = os.path.join(ROOT, "08_Archive")
+CACHE_DIR = os.path.join(AUTO, ".cache")
 
 _CONFIG_PATH = os.path.join(AUTO, "config.json")
 def _load_config():
@@ -31,6 +40,7 @@ PORTAL_NAME = _CFG.get('branding', {}).get('portal_name', 'Brain')
 PORTAL_SUBTITLE = _CFG.get('branding', {}).get('portal_subtitle', 'Daily OS')
 PM_NAME = _CFG.get('pm_identity', {}).get('name', 'PM')
 TEAM_MEMBERS = _CFG.get('team_members', [])
+PORTAL_CFG = _CFG.get('portal', {})
 
 # Build projects from config
 def _build_projects(cfg):
@@ -48,26 +58,352 @@ def _build_projects(cfg):
         }
     return projects
 
-CHARTER_RE = [(cp['label'], cp['regex']) for cp in _CFG.get('charter_patterns', [])]
+def _charter_patterns(cfg):
+    """(label, regex) pairs from config; entries give either label/regex or
+    name/keywords (matched as whole words)."""
+    pats = []
+    for cp in cfg.get('charter_patterns', []):
+        label = cp.get('label') or cp.get('name')
+        regex = cp.get('regex') or '|'.join(rf'\b{re.escape(k)}\b' for k in cp.get('keywords', []))
+        if label and regex:
+            pats.append((label, regex))
+    return pats
+
+CHARTER_RE = _charter_patterns(_CFG)
 PROJECTS = _build_projects(_CFG)
 
 EXTS = {'.docx','.doc','.pptx','.ppt','.xlsx','.xls','.pdf','.html','.md','.png','.jpg','.jpeg','.gif','.mp4'}
-SKIP = {'.venv','.git','node_modules','__pycache__','.vscode','.claude'}
+SKIP = {'.venv','.git','node_modules','__pycache__','.vscode','.claude','.cache'}  # .cache: the portal's own render/text caches
 ALL_FOLDERS = {p['folder'] for p in PROJECTS.values()} | {'00_Daily_Intelligence','08_Archive','_Automation'}
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CACHE
 # ═══════════════════════════════════════════════════════════════════════════
-_cache = {}
-_cache_lock = threading.Lock()
-def _cached(key, fn, ttl=60):
-    with _cache_lock:
-        if key in _cache and (_time.time() - _cache[key][0]) < ttl:
-            return _cache[key][1]
-    result = fn()
-    with _cache_lock:
-        _cache[key] = (_time.time(), result)
-    return result
+def _approx_size(obj, depth=0):
+    """Rough deep size of parsed data (dicts/lists/strings), in bytes."""
+    size = sys.getsizeof(obj)
+    if depth > 6:
+        return size
+    if isinstance(obj, dict):
+        size += sum(_approx_size(k, depth + 1) + _approx_size(v, depth + 1) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_approx_size(v, depth + 1) for v in obj)
+    return size
+
+class Cache:
+    """LRU cache with single-flight fills, stale-while-revalidate and tags.
+
+    Concurrent misses on one key share a single computation. Past its TTL an
+    entry keeps being served while one background refresh replaces it.
+    Entries carry tags so a change drops only what derives from it, and the
+    cache is bounded by entry count and approximate memory.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.stats = {}       # key → {hit, miss, stale, refresh, evict}
+        self._entries = collections.OrderedDict()  # key → [stored_at, value, tags, size, refreshing]
+        self._inflight = {}   # key → (Event, tags, box)
+        self._epoch = {}      # key → bumped on invalidation; stale fills are discarded
+        self._lock = threading.Lock()
+
+    def _count(self, key, what):
+        st = self.stats.get(key)
+        if st is None:
+            st = self.stats[key] = {'hit': 0, 'miss': 0, 'stale': 0, 'refresh': 0, 'evict': 0}
+        st[what] += 1
+
+    def get(self, key, fn, ttl=60, tags=()):
+        with self._lock:
+            e = self._entries.get(key)
+            if e is not None:
+                self._entries.move_to_end(key)
+                if _time.time() - e[0] < ttl:
+                    self._count(key, 'hit')
+                    return e[1]
+                self._count(key, 'stale')
+                if not e[4]:
+                    e[4] = True
+                    threading.Thread(target=self._fill, args=(key, fn, tags, self._epoch.get(key, 0)),
+                                     name=f'cache-refresh-{key}', daemon=True).start()
+                return e[1]
+            flight = self._inflight.get(key)
+            if flight is None:
+                self._count(key, 'miss')
+                flight = self._inflight[key] = (threading.Event(), tuple(tags), {})
+                epoch = self._epoch.get(key, 0)
+                owner = True
+            else:
+                owner = False
+        if owner:
+            self._fill(key, fn, tags, epoch, flight)
+        else:
+            flight[0].wait()
+        box = flight[2]
+        if 'error' in box:
+            raise box['error']
+        return box['value']
+
+    def _fill(self, key, fn, tags, epoch, flight=None):
+        box = flight[2] if flight else {}
+        try:
+            box['value'] = value = fn()
+        except Exception as e:
+            box['error'] = e
+            with self._lock:
+                e_ = self._entries.get(key)
+                if e_ is not None:
+                    e_[4] = False
+        else:
+            size = _approx_size(value)
+            with self._lock:
+                if flight is None:
+                    self._count(key, 'refresh')
+                if self._epoch.get(key, 0) == epoch:
+                    self._store(key, value, tags, size)
+                else:
+                    e_ = self._entries.get(key)
+                    if e_ is not None:
+                        e_[4] = False
+        finally:
+            if flight:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                flight[0].set()
+
+    def _store(self, key, value, tags, size):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[3]
+        self._entries[key] = [_time.time(), value, frozenset(tags), size, False]
+        self.bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+            k, e = self._entries.popitem(last=False)
+            self.bytes -= e[3]
+            self._count(k, 'evict')
+
+    def invalidate(self, keys=(), tags=()):
+        """Drop entries by key and/or tag; in-flight fills for them are discarded."""
+        keys, tags = set(keys), set(tags)
+        with self._lock:
+            hit = {k for k, e in self._entries.items() if k in keys or e[2] & tags}
+            hit |= {k for k, f in self._inflight.items() if k in keys or tags.intersection(f[1])}
+            hit |= keys
+            for k in hit:
+                self._epoch[k] = self._epoch.get(k, 0) + 1
+                e = self._entries.pop(k, None)
+                if e is not None:
+                    self.bytes -= e[3]
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries) + list(self._inflight)
+        self.invalidate(keys)
+
+    def snapshot(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.bytes,
+                    'max_entries': self.max_entries, 'max_bytes': self.max_bytes,
+                    'keys': {k: dict(v) for k, v in self.stats.items()}}
+
+CACHE = Cache(max_entries=PORTAL_CFG.get('cache_max_entries', 256),
+              max_bytes=PORTAL_CFG.get('cache_max_mb', 64) * 1024 * 1024)
+WATCH_TTL = 3600  # safety net while the watcher invalidates entries precisely
+
+def _cached(key, fn, ttl=60, tags=()):
+    if WATCHER.active:
+        ttl = max(ttl, WATCH_TTL)
+    return CACHE.get(key, fn, ttl, tags)
+
+def _invalidate(keys=(), tags=()):
+    """Drop specific cache entries."""
+    CACHE.invalidate(keys, tags)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TIMING & METRICS — Server-Timing stage timers and Prometheus /metrics
+# ═══════════════════════════════════════════════════════════════════════════
+SERVER_TIMING = PORTAL_CFG.get('server_timing', True)
+ACCESS_LOG = PORTAL_CFG.get('access_log', False)
+PROFILE_ENDPOINT = PORTAL_CFG.get('profile_endpoint', False)
+
+_timing = threading.local()
+
+class _Stage:
+    __slots__ = ('stages', 'name', 't0')
+
+    def __init__(self, stages, name):
+        self.stages, self.name = stages, name
+
+    def __enter__(self):
+        self.t0 = _time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stages.append((self.name, _time.perf_counter() - self.t0))
+        return False
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_STAGE = _NoStage()
+
+def stage(name):
+    """`with stage('name'):` times a block of the request on this thread.
+    Outside a timed request it is a shared no-op."""
+    stages = getattr(_timing, 'stages', None)
+    return _NO_STAGE if stages is None else _Stage(stages, name)
+
+def timing_begin():
+    _timing.stages = []
+    _timing.t0 = _time.perf_counter()
+
+def timing_end():
+    """Stop timing this thread's request → total seconds (None if untimed)."""
+    if getattr(_timing, 'stages', None) is None:
+        return None
+    _timing.stages = None
+    return _time.perf_counter() - _timing.t0
+
+def timing_header():
+    """Server-Timing value for the request so far; repeated stages are summed."""
+    stages = getattr(_timing, 'stages', None)
+    if stages is None:
+        return None
+    totals = {}
+    for name, dur in stages:
+        totals[name] = totals.get(name, 0.0) + dur
+    totals['total'] = _time.perf_counter() - _timing.t0
+    return ', '.join(f'{name};dur={dur * 1000:.2f}' for name, dur in totals.items())
+
+# ───────────────────────────────────────────────────────────────────────────
+# Metrics — counters, histograms and gauges in Prometheus text format
+# ───────────────────────────────────────────────────────────────────────────
+METRICS_ENABLED = PORTAL_CFG.get('metrics', True)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _label(v):
+    return str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(**kv):
+    return '{' + ','.join(f'{k}="{_label(v)}"' for k, v in kv.items()) + '}'
+
+class _Histogram:
+    __slots__ = ('counts', 'sum', 'n')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.n = 0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.n += 1
+
+    def lines(self, name, **labels):
+        acc = 0
+        for le, c in zip(LATENCY_BUCKETS + ('+Inf',), self.counts):
+            acc += c
+            yield f'{name}_bucket{_labels(**labels, le=le)} {acc}'
+        lb = _labels(**labels) if labels else ''
+        yield f'{name}_sum{lb} {self.sum:.6f}'
+        yield f'{name}_count{lb} {self.n}'
+
+class Metrics:
+    """Portal metrics for a Prometheus scrape of /metrics.
+
+    Requests are counted per (route, status) with a latency histogram per
+    route; routes are normalised so label cardinality stays bounded. Gauges
+    are callbacks evaluated at scrape time.
+    """
+
+    ROUTES = ('/', '/brief', '/tools', '/jobs', '/events', '/fragment/brief',
+              '/api/search', '/api/search/content', '/api/signals', '/api/signals/counts',
+              '/api/cache', '/api/kb/search', '/api/files', '/api/jobs', '/api/home', '/api/calendar',
+              '/api/actions', '/api/emails', '/open', '/action', '/metrics', '/debug/profile')
+    PREFIXES = ('/project/', '/jobs/', '/api/jobs/', '/fragment/home/', '/api/v1/', '/static/', '/file/')  # reported as e.g. /project/*
+
+    def __init__(self):
+        self.started = _time.time()
+        self._requests = collections.Counter()  # (route, code) → n
+        self._latency = {}                      # route → _Histogram
+        self._scan = _Histogram()
+        self._gauges = []                       # (name, help, fn)
+        self._lock = threading.Lock()
+
+    def route(self, target):
+        path = urllib.parse.urlsplit(target).path.rstrip('/') or '/'
+        for prefix in self.PREFIXES:
+            if path.startswith(prefix):
+                return prefix + '*'
+        return path if path in self.ROUTES else 'other'
+
+    def observe_request(self, target, code, seconds):
+        route = self.route(target)
+        with self._lock:
+            self._requests[(route, str(code))] += 1
+            h = self._latency.get(route)
+            if h is None:
+                h = self._latency[route] = _Histogram()
+            h.observe(seconds)
+
+    def observe_scan(self, seconds):
+        with self._lock:
+            self._scan.observe(seconds)
+
+    def gauge(self, name, help_text, fn):
+        self._gauges.append((name, help_text, fn))
+
+    def render(self):
+        out = []
+
+        def head(name, kind, help_text):
+            out.append(f'# HELP {name} {help_text}')
+            out.append(f'# TYPE {name} {kind}')
+
+        with self._lock:
+            head('brain_http_requests_total', 'counter', 'HTTP requests by route and status code.')
+            out.extend(f'brain_http_requests_total{_labels(route=r, code=c)} {n}'
+                       for (r, c), n in sorted(self._requests.items()))
+            head('brain_http_request_duration_seconds', 'histogram', 'Request latency by route.')
+            for r, h in sorted(self._latency.items()):
+                out.extend(h.lines('brain_http_request_duration_seconds', route=r))
+            head('brain_artifact_scan_duration_seconds', 'histogram', 'Duration of artifact index refreshes that walked the tree.')
+            out.extend(self._scan.lines('brain_artifact_scan_duration_seconds'))
+
+        snap = CACHE.snapshot()
+        head('brain_cache_requests_total', 'counter', 'Cache lookups per key by result (hit, miss, stale).')
+        for key, st in sorted(snap['keys'].items()):
+            out.extend(f'brain_cache_requests_total{_labels(key=key, result=res)} {st[res]}'
+                       for res in ('hit', 'miss', 'stale'))
+        head('brain_cache_evictions_total', 'counter', 'Cache evictions per key.')
+        out.extend(f'brain_cache_evictions_total{_labels(key=key)} {st["evict"]}'
+                   for key, st in sorted(snap['keys'].items()))
+        head('brain_cache_entries', 'gauge', 'Entries held in the page data cache.')
+        out.append(f'brain_cache_entries {snap["entries"]}')
+        head('brain_cache_bytes', 'gauge', 'Approximate size of the page data cache.')
+        out.append(f'brain_cache_bytes {snap["bytes"]}')
+
+        for name, help_text, fn in self._gauges:
+            try:
+                value = fn()
+            except Exception:
+                continue
+            head(name, 'gauge', help_text)
+            out.append(f'{name} {value}')
+        head('brain_uptime_seconds', 'gauge', 'Seconds since the portal started.')
+        out.append(f'brain_uptime_seconds {_time.time() - self.started:.0f}')
+        return '\n'.join(out) + '\n'
+
+METRICS = Metrics()
 
 # ═══════════════════════════════════════════════════════════════════════════
 # HELPERS
@@ -75,11 +411,52 @@ def _cached(key, fn, ttl=60):
 def esc(s):
     return html_mod.escape(str(s))
 
+class CharterClassifier:
+    """First-match charter classification with one compiled regex call per text.
+
+    Every pattern becomes a lookahead alternative `(?=[\s\S]*?(?:pat))` tried
+    in config order at position 0, so the first pattern that matches anywhere
+    wins, exactly like calling re.search on each in turn. Patterns that can't
+    be combined (backreferences, inline flags) fall back to a compiled loop.
+    Results are memoized per distinct text.
+    """
+
+    def __init__(self, patterns, memo=8192):
+        self.labels = [label for label, _ in patterns]
+        self._each = [re.compile(pat, re.I) for _, pat in patterns]
+        self._combined = None
+        if patterns and not any(re.search(r'\\[1-9]|\(\?P=', pat) for _, pat in patterns):
+            alts = '|'.join(f'(?=[\\s\\S]*?(?:{pat}))(?P<_charter{i}>)'
+                            for i, (_, pat) in enumerate(patterns))
+            try:
+                self._combined = re.compile(alts, re.I)
+            except re.error:
+                pass
+        self.classify = functools.lru_cache(maxsize=memo)(self._classify)
+
+    def _classify(self, text):
+        if self._combined is not None:
+            m = self._combined.match(text)
+            if not m:
+                return None
+            name = m.lastgroup
+            if not (name or '').startswith('_charter'):
+                name = next(k for k, v in m.groupdict().items() if k.startswith('_charter') and v is not None)
+            return self.labels[int(name[8:])]
+        for label, rx in zip(self.labels, self._each):
+            if rx.search(text):
+                return label
+        return None
+
+    def classify_many(self, texts):
+        """Classify a batch; each distinct text is matched once."""
+        seen = {}
+        return [seen[t] if t in seen else seen.setdefault(t, self.classify(t)) for t in texts]
+
+CHARTERS = CharterClassifier(CHARTER_RE)
+
 def charter_of(text):
-    for name, pat in CHARTER_RE:
-        if re.search(pat, text, re.I):
-            return name
-    return None
+    return CHARTERS.classify(text)
 
 _FABRIC_CDN = 'https://res-1.cdn.office.net/files/fabric-cdn-prod_20251008.001/assets/item-types/48'
 _FTYPE_MAP = {
@@ -129,35 +506,645 @@ def icon(name, size=16):
 # DATA PARSERS
 # ═══════════════════════════════════════════════════════════════════════════
 
-def scan_artifacts(folder=None):
-    """Scan workspace for document artifacts."""
-    arts = []
-    for r, dirs, files in os.walk(ROOT):
-        dirs[:] = [d for d in dirs if d not in SKIP]
-        for f in files:
-            ext = Path(f).suffix.lower()
-            if ext not in EXTS:
-                continue
-            fp = os.path.join(r, f)
-            rel = os.path.relpath(fp, ROOT).replace('\\', '/')
-            if folder and not rel.startswith(folder):
-                continue
-            parts = rel.split('/')
-            cat = parts[0] if parts[0] in ALL_FOLDERS else None
+class TrigramIndex:
+    """Trigram inverted index over artifact paths for fuzzy, typo-tolerant search.
+
+    Exact substring hits are found by intersecting postings, rarest first;
+    fuzzy hits only need to share most trigrams with the query, so one typo
+    in a longer query still matches. Queries touch postings, never the full
+    artifact list.
+    """
+
+    def __init__(self):
+        self._post = {}   # trigram → {path}
+
+    @staticmethod
+    def grams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, path):
+        for g in self.grams(path.lower()):
+            self._post.setdefault(g, set()).add(path)
+
+    def remove(self, path):
+        for g in self.grams(path.lower()):
+            ps = self._post.get(g)
+            if ps is not None:
+                ps.discard(path)
+                if not ps:
+                    del self._post[g]
+
+    def candidates(self, q):
+        """→ {path: fraction of query trigrams matched} for plausible matches."""
+        qg = sorted(self.grams(q), key=lambda g: len(self._post.get(g, ())))
+        if not qg:
+            return {}
+        typos = 0 if len(q) < 5 else 1 if len(q) < 9 else 2
+        need = max(1, len(qg) - 3 * typos, -(-len(qg) // 3))
+        # Pigeonhole: any doc with `need` hits holds one of the rarest n-need+1 grams
+        pool = set()
+        for g in qg[:len(qg) - need + 1]:
+            pool |= self._post.get(g, set())
+        out = {}
+        posts = [self._post.get(g, set()) for g in qg]
+        for p in pool:
+            hits = sum(1 for ps in posts if p in ps)
+            if hits >= need:
+                out[p] = hits / len(qg)
+        return out
+
+_EXT_NAMES = tuple(sorted(EXTS))
+_EXT_IDS = {e: i for i, e in enumerate(_EXT_NAMES)}
+_EXT_ICONS = tuple(file_icon(e) for e in _EXT_NAMES)
+_CAT_PREFIXES = tuple(sorted((f + '/', f) for f in ALL_FOLDERS))
+
+class Artifact:
+    """One indexed file. Only raw facts are stored (the extension as an id
+    into _EXT_NAMES); display strings are formatted on access, so only for
+    the rows a page actually renders. Sorts newest first, then by path."""
+
+    __slots__ = ('path', 'ts', 'bytes', 'ext_id')
+
+    def __init__(self, path, ts, nbytes, ext_id):
+        self.path = path
+        self.ts = ts
+        self.bytes = nbytes
+        self.ext_id = ext_id
+
+    def __lt__(self, other):
+        return self.ts > other.ts or (self.ts == other.ts and self.path < other.path)
+
+    def __repr__(self):
+        return f'Artifact({self.path!r})'
+
+    @property
+    def name(self):
+        return self.path.rpartition('/')[2]
+
+    @property
+    def ext(self):
+        return _EXT_NAMES[self.ext_id]
+
+    @property
+    def icon(self):
+        return _EXT_ICONS[self.ext_id]
+
+    @property
+    def cat(self):
+        """The top-level workspace folder (ALL_FOLDERS) holding the file."""
+        for prefix, folder in _CAT_PREFIXES:
+            if self.path.startswith(prefix):
+                return folder
+        return None
+
+    @property
+    def modified(self):
+        return datetime.fromtimestamp(self.ts).strftime('%Y-%m-%d %H:%M')
+
+    @property
+    def size(self):
+        kb = self.bytes / 1024
+        return f"{kb:.0f} KB" if kb < 1024 else f"{kb / 1024:.1f} MB"
+
+    def to_dict(self):
+        return {'name': self.name, 'path': self.path, 'ext': self.ext, 'cat': self.cat,
+                'bytes': self.bytes, 'size': self.size, 'ts': self.ts,
+                'modified': self.modified, 'icon': self.icon}
+
+class ArtifactView:
+    """Newest-first artifacts, all or under one folder, without copying: it
+    walks an index snapshot (never mutated once published) and slicing stops
+    as soon as enough rows have matched."""
+
+    __slots__ = ('_order', '_prefix', '_len')
+
+    def __init__(self, order, folder=None):
+        self._order = order
+        self._prefix = folder.rstrip('/') + '/' if folder else None
+        self._len = None
+
+    def __iter__(self):
+        if self._prefix is None:
+            return iter(self._order)
+        prefix = self._prefix
+        return (a for a in self._order if a.path.startswith(prefix))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            if self._prefix is None:
+                return self._order[i]
+            return list(itertools.islice(self, i.start, i.stop, i.step))
+        if self._prefix is None:
+            return self._order[i]
+        for a in itertools.islice(self, i, None):
+            return a
+        raise IndexError(i)
+
+    def __len__(self):
+        if self._len is None:
+            self._len = len(self._order) if self._prefix is None else sum(1 for _ in self)
+        return self._len
+
+    def __bool__(self):
+        return next(iter(self), None) is not None
+
+class ArtifactIndex:
+    """Persistent in-memory index of workspace artifacts.
+
+    A refresh stats every directory but only re-lists the ones whose mtime
+    moved (entries added, removed or renamed), so an unchanged workspace costs
+    one stat per directory instead of one per file. Artifacts are kept sorted
+    newest-first; small change sets are bisected in, large ones re-sorted.
+
+    Directories are visited on a pool of `workers` threads, each stat and
+    listing running in parallel; on synced or network drives (OneDrive, SMB)
+    that overlaps the round trips instead of paying them one after another.
+
+    start() loads the snapshot save() wrote on the last run, so pages are
+    served from it at once, and reconciles it with the disk in the background.
+    A file edited in place leaves its dir's mtime alone, so outside the
+    watched roots (which mark_dirty) it is picked up by the background
+    re-stat of every file each `restat` seconds.
+    """
+
+    # Snapshot layout: header, dir records, file records (newest first), then
+    # one UTF-8 text blob that records point into by character offset.
+    SNAP_MAGIC = b'BRAINIX1'
+    _SNAP_HEAD = struct.Struct('<8sIII')   # magic, meta length, dirs, files
+    _SNAP_DIR = struct.Struct('<qiII')     # mtime_ns, parent index, rel offset, length
+    _SNAP_FILE = struct.Struct('<dqIIIH')  # ts, bytes, dir index, name offset, length, ext id
+
+    def __init__(self, root, min_interval=30, workers=1):
+        self.root = root
+        self.min_interval = min_interval
+        self.workers = max(1, workers)
+        self._pool = None
+        self._started = False
+        self.snapshot_path = None  # where save() writes, set by start()
+        self._saved = 0       # version of the last snapshot
+        self.version = 0
+        self._dirs = {}      # rel dir → (mtime_ns, [sub dir rels], {name: Artifact})
+        self._order = []     # [Artifact] newest first; replaced, never mutated (see ArtifactView)
+        self._by_path = {}   # path → Artifact
+        self._grams = TrigramIndex()  # None until built when loaded from a snapshot
+        self.listeners = []  # fn(added, removed), called under the index lock
+        self._refreshed = 0
+        self._dirty = set()  # dirs the watcher saw change; relisted on next refresh
+        self._lock = threading.RLock()        # entries, order, grams
+        self._scan_lock = threading.Lock()    # one scan at a time; guards _dirs
+
+    def _list_dir(self, rel, full, old_files):
+        """Re-list one directory → (sub dir rels, {name: artifact})."""
+        subdirs, files = [], {}
+        try:
+            it = os.scandir(full)
+        except OSError:
+            return subdirs, files
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if e.name not in SKIP:
+                            subdirs.append(f'{rel}/{e.name}' if rel else e.name)
+                        continue
+                    ext = os.path.splitext(e.name)[1].lower()
+                    if ext not in EXTS:
+                        continue
+                    st = e.stat()
+                except OSError:
+                    continue
+                old = old_files.get(e.name)
+                if old is not None and old.ts == st.st_mtime and old.bytes == st.st_size:
+                    files[e.name] = old
+                else:
+                    frel = f'{rel}/{e.name}' if rel else e.name
+                    files[e.name] = Artifact(frel, st.st_mtime, st.st_size, _EXT_IDS[ext])
+        return subdirs, files
+
+    def _visit(self, rel, dirty):
+        """Stat one directory and re-list it if it changed → (rel, entry);
+        entry is the known one when unchanged, None if the dir is gone."""
+        full = os.path.join(self.root, rel) if rel else self.root
+        try:
+            mtime = os.stat(full).st_mtime_ns
+        except OSError:
+            return rel, None
+        known = self._dirs.get(rel)
+        if known and known[0] == mtime and rel not in dirty:
+            return rel, known
+        subdirs, files = self._list_dir(rel, full, known[2] if known else {})
+        return rel, (mtime, subdirs, files)
+
+    def _walk(self, dirty):
+        """Visit every directory, fanning subdirectories out over the pool as
+        their parents are listed; yields (rel, entry) in completion order."""
+        if self.workers == 1:
+            stack = ['']
+            while stack:
+                rel, entry = self._visit(stack.pop(), dirty)
+                if entry:
+                    stack.extend(entry[1])
+                yield rel, entry
+            return
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(self.workers, thread_name_prefix='brain-scan')
+        pending = {self._pool.submit(self._visit, '', dirty)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for f in done:
+                rel, entry = f.result()
+                if entry:
+                    pending.update(self._pool.submit(self._visit, sub, dirty) for sub in entry[1])
+                yield rel, entry
+
+    def _due(self, force):
+        return force or self._dirty or _time.time() - self._refreshed >= self.min_interval
+
+    def refresh(self, force=False):
+        """Bring the index up to date; throttled to once per min_interval.
+        While another thread scans, callers keep the current entries rather
+        than wait — unless there are none yet or `force` is set."""
+        if not self._due(force):
+            return
+        if not self._scan_lock.acquire(blocking=force or not self._by_path):
+            return
+        try:
+            if not self._due(force):
+                return  # a scan finished while we waited
+            t0 = _time.perf_counter()
+            with self._lock:
+                dirty, self._dirty = self._dirty, set()
+            added, removed = [], []
+            seen = set()
+            for rel, entry in self._walk(dirty):
+                if entry is None:
+                    continue
+                seen.add(rel)
+                known = self._dirs.get(rel)
+                if entry is known:
+                    continue
+                old_files = known[2] if known else {}
+                files = entry[2]
+                for name, a in old_files.items():
+                    if files.get(name) is not a:
+                        removed.append(a)
+                for name, a in files.items():
+                    if old_files.get(name) is not a:
+                        added.append(a)
+                self._dirs[rel] = entry
+            for rel in [d for d in self._dirs if d not in seen]:
+                removed.extend(self._dirs.pop(rel)[2].values())
+            if added or removed:
+                with self._lock:
+                    self._apply(added, removed)
+            self._refreshed = _time.time()
+            METRICS.observe_scan(_time.perf_counter() - t0)
+        finally:
+            self._scan_lock.release()
+
+    # ── snapshot ──
+    def start(self, snapshot=None, interval=300, restat=300):
+        """Serve `snapshot` (if there is one) right away, then reconcile it in
+        the background, re-save it every `interval` seconds when changed and
+        re-stat every file every `restat` seconds. Returns whether a snapshot
+        was loaded."""
+        if self._started:
+            return False
+        self._started = True
+        self.snapshot_path = snapshot
+        loaded = bool(snapshot) and self.load(snapshot)
+        threading.Thread(target=self._maintain, args=(loaded, interval, restat),
+                         name='brain-index', daemon=True).start()
+        return loaded
+
+    def _maintain(self, loaded, interval, restat):
+        try:
+            self.refresh(force=True)  # entries added/removed while we were down (dir mtimes)
+            if loaded:
+                # Files edited in place don't move their dir's mtime: re-stat them all,
+                # keeping every unchanged record
+                self.mark_all_dirty()
+                self.refresh(force=True)
+                with self._lock:
+                    self._trigrams()
+        except RuntimeError:
+            return  # the scan pool takes no new work once the interpreter is exiting
+        saving = bool(self.snapshot_path) and interval > 0
+        next_save, next_restat = 0, _time.time() + restat
+        while saving or restat > 0:
+            if saving and _time.time() >= next_save:
+                self.save()
+                next_save = _time.time() + interval
+            if restat > 0 and _time.time() >= next_restat:
+                self.mark_all_dirty()
+                try:
+                    self.refresh(force=True)
+                except RuntimeError:
+                    return
+                next_restat = _time.time() + restat
+            due = [t for t, on in ((next_save, saving), (next_restat, restat > 0)) if on]
+            _time.sleep(max(0.0, min(due) - _time.time()))
+
+    def save(self, path=None):
+        """Write the index to `path` (default: the start() snapshot) if it
+        changed since the last save."""
+        path = path or self.snapshot_path
+        if not path or self._saved == self.version:
+            return
+        with self._scan_lock:  # _dirs and _order only change during scans
+            version, order = self.version, self._order
+            dirs = list(self._dirs.items())
+        index = {rel: i for i, (rel, _) in enumerate(dirs)}
+        meta = json.dumps({'root': self.root, 'exts': _EXT_NAMES})
+        text, pos = [meta], len(meta)
+        recs = []
+        for rel, (mtime, _, _) in dirs:
+            parent = index.get(rel.rpartition('/')[0], -1) if rel else -1
+            recs.append(self._SNAP_DIR.pack(mtime, parent, pos, len(rel)))
+            text.append(rel)
+            pos += len(rel)
+        for a in order:
+            rel, _, name = a.path.rpartition('/')
+            recs.append(self._SNAP_FILE.pack(a.ts, a.bytes, index[rel], pos, len(name), a.ext_id))
+            text.append(name)
+            pos += len(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(self._SNAP_HEAD.pack(self.SNAP_MAGIC, len(meta), len(dirs), len(order)))
+            f.write(b''.join(recs))
+            f.write(''.join(text).encode('utf-8', 'surrogateescape'))
+        os.replace(tmp, path)
+        self._saved = version
+
+    def load(self, path):
+        """Adopt a snapshot written by save() for this root; False if there
+        is none, it is unreadable, or the index already has entries."""
+        # The cyclic GC would otherwise run every few hundred new records;
+        # main() then freezes them, as they hold no cycles.
+        collect = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                decoded = self._decode(mm)
+        except (OSError, ValueError, struct.error):
+            return False
+        finally:
+            if collect:
+                gc.enable()
+        if decoded is None:
+            return False
+        dirs, order = decoded
+        with self._scan_lock, self._lock:
+            if self._by_path:
+                return False
+            self._dirs = dirs
+            self._order = order
+            self._by_path = {a.path: a for a in order}
+            self._grams = None
+            self.version += 1
+            self._saved = self.version
+            self._refreshed = _time.time()
+        return True
+
+    def _decode(self, buf):
+        """Snapshot bytes → (dirs, order), or None if written for another
+        root or extension table."""
+        magic, meta_len, ndirs, nfiles = self._SNAP_HEAD.unpack_from(buf)
+        if magic != self.SNAP_MAGIC:
+            return None
+        d0 = self._SNAP_HEAD.size
+        f0 = d0 + ndirs * self._SNAP_DIR.size
+        t0 = f0 + nfiles * self._SNAP_FILE.size
+        with memoryview(buf) as mv:
+            with mv[d0:f0] as part:
+                drecs = list(self._SNAP_DIR.iter_unpack(part))
+            with mv[f0:t0] as part:
+                frecs = list(self._SNAP_FILE.iter_unpack(part))
+            with mv[t0:] as part:
+                text = str(part, 'utf-8', 'surrogateescape')
+        meta = json.loads(text[:meta_len])
+        if meta.get('root') != self.root or tuple(meta.get('exts', ())) != _EXT_NAMES:
+            return None
+        rels = [text[o:o + n] for _, _, o, n in drecs]
+        dirs = {rel: (mtime, [], {}) for rel, (mtime, _, _, _) in zip(rels, drecs)}
+        for rel, (_, parent, _, _) in zip(rels, drecs):
+            if parent >= 0:
+                dirs[rels[parent]][1].append(rel)
+        order = []
+        for ts, nbytes, d, o, n, ext_id in frecs:
+            rel, name = rels[d], text[o:o + n]
+            a = Artifact(f'{rel}/{name}' if rel else name, ts, nbytes, ext_id)
+            dirs[rel][2][name] = a
+            order.append(a)
+        return dirs, order
+
+    def __len__(self):
+        return len(self._by_path)
+
+    def get(self, path):
+        """The artifact at workspace-relative `path`, or None."""
+        with self._lock:
+            return self._by_path.get(path)
+
+    def snapshot(self):
+        """Every artifact right now, newest first (a list the caller owns)."""
+        with self._lock:
+            return list(self._order)
+
+    def mark_dirty(self, rel):
+        """Force `rel` (a workspace-relative dir) to be re-listed on next refresh."""
+        with self._lock:
+            self._dirty.add(rel)
+
+    def close(self):
+        """Stop the scan pool's threads; a later refresh starts a new pool."""
+        with self._scan_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def mark_all_dirty(self):
+        """Re-list every known dir on next refresh — a full rescan that still
+        keeps each unchanged record."""
+        with self._scan_lock:
+            dirs = set(self._dirs) | {''}
+        with self._lock:
+            self._dirty |= dirs
+
+    def _trigrams(self):
+        """The trigram index, built on first use after a snapshot load."""
+        if self._grams is None:
+            grams = TrigramIndex()
+            for p in self._by_path:
+                grams.add(p)
+            self._grams = grams
+        return self._grams
+
+    def _apply(self, added, removed):
+        grams = self._grams
+        for a in removed:
+            if self._by_path.get(a.path) is a:
+                del self._by_path[a.path]
+                if grams is not None:
+                    grams.remove(a.path)
+        for a in added:
+            if a.path not in self._by_path and grams is not None:
+                grams.add(a.path)
+            self._by_path[a.path] = a
+        if len(added) + len(removed) > len(self._order) // 8 + 32:
+            order = sorted(self._by_path.values())
+        else:
+            order = self._order.copy()  # views may still be reading the old list
+            for a in removed:
+                i = bisect.bisect_left(order, a)
+                if i < len(order) and order[i] is a:
+                    del order[i]
+            for a in added:
+                bisect.insort(order, a)
+        self._order = order
+        self.version += 1
+        for fn in self.listeners:
+            fn(added, removed)
+
+    def artifacts(self, folder=None):
+        """Artifacts under `folder` (or all of them), newest first, as a view."""
+        self.refresh()
+        return ArtifactView(self._order, folder)
+
+    # ── file-browser queries ──
+    SORT_KEYS = {
+        'recent': lambda a: (-a.ts, a.path),
+        'name': lambda a: (a.name.lower(), a.path),
+        'size': lambda a: (-a.bytes, a.path),
+    }
+
+    def query(self, folder=None, exts=None, cat=None, since=None, until=None,
+              sort='recent', limit=40, after=None):
+        """One page of a file-browser query → (artifacts, sort key of the last
+        one, or None when nothing follows). `since`/`until` are timestamps
+        (`until` exclusive); `after` is the key returned for the previous page.
+
+        Newest-first pages bisect into the index order at the cursor and
+        date bound and walk only as far as the page needs; name and size
+        pages are heap-selected (k = limit) without sorting the matches.
+        """
+        self.refresh()
+        order = self._order
+        key = self.SORT_KEYS[sort]
+        prefix = folder.strip('/') + '/' if folder else None
+
+        def match(a):
+            return ((prefix is None or a.path.startswith(prefix)) and (not exts or a.ext in exts)
+                    and (cat is None or a.cat == cat))
+
+        if sort == 'recent':
+            i = 0
+            if after is not None:
+                i = bisect.bisect_right(order, Artifact(after[1], -after[0], 0, 0))
+            if until is not None:
+                i = max(i, bisect.bisect_left(order, Artifact('\U0010ffff', until, 0, 0)))
+            page = []
+            for j in range(i, len(order)):
+                a = order[j]
+                if since is not None and a.ts < since:
+                    break
+                if match(a):
+                    page.append(a)
+                    if len(page) > limit:
+                        break
+        else:
+            pool = (a for a in order if match(a) and (since is None or a.ts >= since)
+                    and (until is None or a.ts < until))
+            if after is not None:
+                after = tuple(after)
+                pool = (a for a in pool if key(a) > after)
+            page = heapq.nsmallest(limit + 1, pool, key=key)
+        if len(page) > limit:
+            return page[:limit], key(page[limit - 1])
+        return page, None
+
+    def search(self, q, limit=10):
+        """Best matches for `q` in artifact names/paths, ranked by match
+        quality then recency."""
+        q = q.lower().strip()
+        if len(q) < 2:
+            return []
+        self.refresh()
+        with self._lock:
+            by_path = self._by_path
+            if len(q) < 3:
+                # Too short for trigrams: newest artifacts containing q
+                hits = (a for a in self._order if q in a.path.lower())
+                return list(itertools.islice(hits, limit))
+            scored = []
+            for p, frac in self._trigrams().candidates(q).items():
+                a = by_path[p]
+                name = a.name.lower()
+                if name.startswith(q):
+                    quality = 4
+                elif q in name:
+                    quality = 3
+                elif q in p.lower():
+                    quality = 2
+                else:
+                    quality = frac
+                scored.append((quality, a.ts, p))
+            return [by_path[p] for _, _, p in heapq.nlargest(limit, scored)]
+
+ARTIFACTS = ArtifactIndex(ROOT, workers=PORTAL_CFG.get('scan_workers', 8))
+ARTIFACTS_SNAPSHOT = os.path.join(CACHE_DIR, 'artifacts.snap')
+METRICS.gauge('brain_artifacts_indexed', 'Artifacts in the workspace index.', lambda: len(ARTIFACTS))
+
+def encode_cursor(key):
+    """Opaque page cursor for a sort key from ArtifactIndex.query."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError('bad cursor')
+    if not (isinstance(key, list) and len(key) == 2 and isinstance(key[1], str)):
+        raise ValueError('bad cursor')
+    return key
+
+def file_query(qs):
+    """File-browser parameters (folder, ext, cat, since, until, sort, limit,
+    cursor) → ArtifactIndex.query kwargs. Shared by /api/files and the pages;
+    raises ValueError on malformed input."""
+    def one(k):
+        return qs.get(k, [''])[0].strip()
+    q = {'sort': one('sort') or 'recent'}
+    if q['sort'] not in ArtifactIndex.SORT_KEYS:
+        raise ValueError(f'sort must be one of {", ".join(ArtifactIndex.SORT_KEYS)}')
+    if one('folder'):
+        q['folder'] = one('folder')
+    if one('ext'):
+        q['exts'] = {'.' + e.strip().lstrip('.').lower() for e in one('ext').split(',') if e.strip()}
+    if one('cat'):
+        if one('cat') not in ALL_FOLDERS:
+            raise ValueError('unknown cat')
+        q['cat'] = one('cat')
+    for k, days in (('since', 0), ('until', 1)):  # until is inclusive of its day
+        if one(k):
             try:
-                st = os.stat(fp)
-            except OSError:
-                continue
-            sz = st.st_size / 1024
-            arts.append({
-                'name': f, 'path': rel, 'full': fp, 'cat': cat,
-                'ext': ext, 'icon': file_icon(ext),
-                'modified': datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M'),
-                'ts': st.st_mtime,
-                'size': f"{sz:.0f} KB" if sz < 1024 else f"{sz/1024:.1f} MB",
-            })
-    arts.sort(key=lambda x: x['ts'], reverse=True)
-    return arts
+                q[k] = (datetime.strptime(one(k), '%Y-%m-%d') + timedelta(days=days)).timestamp()
+            except (ValueError, OverflowError, OSError):  # 9999-12-31 + 1 day; pre-1970 on Windows
+                raise ValueError(f'{k} must be YYYY-MM-DD')
+    try:
+        q['limit'] = max(1, min(200, int(one('limit') or 40)))
+    except ValueError:
+        raise ValueError('limit must be a number')
+    if one('cursor'):
+        q['after'] = decode_cursor(one('cursor'))
+        if not isinstance(q['after'][0], str if q['sort'] == 'name' else (int, float)):
+            raise ValueError('bad cursor')
+    return q
+
+def scan_artifacts(folder=None):
+    """Document artifacts in the workspace (or under `folder`), newest first (an ArtifactView)."""
+    return ARTIFACTS.artifacts(folder)
 
 def parse_actions():
     """Parse Action_Items.md → {urgent, medium, other}."""
@@ -197,21 +1184,425 @@ def parse_actions():
             oth.append(item)
     return {'urgent': urg, 'medium': med, 'other': oth}
 
+# ───────────────────────────────────────────────────────────────────────────
+# Signal files are followed incrementally: each SignalTail remembers its
+# byte offset and parser state and only feeds newly written lines.
+# ───────────────────────────────────────────────────────────────────────────
+class SignalTail:
+    """Follows one signal file, feeding only new complete lines to a line parser.
+
+    The file is fully reparsed when it shrinks, its inode changes, or its
+    mtime moved and the bytes already consumed no longer hash the same —
+    the fetch scripts rewrite their output with Set-Content, which keeps the
+    inode and often the size ("Fetched at" is at the top).
+    """
+
+    def __init__(self, path, parser_cls):
+        self.path = path
+        self.parser_cls = parser_cls
+        self.lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, ident):
+        self.ident = ident
+        self.offset = 0
+        self.mtime = None
+        self.digest = hashlib.sha1()  # of the consumed prefix
+        self.partial = b''
+        self.parser = self.parser_cls()
+
+    def read(self):
+        """Parse anything new → parser result, or None if the file is missing."""
+        with self.lock:
+            try:
+                f = open(self.path, 'rb')
+            except OSError:
+                self._reset(None)
+                return None
+            with f:
+                st = os.fstat(f.fileno())
+                ident = (st.st_dev, st.st_ino)
+                if ident != self.ident or st.st_size < self.offset:
+                    self._reset(ident)
+                elif self.offset and st.st_mtime_ns != self.mtime:
+                    if hashlib.sha1(f.read(self.offset)).digest() != self.digest.digest():
+                        self._reset(ident)
+                self.mtime = st.st_mtime_ns
+                if st.st_size > self.offset:
+                    f.seek(self.offset)
+                    data = f.read()
+                    self.offset += len(data)
+                    self.digest.update(data)
+                    data = self.partial + data
+                    cut = data.rfind(b'\n') + 1
+                    self.partial = data[cut:]
+                    for line in data[:cut].decode('utf-8', errors='replace').split('\n')[:-1]:
+                        self.parser.feed(line[:-1] if line.endswith('\r') else line)
+            return self.parser.result(self.partial.decode('utf-8', errors='replace'))
+
+_tails = collections.OrderedDict()
+_tails_lock = threading.Lock()
+
+def _tail(path, parser_cls):
+    """Shared SignalTail for `path`; keeps the most recent 64 files."""
+    key = (path, parser_cls)
+    with _tails_lock:
+        t = _tails.get(key)
+        if t is None:
+            t = _tails[key] = SignalTail(path, parser_cls)
+            while len(_tails) > 64:
+                _tails.popitem(last=False)
+        else:
+            _tails.move_to_end(key)
+        return t
+
+class _LineParser:
+    """Base for incremental signal parsers: feed() complete lines, then
+    result() — an unterminated last line is applied to a throwaway clone."""
+    def result(self, tail=''):
+        if tail:
+            c = self._clone()
+            c.feed_tail(tail)
+            return c.snapshot()
+        return self.snapshot()
+
+    def feed_tail(self, line):
+        self.feed(line)
+
+    def _clone(self):
+        return copy.copy(self)
+
+class _CountParser(_LineParser):
+    """Counts table rows and bullets (whichever is larger)."""
+    def __init__(self):
+        self.rows = self.bullets = 0
+
+    def feed(self, line):
+        if line.startswith('- '):
+            self.bullets += 1
+        elif line.startswith('|') and (len(line) == 1 or line[1] not in '-|'):
+            self.rows += 1
+
+    def snapshot(self):
+        return max(self.rows, self.bullets)
+
+_MTG_ROW = re.compile(r'\|\s*(\d{2}:\d{2}[^|]+?\d{2}:\d{2})\s*\|\s*(\d+m)\s*\|\s*(.+?)\s*\|\s*(.+?)\s*\|\s*(\w+)\s*\|')
+_FREE_SLOT = re.compile(r'-\s*(\d{2}:\d{2}[^(]+?\d{2}:\d{2})\s*\((\d+m)\)')
+_CONFLICT = re.compile(r'\*\*(.+?)\*\*\s*\((.+?)\)\s*overlaps\s*\*\*(.+?)\*\*\s*\((.+?)\)')
+
+class _CalendarParser(_LineParser):
+    """Meetings from the '## Today' section (whole file if absent), plus
+    free slots and conflicts."""
+    def __init__(self):
+        self.pre, self.today = [], []
+        self.seen_today = self.in_today = False
+        self.free, self.conflicts = [], []
+
+    def feed(self, line):
+        if not self.seen_today and '## Today' in line:
+            self.seen_today = self.in_today = True
+        elif self.in_today and '## Tomorrow' in line:
+            self.in_today = False
+        if self.in_today or not self.seen_today:
+            rows = self.today if self.in_today else self.pre
+            pm_name = _CFG.get('pm_identity', {}).get('name', '')
+            for r in _MTG_ROW.finditer(line):
+                ti, du, tl, og, st = [g.strip() for g in r.groups()]
+                if tl == 'Sleep':
+                    continue
+                tp = 'focus' if '🎯 Focus:' in tl else ('self' if pm_name and pm_name in og else 'external')
+                rows.append({'time': ti, 'dur': du, 'title': tl, 'org': og, 'status': st, 'type': tp})
+        self.free.extend({'time': m.group(1).strip(), 'dur': m.group(2).strip()}
+                         for m in _FREE_SLOT.finditer(line))
+        self.conflicts.extend({'m1': m.group(1), 't1': m.group(2), 'm2': m.group(3), 't2': m.group(4)}
+                              for m in _CONFLICT.finditer(line))
+
+    def _clone(self):
+        c = copy.copy(self)
+        c.pre, c.today, c.free, c.conflicts = list(self.pre), list(self.today), list(self.free), list(self.conflicts)
+        return c
+
+    def snapshot(self):
+        meetings = self.today if self.seen_today else self.pre
+        return {'meetings': list(meetings), 'free': list(self.free), 'conflicts': list(self.conflicts)}
+
+_EMAIL_HDR = re.compile(r'###\s+\[([^\]]+)\]\s+(.+)')
+_EMAIL_FROM = re.compile(r'\*\*From:\*\*\s*(.+?)(?:\s*<[^>]+>)?\s*$')
+
+class _EmailParser(_LineParser):
+    """'### [time] subject' blocks with their **From:** sender."""
+    def __init__(self):
+        self.fetched = None
+        self.no_match = False
+        self.emails = []
+        self.current = None
+
+    def feed_tail(self, line):
+        # Subject and From lines only count once newline-terminated
+        if self.fetched is None:
+            tm = re.search(r'Fetched at (\d{2}:\d{2}:\d{2})', line)
+            if tm:
+                self.fetched = tm.group(1)
+        if 'No matching emails' in line:
+            self.no_match = True
+
+    def feed(self, line):
+        self.feed_tail(line)
+        m = _EMAIL_HDR.search(line)
+        if m:
+            self.current = {'time': m.group(1).strip(), 'subject': m.group(2).strip(), 'sender': '', 'charter': ''}
+            self.emails.append(self.current)
+            return
+        if self.current is not None and not self.current['sender']:
+            sm = _EMAIL_FROM.search(line)
+            if sm:
+                self.current['sender'] = sm.group(1).strip()
+
+    def _clone(self):
+        c = copy.copy(self)
+        c.emails = [dict(e) for e in self.emails]
+        c.current = c.emails[-1] if self.current is not None else None
+        return c
+
+    def snapshot(self):
+        if self.no_match:
+            return {'emails': [], 'fetched': self.fetched}
+        emails = [dict(e) for e in self.emails]
+        for e, ch in zip(emails, CHARTERS.classify_many([e['subject'] for e in emails])):
+            e['charter'] = ch or ''
+        return {'emails': emails, 'fetched': self.fetched}
+
+class _RowParser(_LineParser):
+    """Table rows and bullets of an ADO/chat/inbox signal file, with the
+    ## section they appear under."""
+    def __init__(self):
+        self.items = []
+        self.section = ''
+        self.header = None
+        self.pending = None  # last table row; becomes the header if a separator follows
+
+    def _row(self, cells):
+        text = ' | '.join(c for c in cells if c)
+        fields = dict(zip(self.header, cells)) if self.header and len(self.header) == len(cells) else None
+        return {'section': self.section, 'text': text, 'fields': fields}
+
+    def _flush(self):
+        if self.pending is not None:
+            self.items.append(self._row(self.pending))
+            self.pending = None
+
+    def feed(self, line):
+        s = line.strip()
+        m = re.match(r'^#{2,3}\s+(.+)', s)
+        if m:
+            self._flush()
+            self.section, self.header = m.group(1).strip(), None
+            return
+        if s.startswith('|'):
+            cells = [c.strip() for c in s.strip('|').split('|')]
+            if all(re.match(r'^:?-+:?$', c) for c in cells if c):
+                self.header, self.pending = self.pending, None
+                return
+            self._flush()
+            self.pending = cells
+            return
+        self._flush()
+        self.header = None
+        if s.startswith('- '):
+            self.items.append({'section': self.section, 'text': s[2:].strip(), 'fields': None})
+
+    def _clone(self):
+        c = copy.copy(self)
+        c.items = list(self.items)
+        return c
+
+    def snapshot(self):
+        items = list(self.items)
+        if self.pending is not None:
+            items.append(self._row(self.pending))
+        return items
+
+# ───────────────────────────────────────────────────────────────────────────
+# Signal store — SQLite history of parsed signals, including archived days
+# ───────────────────────────────────────────────────────────────────────────
+_SIGNAL_FILE = re.compile(r'^(emails|calendar|ado|chats|inbox_parsed)_(\d{4}-\d{2}-\d{2})\.md$')
+_SIGNAL_TYPES = {'emails': _EmailParser, 'calendar': _CalendarParser,
+                 'ado': _RowParser, 'chats': _RowParser, 'inbox_parsed': _RowParser}
+
+class SignalStore:
+    """Local SQLite store of parsed signals from Signals/ and 08_Archive/Signals/.
+
+    Files are ingested whole and re-ingested only when their size or mtime
+    changes; a file moved to the archive by cleanup.ps1 keeps its rows (files
+    are keyed by name). Items are indexed by date, type, charter and sender,
+    so history queries never touch markdown. For meetings, `sender` holds the
+    organizer.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (
+        name TEXT PRIMARY KEY, path TEXT NOT NULL, type TEXT NOT NULL, date TEXT NOT NULL,
+        size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, count INTEGER NOT NULL, meta TEXT);
+    CREATE TABLE IF NOT EXISTS items (
+        id INTEGER PRIMARY KEY, file TEXT NOT NULL, type TEXT NOT NULL, date TEXT NOT NULL,
+        seq INTEGER NOT NULL, time TEXT, title TEXT, sender TEXT, charter TEXT, data TEXT NOT NULL);
+    CREATE INDEX IF NOT EXISTS items_date ON items(date, type);
+    CREATE INDEX IF NOT EXISTS items_type ON items(type, date);
+    CREATE INDEX IF NOT EXISTS items_charter ON items(charter, date);
+    CREATE INDEX IF NOT EXISTS items_sender ON items(sender, date);
+    CREATE INDEX IF NOT EXISTS items_file ON items(file);
+    CREATE INDEX IF NOT EXISTS files_date ON files(date, type);
+    """
+
+    def __init__(self, db_path, dirs, interval=60):
+        self.db_path = db_path
+        self.dirs = dirs
+        self.interval = interval
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._started = False
+
+    def _db(self):
+        con = getattr(self._local, 'con', None)
+        if con is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            con = sqlite3.connect(self.db_path, timeout=10)
+            con.execute('PRAGMA journal_mode=WAL')
+            con.executescript(self.SCHEMA)
+            self._local.con = con
+        return con
+
+    def start(self):
+        if self._started:
+            return
+        self._started = True
+        def loop():
+            while True:
+                try:
+                    self.sync()
+                except Exception as e:  # keep syncing; the next pass retries
+                    print(f'  [Signals] sync failed: {e}')
+                _time.sleep(self.interval)
+        threading.Thread(target=loop, name='brain-signal-store', daemon=True).start()
+
+    def _signal_files(self):
+        for d in self.dirs:
+            for r, dirs, files in os.walk(d):
+                dirs[:] = [x for x in dirs if x not in SKIP]
+                for f in files:
+                    m = _SIGNAL_FILE.match(f)
+                    if m:
+                        yield f, os.path.join(r, f), m.group(1), m.group(2)
+
+    def sync(self):
+        """Ingest new or changed signal files → number of files (re)ingested."""
+        with self._write_lock:
+            con = self._db()
+            known = {name: (path, size, mt) for name, path, size, mt in
+                     con.execute('SELECT name, path, size, mtime_ns FROM files')}
+            n = 0
+            for name, path, typ, date in self._signal_files():
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                k = known.get(name)
+                if k and k[1:] == (st.st_size, st.st_mtime_ns):
+                    if k[0] != path:
+                        with con:
+                            con.execute('UPDATE files SET path=? WHERE name=?', (path, name))
+                    continue
+                try:
+                    n += self._ingest(con, name, path, typ, date, st)
+                except (ValueError, KeyError, TypeError) as e:  # one malformed file
+                    print(f'  [Signals] skipped {name}: {e}')
+            return n
+
+    def _ingest(self, con, name, path, typ, date, st):
+        """Replace one file's rows → False if it vanished (moved by cleanup)."""
+        parsed = SignalTail(path, _SIGNAL_TYPES[typ]).read()
+        if parsed is None:
+            return False
+        count = SignalTail(path, _CountParser).read() or 0
+        meta, rows = {}, []
+        if typ == 'emails':
+            meta['fetched'] = parsed['fetched']
+            rows = [(e['time'], e['subject'], e['sender'], e['charter'], e) for e in parsed['emails']]
+        elif typ == 'calendar':
+            meta = {'free': parsed['free'], 'conflicts': parsed['conflicts']}
+            rows = [(m['time'], m['title'], m['org'], charter_of(m['title']) or '', m) for m in parsed['meetings']]
+        else:
+            rows = [(None, it['text'], None, charter_of(it['text']) or '', it) for it in parsed]
+        with con:
+            con.execute('DELETE FROM items WHERE file=?', (name,))
+            con.execute('INSERT OR REPLACE INTO files VALUES (?,?,?,?,?,?,?,?)',
+                        (name, path, typ, date, st.st_size, st.st_mtime_ns, count, json.dumps(meta)))
+            con.executemany('INSERT INTO items (file, type, date, seq, time, title, sender, charter, data) '
+                            'VALUES (?,?,?,?,?,?,?,?,?)',
+                            [(name, typ, date, i, t, ti, se, ch, json.dumps(d))
+                             for i, (t, ti, se, ch, d) in enumerate(rows)])
+        return True
+
+    # ── per-day views (same shapes as the live parsers) ──
+    def _day(self, typ, date):
+        con = self._db()
+        f = con.execute('SELECT name, count, meta FROM files WHERE type=? AND date=?', (typ, date)).fetchone()
+        if f is None:
+            return None, None, []
+        items = [json.loads(d) for (d,) in con.execute(
+            'SELECT data FROM items WHERE file=? ORDER BY seq', (f[0],))]
+        return f[1], json.loads(f[2] or '{}'), items
+
+    def emails(self, date):
+        _, meta, items = self._day('emails', date)
+        return {'emails': items, 'fetched': meta.get('fetched') if meta else None}
+
+    def calendar(self, date):
+        _, meta, items = self._day('calendar', date)
+        meta = meta or {}
+        return {'meetings': items, 'free': meta.get('free', []), 'conflicts': meta.get('conflicts', [])}
+
+    def counts(self, date):
+        rows = self._db().execute('SELECT type, count FROM files WHERE date=?', (date,))
+        return dict(rows.fetchall())
+
+    # ── history queries ──
+    def query(self, type=None, since=None, until=None, charter=None, sender=None, limit=200):
+        sql, args = ['SELECT type, date, time, title, sender, charter FROM items WHERE 1=1'], []
+        for col, op, val in (('type', '=', type), ('date', '>=', since), ('date', '<=', until),
+                             ('charter', '=', charter), ('sender', '=', sender)):
+            if val:
+                sql.append(f'AND {col} {op} ?')
+                args.append(val)
+        sql.append('ORDER BY date DESC, type, seq LIMIT ?')
+        args.append(limit)
+        cols = ('type', 'date', 'time', 'title', 'sender', 'charter')
+        return [dict(zip(cols, r)) for r in self._db().execute(' '.join(sql), args)]
+
+    def daily_counts(self, since=None, until=None):
+        sql, args = 'SELECT date, type, count FROM files WHERE date >= ? AND date <= ? ORDER BY date', \
+                    [since or '0000-00-00', until or '9999-99-99']
+        out = {}
+        for date, typ, count in self._db().execute(sql, args):
+            out.setdefault(date, {})[typ] = count
+        return out
+
+STORE = SignalStore(os.path.join(CACHE_DIR, 'signals.db'), [SIG, os.path.join(ARCHIVE, 'Signals')])
+
 def parse_signal_counts(date_str=None):
     """Count items in each signal file for today."""
     if not date_str:
         date_str = datetime.now().strftime('%Y-%m-%d')
     counts = {}
+    archived = None
     for sig_type in ['emails', 'ado', 'chats', 'calendar', 'inbox_parsed']:
         sp = os.path.join(SIG, f'{sig_type}_{date_str}.md')
-        if os.path.exists(sp):
-            with open(sp, encoding='utf-8') as f:
-                txt = f.read()
-            rows = len(re.findall(r'^\|[^-|]', txt, re.M))
-            bullets = len(re.findall(r'^- ', txt, re.M))
-            counts[sig_type] = max(rows, bullets)
-        else:
-            counts[sig_type] = 0
+        n = _tail(sp, _CountParser).read()
+        if n is None:
+            if archived is None:
+                archived = STORE.counts(date_str)
+            n = archived.get(sig_type, 0)
+        counts[sig_type] = n
     return counts
 
 def parse_calendar(date_str=None):
@@ -219,60 +1610,1105 @@ def parse_calendar(date_str=None):
     if not date_str:
         date_str = datetime.now().strftime('%Y-%m-%d')
     p = os.path.join(SIG, f'calendar_{date_str}.md')
-    if not os.path.exists(p):
-        return {'meetings': [], 'free': [], 'conflicts': []}
-    with open(p, encoding='utf-8') as f:
-        txt = f.read()
-    m = re.search(r'## Today.*?(?=## Tomorrow|\Z)', txt, re.S)
-    sec = m.group(0) if m else txt
-    meetings = []
-    pm_name = _CFG.get('pm_identity', {}).get('name', '')
-    for r in re.finditer(r'\|\s*(\d{2}:\d{2}[^|]+?\d{2}:\d{2})\s*\|\s*(\d+m)\s*\|\s*(.+?)\s*\|\s*(.+?)\s*\|\s*(\w+)\s*\|', sec):
-        ti, du, tl, og, st = [g.strip() for g in r.groups()]
-        if tl == 'Sleep':
-            continue
-        tp = 'focus' if '🎯 Focus:' in tl else ('self' if pm_name and pm_name in og else 'external')
-        meetings.append({'time': ti, 'dur': du, 'title': tl, 'org': og, 'status': st, 'type': tp})
-    free = [{'time': m.group(1).strip(), 'dur': m.group(2).strip()}
-            for m in re.finditer(r'-\s*(\d{2}:\d{2}[^(]+?\d{2}:\d{2})\s*\((\d+m)\)', txt)]
-    conf = [{'m1': m.group(1), 't1': m.group(2), 'm2': m.group(3), 't2': m.group(4)}
-            for m in re.finditer(r'\*\*(.+?)\*\*\s*\((.+?)\)\s*overlaps\s*\*\*(.+?)\*\*\s*\((.+?)\)', txt)]
-    return {'meetings': meetings, 'free': free, 'conflicts': conf}
+    return _tail(p, _CalendarParser).read() or STORE.calendar(date_str)
 
 def parse_emails(date_str=None):
     """Parse email signal → list of emails."""
     if not date_str:
         date_str = datetime.now().strftime('%Y-%m-%d')
     p = os.path.join(SIG, f'emails_{date_str}.md')
-    if not os.path.exists(p):
-        return {'emails': [], 'fetched': None}
-    with open(p, encoding='utf-8') as f:
-        txt = f.read()
-    tm_m = re.search(r'Fetched at (\d{2}:\d{2}:\d{2})', txt)
-    fetched = tm_m.group(1) if tm_m else None
-    if 'No matching emails' in txt:
-        return {'emails': [], 'fetched': fetched}
-    emails = []
-    for blk in re.finditer(r'###\s+\[([^\]]+)\]\s+(.+?)\n(.*?)(?=###\s+\[|\Z)', txt, re.S):
-        time_str, subject, body = blk.group(1).strip(), blk.group(2).strip(), blk.group(3)
-        sender = ''
-        sm = re.search(r'\*\*From:\*\*\s*(.+?)(?:\s*<[^>]+>)?\s*\n', body)
-        if sm:
-            sender = sm.group(1).strip()
-        ch = charter_of(subject) or ''
-        emails.append({'time': time_str, 'subject': subject, 'sender': sender, 'charter': ch})
-    return {'emails': emails, 'fetched': fetched}
+    return _tail(p, _EmailParser).read() or STORE.emails(date_str)
+
+def brief_path(date_str):
+    """Path of the brief for `date_str`, in Daily_Briefs or archived by
+    cleanup.ps1 under 08_Archive/Briefs/YYYY-MM/ (month of last write)."""
+    name = f'{date_str}_Brief.md'
+    bp = os.path.join(BRIEFS, name)
+    if os.path.exists(bp):
+        return bp
+    d = datetime.strptime(date_str, '%Y-%m-%d')
+    for month in (d, d.replace(day=28) + timedelta(days=4)):
+        ap = os.path.join(ARCHIVE, 'Briefs', month.strftime('%Y-%m'), name)
+        if os.path.exists(ap):
+            return ap
+    return None
 
 def parse_brief_md(date_str=None):
     """Read daily brief markdown."""
     if not date_str:
         date_str = datetime.now().strftime('%Y-%m-%d')
-    bp = os.path.join(ROOT, '00_Daily_Intelligence', 'Daily_Briefs', f'{date_str}_Brief.md')
-    if not os.path.exists(bp):
+    bp = brief_path(date_str)
+    if not bp:
         return None
     with open(bp, encoding='utf-8') as f:
         return f.read()
 
+class RenderCache:
+    """On-disk cache of rendered HTML keyed by the source file's
+    (path, size, mtime, inode), so it survives restarts and is never stale.
+
+    Entries are also keyed by a renderer version. Hits bump the cache file's
+    mtime; once the directory exceeds max_bytes the least recently used
+    files are evicted.
+    """
+
+    def __init__(self, folder, version='1', max_bytes=32 * 1024 * 1024, memory_items=16):
+        self.folder = folder
+        self.version = version  # bump when the renderer's output changes
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._mem = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, path):
+        st = os.stat(path)
+        raw = f'{self.version}|{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}|{st.st_ino}'
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get(self, path, render):
+        """Cached render(path) for the current version of `path`."""
+        k = self.key(path)
+        with self._lock:
+            if k in self._mem:
+                self._mem.move_to_end(k)
+                return self._mem[k]
+        fp = os.path.join(self.folder, f'{k}.html')
+        try:
+            with open(fp, encoding='utf-8') as f:
+                out = f.read()
+            os.utime(fp)
+        except OSError:
+            out = render(path)
+            self._store(fp, out)
+        with self._lock:
+            self._mem[k] = out
+            while len(self._mem) > self.memory_items:
+                self._mem.popitem(last=False)
+        return out
+
+    def _store(self, fp, out):
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            tmp = f'{fp}.{threading.get_ident()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(out)
+            os.replace(tmp, fp)
+            files = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in os.scandir(self.folder)
+                     if e.name.endswith('.html')]
+        except OSError:
+            return
+        total = sum(sz for _, sz, _ in files)
+        for _, sz, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= sz
+            except OSError:
+                pass
+
+def _render_brief_file(path):
+    with open(path, encoding='utf-8') as f:
+        return md_to_html(f.read())
+
+BRIEF_CACHE = RenderCache(os.path.join(CACHE_DIR, 'briefs'), version='3',  # md_render output version
+                          max_bytes=PORTAL_CFG.get('brief_cache_mb', 32) * 1024 * 1024)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# WATCHER — precise cache invalidation on workspace changes
+# ═══════════════════════════════════════════════════════════════════════════
+# Workspace-relative path pattern → (cache keys derived from it, change topics)
+WATCH_RULES = [
+    (re.compile(r'00_Daily_Intelligence/Signals/calendar_'), ('cal',), ('calendar',)),
+    (re.compile(r'00_Daily_Intelligence/Signals/emails_'), ('emails',), ('emails',)),
+    (re.compile(r'00_Daily_Intelligence/Signals/'), ('sig_counts',), ('signals',)),
+    (re.compile(r'00_Daily_Intelligence/Knowledge_Base/Action_Items\.md$'), ('actions',), ('actions',)),
+    (re.compile(r'00_Daily_Intelligence/Daily_Briefs/'), (), ('brief',)),
+]
+DATED_KEYS = ('cal', 'emails', 'sig_counts')  # default to today's files
+
+class Watcher:
+    """Watches signal, KB, brief and project folders and invalidates only the
+    cache entries tied to a changed path.
+
+    Uses Linux inotify when available and falls back to polling file stats.
+    While running, `_cached` TTLs stretch to WATCH_TTL, so an unchanged
+    workspace is never re-parsed.
+    """
+
+    IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE = 0x2, 0x4, 0x8
+    IN_MOVED_FROM, IN_MOVED_TO, IN_CREATE, IN_DELETE = 0x40, 0x80, 0x100, 0x200
+    IN_DELETE_SELF, IN_MOVE_SELF = 0x400, 0x800
+    IN_Q_OVERFLOW, IN_IGNORED, IN_ISDIR = 0x4000, 0x8000, 0x40000000
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+            IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+    def __init__(self, roots, mode='auto', poll_interval=2.0, debounce=0.05):
+        self.roots = roots
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.active = False
+        self.backend = None
+        self._wds = {}        # inotify watch descriptor → dir path
+        self._watched = set()
+        self._stats = {}      # polling: path → (mtime_ns, size)
+        self._day = datetime.now().date()
+
+    def start(self):
+        if self.mode == 'off' or self.active:
+            return
+        run = None
+        if self.mode in ('auto', 'inotify'):
+            run = self._init_inotify()
+        if run is None:
+            self._poll_scan(self._stats)
+            run = self._run_poll
+            self.backend = 'poll'
+        self.active = True
+        threading.Thread(target=run, name='brain-watcher', daemon=True).start()
+
+    # ── dispatch ──
+    def _changed(self, paths):
+        keys, topics, dirs = set(), set(), set()
+        for full in paths:
+            rel = os.path.relpath(full, ROOT).replace('\\', '/')
+            if SKIP.intersection(rel.split('/')):
+                continue
+            for rx, ks, ts in WATCH_RULES:
+                if rx.match(rel):
+                    keys.update(ks)
+                    topics.update(ts)
+            dirs.add(rel.rsplit('/', 1)[0] if '/' in rel else '')
+        if not dirs:
+            return
+        if keys:
+            _invalidate(keys)
+        for d in dirs:
+            ARTIFACTS.mark_dirty(d)
+        FEED.publish(topics or ('artifacts',))
+
+    def _tick(self):
+        today = datetime.now().date()
+        if today != self._day:
+            self._day = today
+            _invalidate(DATED_KEYS)
+            FEED.publish(('*',))  # new day: pages reload
+
+    # ── inotify ──
+    def _init_inotify(self):
+        try:
+            import ctypes, ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(0o2000000)  # IN_CLOEXEC
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        self._libc, self._fd = libc, fd
+        self.backend = 'inotify'
+        for r in self.roots:
+            self._add_tree(r)
+        return self._run_inotify
+
+    def _add_watch(self, path):
+        if path in self._watched:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.MASK)
+        if wd >= 0:
+            self._wds[wd] = path
+            self._watched.add(path)
+
+    def _add_tree(self, root):
+        if os.path.basename(root) in SKIP:
+            return
+        for r, dirs, _ in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in SKIP]
+            self._add_watch(r)
+
+    def _run_inotify(self):
+        import select, struct
+        hdr = struct.Struct('iIII')
+        pending, deadline, next_tick = set(), None, 0.0
+        while True:
+            wake = min(deadline, next_tick) if deadline else next_tick
+            ready, _, _ = select.select([self._fd], [], [], max(0.0, wake - _time.time()))
+            if ready:
+                buf = os.read(self._fd, 65536)
+                i = 0
+                while i + hdr.size <= len(buf):
+                    wd, mask, _cookie, ln = hdr.unpack_from(buf, i)
+                    name = buf[i + hdr.size:i + hdr.size + ln].rstrip(b'\0')
+                    i += hdr.size + ln
+                    if mask & self.IN_Q_OVERFLOW:
+                        # Events were dropped: rescan everything, and drop every
+                        # watched parse (CACHE.clear covers all WATCH_RULES keys)
+                        CACHE.clear()
+                        ARTIFACTS.mark_all_dirty()
+                        ARTIFACTS.refresh(force=True)
+                        pending.clear()
+                        FEED.publish(('*',))
+                        continue
+                    base = self._wds.get(wd)
+                    if base is None:
+                        continue
+                    if mask & self.IN_IGNORED:
+                        self._watched.discard(self._wds.pop(wd))
+                        continue
+                    path = os.path.join(base, os.fsdecode(name)) if name else base
+                    if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        self._add_tree(path)
+                    pending.add(path)
+                if pending and deadline is None:
+                    deadline = _time.time() + self.debounce
+            # Checked on every pass, so a steady event stream (a sync client,
+            # a bulk copy) can't hold back invalidation or the midnight reload
+            now = _time.time()
+            if deadline and now >= deadline:
+                if pending:
+                    self._changed(pending)
+                pending, deadline = set(), None
+            if now >= next_tick:
+                next_tick = now + self.poll_interval
+                for r in self.roots:
+                    if r not in self._watched and os.path.isdir(r):
+                        self._add_tree(r)
+                        self._changed([r])
+                self._tick()
+
+    # ── polling fallback ──
+    def _poll_scan(self, stats):
+        for root in self.roots:
+            for r, dirs, files in os.walk(root):
+                dirs[:] = [d for d in dirs if d not in SKIP]
+                for f in files:
+                    fp = os.path.join(r, f)
+                    try:
+                        st = os.stat(fp)
+                    except OSError:
+                        continue
+                    stats[fp] = (st.st_mtime_ns, st.st_size)
+
+    def _run_poll(self):
+        while True:
+            _time.sleep(self.poll_interval)
+            fresh = {}
+            self._poll_scan(fresh)
+            changed = {p for p in fresh.keys() | self._stats.keys()
+                       if fresh.get(p) != self._stats.get(p)}
+            self._stats = fresh
+            if changed:
+                self._changed(changed)
+            self._tick()
+
+WATCHER = Watcher(
+    [SIG, KB, BRIEFS] + [os.path.join(ROOT, p['folder']) for p in PROJECTS.values()],
+    mode=PORTAL_CFG.get('watch', 'auto'),
+    poll_interval=PORTAL_CFG.get('watch_poll_seconds', 2.0),
+)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# EVENTS — versioned change feed pushed to open pages (Server-Sent Events)
+# ═══════════════════════════════════════════════════════════════════════════
+class ChangeFeed:
+    """Versioned change events streamed to pages over Server-Sent Events.
+
+    publish() bumps the version and records the changed topics (calendar,
+    emails, signals, actions, brief, artifacts, jobs; '*' = reload). Streams
+    are handed over by the HTTP handler and owned by one sender thread, so
+    an idle tab holds a socket but no worker. A short history lets a page
+    that reconnects replay what it missed; one too far behind gets '*'.
+    """
+
+    def __init__(self, history=256, heartbeat=20, max_clients=64):
+        self.version = 0
+        self.heartbeat = heartbeat
+        self.max_clients = max_clients
+        self._history = collections.deque(maxlen=history)  # (version, topics)
+        self._clients = {}   # socket → last version sent
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def publish(self, topics):
+        topics = sorted(set(topics))
+        if not topics:
+            return
+        with self._cond:
+            self.version += 1
+            self._history.append((self.version, topics))
+            self._cond.notify()
+
+    def attach(self, sock, since=None):
+        """Take over an SSE connection whose headers were sent → False if full."""
+        with self._cond:
+            if len(self._clients) >= self.max_clients:
+                return False
+            sock.settimeout(5)  # a stalled reader is dropped, not waited on
+            self._clients[sock] = self.version if since is None else max(0, min(since, self.version))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='change-feed', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return True
+
+    def clients(self):
+        return len(self._clients)
+
+    @staticmethod
+    def _frame(version, topics):
+        data = json.dumps({'version': version, 'topics': topics})
+        return f'id: {version}\nevent: change\ndata: {data}\n\n'.encode('utf-8')
+
+    def _pending(self, sent):
+        """Frames a client at version `sent` is missing (lock held)."""
+        if sent >= self.version:
+            return b''
+        if not self._history or self._history[0][0] > sent + 1:
+            return self._frame(self.version, ['*'])
+        return b''.join(self._frame(v, t) for v, t in self._history if v > sent)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                notified = self._cond.wait(self.heartbeat)
+                sends = []
+                for sock, sent in self._clients.items():
+                    data = self._pending(sent)
+                    if data or not notified:
+                        sends.append((sock, data or b': ping\n\n'))
+                    self._clients[sock] = self.version
+            dead = []
+            for sock, data in sends:
+                try:
+                    sock.sendall(data)
+                except OSError:
+                    dead.append(sock)
+            if dead:
+                with self._cond:
+                    for sock in dead:
+                        self._clients.pop(sock, None)
+                for sock in dead:
+                    try:
+                        sock.close()
+                    except OSError:
+                        pass
+
+FEED = ChangeFeed(max_clients=PORTAL_CFG.get('sse_max_clients', 64))
+METRICS.gauge('brain_sse_clients', 'Pages connected to the change feed.', FEED.clients)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TEXT EXTRACTION — background content indexing for Office/PDF artifacts
+# ═══════════════════════════════════════════════════════════════════════════
+TEXT_EXTS = {'.docx', '.pptx', '.xlsx', '.pdf', '.md', '.html'}
+_OOXML_PARTS = {
+    '.docx': re.compile(r'word/(document|header\d*|footer\d*|footnotes)\.xml$'),
+    '.pptx': re.compile(r'ppt/(slides/slide|notesSlides/notesSlide)\d+\.xml$'),
+    '.xlsx': re.compile(r'xl/(sharedStrings|worksheets/sheet\d+)\.xml$'),
+}
+_PDF_STREAM = re.compile(rb'<<(.*?)>>\s*stream\r?\n(.*?)\r?\nendstream', re.S)
+_PDF_TEXT = re.compile(rb'\((?:\\.|[^\\)])*\)|\[(?:\\.|[^\]])*\]\s*TJ|TJ|Tj|T\*|\'|"')
+_PDF_STR = re.compile(rb'\(((?:\\.|[^\\)])*)\)')
+_PDF_ESC = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'', b'f': b''}
+
+def _ooxml_text(path, ext):
+    """Text runs from the XML parts of a .docx/.pptx/.xlsx package."""
+    parts = _OOXML_PARTS[ext]
+    out = []
+    with zipfile.ZipFile(path) as zf:
+        names = sorted((n for n in zf.namelist() if parts.match(n)),
+                       key=lambda n: [int(t) if t.isdigit() else t for t in re.split(r'(\d+)', n)])
+        for n in names:
+            for el in ET.fromstring(zf.read(n)).iter():
+                tag = el.tag.rsplit('}', 1)[-1]
+                if tag == 't' and el.text:
+                    out.append(el.text)
+                elif tag in ('p', 'si', 'row'):
+                    out.append('\n')
+    return ' '.join(out)
+
+def _pdf_unescape(raw):
+    return re.sub(rb'\\([nrtbf()\\]|[0-7]{1,3})',
+                  lambda e: bytes([int(e.group(1), 8) & 0xFF]) if e.group(1)[:1].isdigit()
+                  else _PDF_ESC.get(e.group(1), e.group(1)),
+                  raw)
+
+def _pdf_text(path):
+    """Best-effort text from Tj/TJ operators in (Flate-compressed) content streams."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    out = []
+    for m in _PDF_STREAM.finditer(data):
+        body = m.group(2)
+        if b'/FlateDecode' in m.group(1):
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                continue
+        for tok in _PDF_TEXT.finditer(body):
+            t = tok.group(0)
+            if t[:1] in (b'(', b'['):
+                # TJ arrays interleave string pieces with kerning offsets
+                out.append(b''.join(_pdf_unescape(sm.group(1)) for sm in _PDF_STR.finditer(t)))
+            elif t != b'TJ' and t != b'Tj':
+                out.append(b'\n')
+        out.append(b'\n')
+    return b' '.join(out).decode('latin-1')
+
+def extract_text(path, ext):
+    """Plain text of one artifact. Runs inside an extraction worker process."""
+    if ext in _OOXML_PARTS:
+        return _ooxml_text(path, ext)
+    if ext == '.pdf':
+        return _pdf_text(path)
+    with open(path, encoding='utf-8', errors='replace') as f:
+        txt = f.read()
+    if ext == '.html':
+        txt = html_mod.unescape(re.sub(r'<(script|style)\b.*?</\1>|<[^>]+>', ' ', txt, flags=re.S | re.I))
+    return txt
+
+def _extract_worker(conn):
+    """Worker process loop: (path, ext) in → (ok, text | error) out."""
+    while True:
+        try:
+            path, ext = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            conn.send((True, extract_text(path, ext)))
+        except Exception as e:
+            conn.send((False, f'{type(e).__name__}: {e}'))
+
+def _file_hash(path):
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+class TextIndex:
+    """Extracts artifact text in a bounded pool of worker processes and keeps a
+    token index for content search.
+
+    Extracted text is cached on disk under its content hash, so unchanged (or
+    duplicated) files are never re-extracted, even across restarts. Each
+    worker process handles one file at a time and is killed and replaced if
+    a file exceeds the per-file timeout.
+    """
+
+    MAX_BYTES = 50 * 1024 * 1024   # skip files larger than this
+    MAX_CHARS = 1024 * 1024        # cap stored text per file
+
+    def __init__(self, cache_dir, workers=2, timeout=30):
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.timeout = timeout
+        self.stats = {'extracted': 0, 'cached': 0, 'failed': 0, 'timeouts': 0}
+        self._queue = queue.Queue()
+        self._queued = set()
+        self._manifest = {}   # path → [size, mtime_ns, hash | None]
+        self._docs = {}       # path → hash of the indexed text
+        self._post = {}       # token → {path}
+        self._lock = threading.Lock()
+        self._dirty_since = None
+        self._started = False
+
+    # ── lifecycle ──
+    def start(self):
+        if self._started or self.workers <= 0:
+            return
+        self._started = True
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_manifest()
+        ARTIFACTS.listeners.append(self.sync)
+        threading.Thread(target=self._feed, name='brain-text-feed', daemon=True).start()
+        for i in range(self.workers):
+            threading.Thread(target=self._supervise, name=f'brain-text-{i}', daemon=True).start()
+
+    def _feed(self):
+        """Seed the queue from the artifact index, then keep it refreshed so
+        new files are picked up without waiting for a page request."""
+        self.sync(ARTIFACTS.snapshot(), [])
+        while True:
+            ARTIFACTS.refresh()
+            _time.sleep(ARTIFACTS.min_interval)
+
+    def sync(self, added, removed):
+        """Artifact-index listener: queue new, changed and deleted files. It
+        runs under the index lock, so all disk work is left to _supervise."""
+        with self._lock:
+            for a in itertools.chain(removed, added):
+                if a.ext in TEXT_EXTS and a.path not in self._queued:
+                    self._queued.add(a.path)
+                    self._queue.put(a.path)
+
+    # ── manifest / cache files ──
+    def _cache_file(self, h):
+        return os.path.join(self.cache_dir, f'{h}.txt')
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.cache_dir, 'manifest.json'), encoding='utf-8') as f:
+                self._manifest = json.load(f)
+        except (OSError, ValueError):
+            self._manifest = {}
+        live = {e[2] for e in self._manifest.values() if e[2]}
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.txt') and name[:-4] not in live:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def _save_manifest(self, force=False):
+        with self._lock:
+            if self._dirty_since is None or (not force and _time.time() - self._dirty_since < 10
+                                             and not self._queue.empty()):
+                return
+            snapshot = dict(self._manifest)
+            self._dirty_since = None
+        tmp = os.path.join(self.cache_dir, 'manifest.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp, os.path.join(self.cache_dir, 'manifest.json'))
+
+    # ── extraction ──
+    def _spawn(self, ctx):
+        parent, child = ctx.Pipe()
+        proc = ctx.Process(target=_extract_worker, args=(child,), daemon=True)
+        proc.start()
+        child.close()
+        return proc, parent
+
+    def _supervise(self):
+        ctx = multiprocessing.get_context('spawn')
+        worker = [None, None]  # this thread's (process, pipe)
+        while True:
+            rel = self._queue.get()
+            with self._lock:
+                self._queued.discard(rel)
+            try:
+                self._process(ctx, worker, rel)
+            except Exception as e:  # one bad file (disk full, locked cache) must not stop extraction
+                self.stats['failed'] += 1
+                print(f'  [Text] {rel}: {e}')
+
+    def _process(self, ctx, worker, rel):
+        """Bring one queued path up to date: extract, reuse or drop it."""
+        full = os.path.join(ROOT, rel)
+        try:
+            st = os.stat(full) if ARTIFACTS.get(rel) else None
+        except OSError:
+            st = None
+        if st is None:
+            self._drop(rel)
+            return
+        if st.st_size > self.MAX_BYTES:
+            return
+        known = self._manifest.get(rel)
+        if known and known[:2] == [st.st_size, st.st_mtime_ns]:
+            h = known[2]
+            if h is None:
+                return  # failed before; retried once the file changes
+        else:
+            h = _file_hash(full)
+            if h is None:
+                return
+        if h and os.path.exists(self._cache_file(h)):
+            self.stats['cached'] += 1
+            self._record(rel, st, h)
+            return
+        proc, conn = worker
+        if proc is None or not proc.is_alive():
+            worker[:] = proc, conn = self._spawn(ctx)
+        try:
+            conn.send((full, os.path.splitext(rel)[1].lower()))
+            if conn.poll(self.timeout):
+                ok, text = conn.recv()
+            else:
+                ok, text = False, 'timeout'
+                self.stats['timeouts'] += 1
+                proc.kill()
+                proc.join()
+                worker[0] = None
+        except (EOFError, OSError) as e:
+            ok, text = False, str(e)
+            worker[0] = None
+        if not ok:
+            self.stats['failed'] += 1
+            self._record(rel, st, None)
+            return
+        with open(self._cache_file(h), 'w', encoding='utf-8') as f:
+            f.write(text[:self.MAX_CHARS])
+        self.stats['extracted'] += 1
+        self._record(rel, st, h)
+
+    def _record(self, rel, st, h):
+        with self._lock:
+            self._manifest[rel] = [st.st_size, st.st_mtime_ns, h]
+            if self._dirty_since is None:
+                self._dirty_since = _time.time()
+        if self._docs.get(rel) != h:
+            self._unindex(rel)
+            if h:
+                self._index(rel, h)
+        self._save_manifest()
+
+    # ── token index ──
+    def _read(self, h):
+        try:
+            with open(self._cache_file(h), encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return ''
+
+    @staticmethod
+    def tokens(text):
+        return set(re.findall(r'\w{2,32}', text.lower()))
+
+    def _index(self, rel, h):
+        toks = self.tokens(self._read(h))
+        with self._lock:
+            self._docs[rel] = h
+            for t in toks:
+                self._post.setdefault(t, set()).add(rel)
+
+    def _unindex(self, rel):
+        h = self._docs.get(rel)
+        if h is None:
+            return
+        toks = self.tokens(self._read(h))
+        with self._lock:
+            self._docs.pop(rel, None)
+            for t in toks:
+                ps = self._post.get(t)
+                if ps is not None:
+                    ps.discard(rel)
+                    if not ps:
+                        del self._post[t]
+
+    def _drop(self, rel):
+        self._unindex(rel)
+        with self._lock:
+            if self._manifest.pop(rel, None) and self._dirty_since is None:
+                self._dirty_since = _time.time()
+
+    def search(self, q, limit=20):
+        """Artifacts containing every word of `q`, newest first, with a snippet."""
+        terms = sorted(self.tokens(q), key=len, reverse=True)
+        if not terms:
+            return []
+        with self._lock:
+            sets = sorted((self._post.get(t, set()) for t in terms), key=len)
+            hits = set(sets[0]).intersection(*sets[1:])
+            docs = {p: self._docs[p] for p in hits}
+        arts = [ARTIFACTS.get(p) for p in hits]
+        arts = heapq.nlargest(limit, (a for a in arts if a), key=lambda a: a.ts)
+        results = []
+        for a in arts:
+            text = self._read(docs[a.path])
+            i = text.lower().find(terms[0])
+            snippet = ' '.join(text[max(0, i - 60):i + 100].split()) if i >= 0 else ''
+            results.append({'name': a.name, 'path': a.path, 'icon': a.icon, 'snippet': snippet})
+        return results
+
+TEXTS = TextIndex(
+    os.path.join(CACHE_DIR, 'text'),
+    workers=PORTAL_CFG.get('extract_workers', max(1, min(4, (os.cpu_count() or 2) // 2))),
+    timeout=PORTAL_CFG.get('extract_timeout_seconds', 30),
+)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# KNOWLEDGE BASE SEARCH — section-level BM25
+# ═══════════════════════════════════════════════════════════════════════════
+def _anchor(heading):
+    """GitHub-style heading anchor."""
+    return re.sub(r'[\s]+', '-', re.sub(r'[^\w\s-]', '', heading.strip().lower()))
+
+class KBIndex:
+    """BM25 index over Knowledge_Base markdown, one chunk per ##/### section
+    plus one per table row, so hits point at the exact section and line.
+
+    Files are re-chunked individually when their mtime or size changes;
+    corpus statistics are adjusted in place, never rebuilt.
+    """
+
+    K1, B = 1.2, 0.75
+    _TOKEN = re.compile(r'\w+')
+
+    def __init__(self, folder):
+        self.folder = folder
+        self._files = {}   # name → ((mtime_ns, size), [chunk ids])
+        self._chunks = {}  # id → {file, heading, anchor, line, text, len}
+        self._post = {}    # term → {chunk id: tf}
+        self._total_len = 0
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _chunk(self, name, txt):
+        """Split one markdown file into section and table-row chunks."""
+        out = []
+        heading, anchor, start, body, header = name[:-3].replace('_', ' '), '', 1, [], None
+        def flush():
+            if body:
+                out.append((heading, anchor, start, '\n'.join(body)))
+        for n, line in enumerate(txt.split('\n'), 1):
+            s = line.strip()
+            m = re.match(r'^#{1,3}\s+(.+)', s)
+            if m:
+                flush()
+                heading, anchor, start, body, header = m.group(1).strip(), _anchor(m.group(1)), n, [], None
+                continue
+            if s.startswith('|'):
+                cells = [c.strip() for c in s.strip('|').split('|')]
+                if all(re.match(r'^:?-+:?$', c) for c in cells if c):
+                    continue
+                if header is None:
+                    header = cells
+                    continue
+                row = ' · '.join(f'{h}: {c}' if h else c for h, c in zip(header, cells) if c)
+                out.append((heading, anchor, n, row))
+                continue
+            header = None
+            if s:
+                body.append(s)
+        flush()
+        return out
+
+    def _add(self, name, fp):
+        ids = []
+        with open(fp, 'rb') as f:
+            raw = f.read()
+        # Windows PowerShell's Out-File writes UTF-16 with a BOM
+        txt = (raw.decode('utf-16') if raw[:2] in (b'\xff\xfe', b'\xfe\xff')
+               else raw.decode('utf-8-sig', errors='replace'))
+        for heading, anchor, line, text in self._chunk(name, txt):
+            terms = self._TOKEN.findall(f'{heading} {text}'.lower())
+            if not terms:
+                continue
+            cid = self._next_id
+            self._next_id += 1
+            self._chunks[cid] = {'file': name, 'heading': heading, 'anchor': anchor,
+                                 'line': line, 'text': text, 'len': len(terms)}
+            self._total_len += len(terms)
+            for t in terms:
+                post = self._post.setdefault(t, {})
+                post[cid] = post.get(cid, 0) + 1
+            ids.append(cid)
+        return ids
+
+    def _remove(self, ids):
+        for cid in ids:
+            ch = self._chunks.pop(cid)
+            self._total_len -= ch['len']
+            for t in set(self._TOKEN.findall(f"{ch['heading']} {ch['text']}".lower())):
+                post = self._post.get(t)
+                if post is not None:
+                    post.pop(cid, None)
+                    if not post:
+                        del self._post[t]
+
+    def refresh(self):
+        """Re-chunk files whose (mtime, size) changed; drop deleted files."""
+        try:
+            entries = {e.name: e for e in os.scandir(self.folder)
+                       if e.name.endswith('.md') and e.is_file()}
+        except OSError:
+            entries = {}
+        for name in [n for n in self._files if n not in entries]:
+            self._remove(self._files.pop(name)[1])
+        for name, e in entries.items():
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            fp = (st.st_mtime_ns, st.st_size)
+            known = self._files.get(name)
+            if known and known[0] == fp:
+                continue
+            if known:
+                self._remove(self._files.pop(name)[1])
+            try:
+                self._files[name] = (fp, self._add(name, e.path))
+            except (OSError, ValueError):
+                pass  # retried once the file changes again
+
+    def search(self, q, limit=10):
+        """Top chunks for `q` by BM25 → [{file, heading, anchor, line, snippet, score}]."""
+        terms = self._TOKEN.findall(q.lower())
+        with self._lock:
+            self.refresh()
+            n = len(self._chunks)
+            if not terms or not n:
+                return []
+            avgdl = self._total_len / n
+            scores = {}
+            for t in set(terms):
+                post = self._post.get(t)
+                if not post:
+                    continue
+                idf = math.log(1 + (n - len(post) + 0.5) / (len(post) + 0.5))
+                for cid, tf in post.items():
+                    dl = self._chunks[cid]['len']
+                    scores[cid] = scores.get(cid, 0.0) + idf * tf * (self.K1 + 1) / (
+                        tf + self.K1 * (1 - self.B + self.B * dl / avgdl))
+            top = heapq.nlargest(limit, scores.items(), key=lambda kv: kv[1])
+            return [{'file': self._chunks[cid]['file'], 'heading': self._chunks[cid]['heading'],
+                     'anchor': self._chunks[cid]['anchor'], 'line': self._chunks[cid]['line'],
+                     'snippet': self._chunks[cid]['text'][:240], 'score': round(sc, 3)}
+                    for cid, sc in top]
+
+KB_INDEX = KBIndex(KB)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# JOBS — managed /action subprocesses
+# ═══════════════════════════════════════════════════════════════════════════
+_PY_EXE = os.path.join(ROOT, '.venv', 'Scripts', 'python.exe')
+if not os.path.exists(_PY_EXE):
+    _PY_EXE = 'python'
+
+def _ps(script, *args):
+    return ['powershell', '-NoProfile', '-File', os.path.join(AUTO, script), *args]
+
+# name → cmd, redirect, invalidates (cache tags dropped when the job ends;
+# None = everything), group (jobs sharing a group share its concurrency
+# limit), timeout in seconds
+ACTIONS = {
+    'pipeline': {'cmd': _ps('daily_orchestrator.ps1', '-Force'), 'redirect': '/',
+                 'invalidates': None, 'group': 'orchestrator', 'timeout': 3600},
+    'cleanup': {'cmd': _ps('cleanup.ps1'), 'redirect': '/',
+                'invalidates': ('signals',), 'timeout': 600},
+    'snapshot': {'cmd': _ps('weekly_snapshot.ps1'), 'redirect': '/', 'timeout': 900},
+    'gen-metrics': {'cmd': [_PY_EXE, os.path.join(AUTO, 'calculate_metrics.py')], 'redirect': '/tools',
+                    'timeout': 600},
+    'fetch-emails': {'cmd': _ps('fetch_emails.ps1'), 'redirect': '/',
+                     'invalidates': ('emails',), 'timeout': 600},
+    'fetch-calendar': {'cmd': _ps('fetch_calendar.ps1'), 'redirect': '/',
+                       'invalidates': ('calendar',), 'timeout': 600},
+    'sync-instructions': {'cmd': _ps('sync_instructions.ps1'), 'redirect': '/tools', 'timeout': 300},
+    'dryrun': {'cmd': _ps('daily_orchestrator.ps1', '-DryRun', '-Force'), 'redirect': '/tools',
+               'group': 'orchestrator', 'timeout': 1800},
+}
+
+class Job:
+    """One run of an action: its process, state and recent output."""
+
+    def __init__(self, jid, action, spec, log_path):
+        self.id = jid
+        self.action = action
+        self.cmd = list(spec['cmd'])
+        self.group = spec.get('group', action)
+        self.timeout = spec.get('timeout')
+        self.invalidates = spec.get('invalidates', ())
+        self.redirect = spec.get('redirect', '/')
+        self.log_path = log_path
+        self.state = 'queued'  # queued → running → done | failed | timeout | error
+        self.timed_out = False
+        self.created = _time.time()
+        self.started = self.finished = None
+        self.returncode = None
+        self.proc = None
+        self.lines = collections.deque(maxlen=2000)  # (seq, text) — recent output for the tail view
+        self.seq = 0
+
+    @property
+    def active(self):
+        return self.state in ('queued', 'running')
+
+    def to_dict(self):
+        return {'id': self.id, 'action': self.action, 'state': self.state, 'group': self.group,
+                'created': self.created, 'started': self.started, 'finished': self.finished,
+                'returncode': self.returncode, 'lines': self.seq,
+                'log': os.path.relpath(self.log_path, ROOT).replace(os.sep, '/')}
+
+class JobManager:
+    """Owns /action child processes.
+
+    Output (stdout + stderr) is pumped line by line into a size-rotated log
+    per job and a ring buffer for the live tail, so pipes never fill. A job
+    for an action already queued or running is not started again; each
+    group runs at most `limit` jobs at once and queues the rest. Jobs past
+    their timeout are killed with their process tree, and caches are
+    invalidated when a job ends, once its output files are written.
+    """
+
+    def __init__(self, log_dir, limit=1, max_log_bytes=1024 * 1024, history=50):
+        self.log_dir = log_dir
+        self.limit = limit
+        self.max_log_bytes = max_log_bytes
+        self.history = history
+        self._jobs = collections.OrderedDict()  # id → Job, oldest first
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, action):
+        """Queue `action` → (job, created). Returns the in-flight job instead
+        if one exists for the same action."""
+        spec = ACTIONS[action]
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if job.active and job.action == action:
+                    return job, False
+            jid = f'{datetime.now():%Y%m%d-%H%M%S}-{next(self._ids)}'
+            job = Job(jid, action, spec, os.path.join(self.log_dir, f'{jid}_{action}.log'))
+            self._jobs[jid] = job
+            self._trim()
+            self._schedule()
+        return job, True
+
+    def get(self, jid):
+        with self._lock:
+            return self._jobs.get(jid)
+
+    def jobs(self):
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def running(self):
+        with self._lock:
+            return sum(1 for j in self._jobs.values() if j.state == 'running')
+
+    def tail(self, job, after=0):
+        """Output lines with sequence number > after → (lines, last seq)."""
+        with self._lock:
+            lines = [t for s, t in job.lines if s > after]
+            return lines, job.seq
+
+    def _trim(self):
+        finished = [j for j in self._jobs.values() if not j.active]
+        for job in finished[:max(0, len(self._jobs) - self.history)]:
+            del self._jobs[job.id]
+
+    def _schedule(self):
+        """Start queued jobs whose group has a free slot (lock held)."""
+        busy = collections.Counter(j.group for j in self._jobs.values() if j.state == 'running')
+        for job in self._jobs.values():
+            if job.state == 'queued' and busy[job.group] < self.limit:
+                busy[job.group] += 1
+                job.state = 'running'
+                job.started = _time.time()
+                threading.Thread(target=self._run, args=(job,), name=f'job-{job.id}', daemon=True).start()
+
+    def _run(self, job):
+        log = timer = None
+        state = 'error'  # unless the child runs to completion
+        try:
+            os.makedirs(self.log_dir, exist_ok=True)
+            log = open(job.log_path, 'ab')
+            try:
+                job.proc = subprocess.Popen(
+                    job.cmd, cwd=ROOT, stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
+                    start_new_session=os.name != 'nt',
+                )
+            except OSError as e:
+                self._emit(job, log, f'[{PORTAL_NAME}] could not start {job.cmd[0]}: {e}')
+                return
+            if job.timeout:
+                timer = threading.Timer(job.timeout, self._expire, args=(job,))
+                timer.daemon = True
+                timer.start()
+            for raw in job.proc.stdout:
+                log = self._emit(job, log, raw.decode('utf-8', errors='replace').rstrip('\r\n'))
+            job.proc.stdout.close()
+            job.returncode = job.proc.wait()
+            if job.timed_out:
+                self._emit(job, log, f'[{PORTAL_NAME}] killed after {job.timeout}s')
+            state = 'timeout' if job.timed_out else 'done' if job.returncode == 0 else 'failed'
+        except Exception as e:
+            # Log write/rotate or pipe read failed: stop the child, end the job
+            print(f'  [Jobs] {job.id} {job.action} aborted: {e}')
+            with self._lock:
+                job.seq += 1
+                job.lines.append((job.seq, f'[{PORTAL_NAME}] job aborted: {e}'))
+            if job.proc is not None and job.proc.poll() is None:
+                _kill_tree(job.proc)
+                try:
+                    job.returncode = job.proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
+        finally:
+            if timer:
+                timer.cancel()
+            if log:
+                try:
+                    log.close()
+                except OSError:
+                    pass
+            self._finish(job, state)
+
+    def _emit(self, job, log, text):
+        """Record one output line; rotates the job's log past max_log_bytes."""
+        with self._lock:
+            job.seq += 1
+            job.lines.append((job.seq, text))
+        log.write(text.encode('utf-8') + b'\n')
+        log.flush()
+        if log.tell() > self.max_log_bytes:
+            log.close()
+            os.replace(job.log_path, job.log_path + '.1')
+            log = open(job.log_path, 'ab')
+        return log
+
+    def _expire(self, job):
+        if job.state == 'running':
+            job.timed_out = True
+            _kill_tree(job.proc)
+
+    def _finish(self, job, state):
+        with self._lock:
+            job.state = state
+            job.finished = _time.time()
+            self._schedule()
+        # Outputs are complete now — drop what derives from them
+        if job.invalidates is None:
+            CACHE.clear()
+        elif job.invalidates:
+            _invalidate(tags=job.invalidates)
+        FEED.publish(('jobs', '*') if job.invalidates is None else ('jobs',) + tuple(job.invalidates))
+
+    def shutdown(self):
+        """Kill running jobs (server exit)."""
+        for job in self.jobs():
+            if job.state == 'running' and job.proc is not None:
+                _kill_tree(job.proc)
+
+    def prune_logs(self, keep=200):
+        """Delete all but the newest `keep` job logs."""
+        try:
+            files = sorted((e for e in os.scandir(self.log_dir) if e.is_file()),
+                           key=lambda e: e.stat().st_mtime, reverse=True)
+        except OSError:
+            return
+        for e in files[keep:]:
+            try:
+                os.remove(e.path)
+            except OSError:
+                pass
+
+def _kill_tree(proc):
+    """Kill a job's process and everything it spawned."""
+    try:
+        if os.name == 'nt':
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                           capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+JOBS = JobManager(os.path.join(AUTO, 'logs', 'jobs'),
+                  limit=PORTAL_CFG.get('jobs_per_group', 1),
+                  max_log_bytes=PORTAL_CFG.get('job_log_mb', 1) * 1024 * 1024,
+                  history=PORTAL_CFG.get('job_history', 50))
+METRICS.gauge('brain_action_processes_running', 'Action subprocesses still running.', JOBS.running)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CSS — Fluent 2 Dark Theme (with light mode toggle)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -419,6 +2855,11 @@ main { flex: 1; padding: 24px 32px; max-width: 1200px; overflow-y: auto; }
 .brief-body th { background: var(--surface2); padding: 8px 12px; text-align: left; font-weight: 600; font-size: 12px; }
 .brief-body td { padding: 6px 12px; border-bottom: 1px solid var(--border); }
 .brief-body code { background: var(--surface2); padding: 1px 6px; border-radius: 4px; font-size: 12px; }
+.brief-body pre { background: var(--surface2); padding: 12px; border-radius: 6px; overflow-x: auto; margin: 10px 0; }
+.brief-body pre code { background: none; padding: 0; }
+.brief-body blockquote { border-left: 3px solid var(--accent); padding-left: 12px; color: var(--text2); margin: 8px 0; }
+.brief-body hr { border: none; border-top: 1px solid var(--border); margin: 16px 0; }
+.brief-body li input[type=checkbox] { margin-right: 6px; }
 
 /* Project detail */
 .proj-detail { background: var(--surface); border-radius: var(--radius); padding: 24px; }
@@ -438,6 +2879,10 @@ main { flex: 1; padding: 24px 32px; max-width: 1200px; overflow-y: auto; }
 .artifact-row .a-name { flex: 1; }
 .artifact-row .a-date { color: var(--text3); font-size: 12px; min-width: 120px; }
 .artifact-row .a-size { color: var(--text3); font-size: 12px; min-width: 60px; text-align: right; }
+.file-filters { display: flex; flex-wrap: wrap; gap: 6px; align-items: center; margin-bottom: 8px; }
+.file-filters select, .file-filters input { padding: 4px 8px; background: var(--surface); border: 1px solid var(--border); border-radius: var(--radius-sm); color: var(--text); font-size: 12px; }
+.file-pager { padding: 10px; font-size: 12px; text-align: right; }
+.job-log { background: var(--surface); border: 1px solid var(--border); border-radius: var(--radius); padding: 12px 16px; font-size: 12px; line-height: 1.5; max-height: 70vh; overflow: auto; white-space: pre-wrap; word-break: break-all; }
 
 /* Tools */
 .tool-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(250px, 1fr)); gap: 12px; }
@@ -475,8 +2920,7 @@ main { flex: 1; padding: 24px 32px; max-width: 1200px; overflow-y: auto; }
 # ═══════════════════════════════════════════════════════════════════════════
 # JAVASCRIPT
 # ═══════════════════════════════════════════════════════════════════════════
-GLOBAL_JS = """<script>
-(function(){
+GLOBAL_JS = """(function(){
   // Theme toggle
   const saved = localStorage.getItem('brain-theme');
   if (saved) document.documentElement.setAttribute('data-theme', saved);
@@ -504,7 +2948,7 @@ GLOBAL_JS = """<script>
           .then(items => {
             if (!items.length) { sd.style.display = 'none'; return; }
             sd.innerHTML = items.slice(0, 8).map(i =>
-              '<a href="/open?path=' + encodeURIComponent(i.path) + '" style="display:block;padding:6px 10px;font-size:12px;color:var(--text);border-bottom:1px solid var(--border)">' +
+              '<a href="/file/' + i.path.split('/').map(encodeURIComponent).join('/') + '" style="display:block;padding:6px 10px;font-size:12px;color:var(--text);border-bottom:1px solid var(--border)">' +
               i.icon + ' ' + i.name + '</a>'
             ).join('');
             sd.style.display = 'block';
@@ -516,27 +2960,118 @@ GLOBAL_JS = """<script>
     });
   }
 
-  // Auto-refresh every 5 min
-  if (location.pathname === '/' || location.pathname === '/brief') {
-    setTimeout(function() { location.reload(); }, 300000);
-  }
-
-  // Collapsible sections
-  document.querySelectorAll('.section-toggle').forEach(function(btn) {
-    btn.addEventListener('click', function() {
-      const target = document.getElementById(btn.getAttribute('data-target'));
-      if (target) {
-        target.style.display = target.style.display === 'none' ? 'block' : 'none';
-        btn.textContent = target.style.display === 'none' ? '▶' : '▼';
-      }
-    });
+  // Collapsible sections (delegated: sections are replaced by live updates)
+  document.addEventListener('click', function(e) {
+    const btn = e.target.closest('.section-toggle');
+    if (!btn) return;
+    const target = document.getElementById(btn.getAttribute('data-target'));
+    if (target) {
+      target.style.display = target.style.display === 'none' ? 'block' : 'none';
+      btn.textContent = target.style.display === 'none' ? '▶' : '▼';
+    }
   });
 
   // Last updated
   const lu = document.getElementById('last-updated');
-  if (lu) lu.textContent = 'Updated: ' + new Date().toLocaleTimeString();
+  const stamp = function() { if (lu) lu.textContent = 'Updated: ' + new Date().toLocaleTimeString(); };
+  stamp();
+
+  // Live updates: the change feed names what changed; re-fetch only the
+  // [data-live] sections subscribed to those topics
+  const live = document.querySelectorAll('[data-live]');
+  if (live.length && window.EventSource) {
+    const ls = document.getElementById('live-status');
+    const es = new EventSource('/events?since=' + (document.body.getAttribute('data-version') || '0'));
+    es.onopen = function() { if (ls) ls.textContent = 'Live updates'; };
+    es.onerror = function() { if (ls) ls.textContent = 'Reconnecting…'; };
+    es.addEventListener('change', function(e) {
+      const topics = JSON.parse(e.data).topics;
+      if (topics.indexOf('*') >= 0) { location.reload(); return; }
+      live.forEach(function(el) {
+        if (!el.getAttribute('data-topics').split(' ').some(t => topics.indexOf(t) >= 0)) return;
+        fetch(el.getAttribute('data-live'), {cache: 'no-cache'})
+          .then(r => r.ok ? r.text() : Promise.reject(r.status))
+          .then(html => { el.innerHTML = html; stamp(); })
+          .catch(function() {});
+      });
+    });
+  }
 })();
-</script>"""
+"""
+
+# ═══════════════════════════════════════════════════════════════════════════
+# STATIC ASSETS — content-hashed CSS/JS/favicon and response compression
+# ═══════════════════════════════════════════════════════════════════════════
+try:
+    import brotli  # optional: preferred over gzip when installed
+except ImportError:
+    brotli = None
+
+COMPRESS = PORTAL_CFG.get('compress', True)
+COMPRESS_MIN = 1024  # smaller bodies aren't worth the CPU
+_COMPRESSIBLE = ('text/', 'application/json', 'application/javascript', 'image/svg+xml')
+
+def compress(body, encoding, best=False):
+    """`body` encoded as 'br' or 'gzip'; `best` spends more CPU (static files)."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=11 if best else 5)
+    return gzip.compress(body, compresslevel=9 if best else 6, mtime=0)
+
+def negotiate(accept_encoding):
+    """Best encoding the client accepts ('br', 'gzip' or None for identity)."""
+    offered = {}
+    for part in (accept_encoding or '').lower().split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip()] = q
+    for enc in ('br', 'gzip'):
+        if enc == 'br' and brotli is None:
+            continue
+        if offered.get(enc, offered.get('*', 0)) > 0:
+            return enc
+    return None
+
+class StaticAsset:
+    """A file served from a URL that embeds its content hash, so browsers
+    may cache it forever; every encoding is compressed once, up front."""
+
+    def __init__(self, name, body, ctype):
+        self.ctype = ctype
+        self.digest = hashlib.sha1(body).hexdigest()[:12]
+        stem, ext = os.path.splitext(name)
+        self.url = f'/static/{stem}.{self.digest}{ext}'
+        self.variants = {None: body}
+        if COMPRESS:
+            for enc in ('br', 'gzip') if brotli else ('gzip',):
+                packed = compress(body, enc, best=True)
+                if len(packed) < len(body):
+                    self.variants[enc] = packed
+
+    def variant(self, accept_encoding):
+        """(encoding, body) for a request's Accept-Encoding."""
+        enc = negotiate(accept_encoding) if COMPRESS else None
+        return (enc, self.variants[enc]) if enc in self.variants else (None, self.variants[None])
+
+STATIC = {}  # url → StaticAsset
+
+def static_asset(name, text, ctype):
+    """Register a static asset; returns its URL."""
+    asset = StaticAsset(name, text.encode('utf-8'), ctype)
+    STATIC[asset.url] = asset
+    return asset.url
+
+FAVICON_SVG = ('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 20 20">'
+               '<circle cx="10" cy="10" r="8" fill="none" stroke="#0078D4" stroke-width="2"/>'
+               '<circle cx="10" cy="10" r="4" fill="#0078D4"/></svg>')
+
+CSS_URL = static_asset('brain.css', CSS, 'text/css; charset=utf-8')
+JS_URL = static_asset('brain.js', GLOBAL_JS, 'application/javascript; charset=utf-8')
+FAVICON_URL = static_asset('favicon.svg', FAVICON_SVG, 'image/svg+xml')
 
 # ═══════════════════════════════════════════════════════════════════════════
 # HTML RENDERING
@@ -544,14 +3079,18 @@ GLOBAL_JS = """<script>
 
 def nav_html(active='home'):
     """Render sidebar navigation."""
-    actions = parse_actions()
+    with stage('nav'):
+        actions = parse_actions()
     urg_count = len(actions.get('urgent', []))
     badge = f'<span class="badge">{urg_count}</span>' if urg_count > 0 else ''
+    running = JOBS.running()
+    jobs_badge = f'<span class="badge">{running}</span>' if running else ''
 
     items = [
         ('home', '/', 'home', 'Command Center', ''),
         ('brief', '/brief', 'document', 'Daily Brief', badge),
         ('tools', '/tools', 'wrench', 'Tools & Files', ''),
+        ('jobs', '/jobs', 'play', 'Jobs', jobs_badge),
     ]
 
     # Generic brain icon
@@ -587,30 +3126,54 @@ def nav_html(active='home'):
     return nav
 
 def html_page(title, body, active='home'):
-    """Wrap body in full HTML page."""
-    # Generic favicon (target/bullseye icon)
-    favicon = '<link rel="icon" href="data:image/svg+xml,<svg xmlns=\'http://www.w3.org/2000/svg\' viewBox=\'0 0 20 20\'><circle cx=\'10\' cy=\'10\' r=\'8\' fill=\'none\' stroke=\'%230078D4\' stroke-width=\'2\'/><circle cx=\'10\' cy=\'10\' r=\'4\' fill=\'%230078D4\'/></svg>">'
-    footer = '<div class="footer"><span id="last-updated"></span> · Auto-refreshes every 5 min</div>'
+    """Wrap body in full HTML page (styles and script are cached /static files)."""
+    footer = '<div class="footer"><span id="last-updated"></span> · <span id="live-status">Live updates</span></div>'
     return f"""<!DOCTYPE html>
 <html lang="en"><head><meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1.0">
-{favicon}<title>{esc(title)} — {PORTAL_NAME}</title><style>{CSS}</style></head>
-<body><div class="app">{nav_html(active)}<main>{body}{footer}</main></div>{GLOBAL_JS}</body></html>"""
+<link rel="icon" href="{FAVICON_URL}" type="image/svg+xml"><link rel="stylesheet" href="{CSS_URL}">
+<title>{esc(title)} — {PORTAL_NAME}</title></head>
+<body data-version="{FEED.version}"><div class="app">{nav_html(active)}<main>{body}{footer}</main></div><script src="{JS_URL}"></script></body></html>"""
 
 # ───────────────────────────────────────────────────────────────────────────
 # HOME — The one-page command center
 # ───────────────────────────────────────────────────────────────────────────
-def render_home():
-    """The single command center page. Everything a PM needs at a glance."""
+def _is_today(date_str):
+    return not date_str or date_str == datetime.now().strftime('%Y-%m-%d')
+
+def calendar_data(date_str=None):
+    """Calendar for a day; today's is cached (see WATCH_RULES)."""
+    with stage('cal'):
+        if _is_today(date_str):
+            return _cached('cal', parse_calendar, ttl=120, tags=('calendar', 'signals'))
+        return parse_calendar(date_str)
+
+def actions_data():
+    with stage('actions'):
+        return _cached('actions', parse_actions, ttl=120, tags=('actions',))
+
+def emails_data(date_str=None):
+    """Emails for a day; today's are cached."""
+    with stage('emails'):
+        if _is_today(date_str):
+            return _cached('emails', parse_emails, ttl=120, tags=('emails', 'signals'))
+        return parse_emails(date_str)
+
+def signal_counts_data(date_str=None):
+    with stage('sig_counts'):
+        if _is_today(date_str):
+            return _cached('sig_counts', parse_signal_counts, ttl=120, tags=('signals',))
+        return parse_signal_counts(date_str)
+
+def _home_data(date_str=None):
+    """Parsed inputs of the home page for a day (today by default)."""
+    return {'cal': calendar_data(date_str), 'actions': actions_data(),
+            'emails': emails_data(date_str), 'sig_counts': signal_counts_data(date_str)}
+
+def _home_header(d):
     today = datetime.now()
     date_str = today.strftime('%Y-%m-%d')
     day_str = today.strftime('%A, %B %d, %Y')
 
-    # Gather all data
-    cal = _cached('cal', parse_calendar, ttl=120)
-    actions = _cached('actions', parse_actions, ttl=120)
-    emails_data = _cached('emails', parse_emails, ttl=120)
-    sig_counts = _cached('sig_counts', parse_signal_counts, ttl=120)
-
     # Pipeline status
     log_path = os.path.join(AUTO, 'logs', f'{date_str}.log')
     pipeline_ran = os.path.exists(log_path)
@@ -618,19 +3181,19 @@ def render_home():
 
     greeting = 'morning' if today.hour < 12 else 'afternoon' if today.hour < 17 else 'evening'
 
-    html = f'''
+    return f'''
     <div class="page-header">
       <h1>Good {greeting}, {esc(PM_NAME)}</h1>
       <div class="subtitle">{day_str} · Pipeline {pipeline_badge}</div>
     </div>'''
 
-    # ── SECTION 1: KPI Summary ──
+def _home_kpis(d):
+    cal, actions, em, sig_counts = d['cal'], d['actions'], d['emails'], d['sig_counts']
     total_signals = sum(sig_counts.values())
     urgent_count = len(actions.get('urgent', []))
     meeting_count = len(cal.get('meetings', []))
-    email_count = len(emails_data.get('emails', []))
-
-    html += f'''
+    email_count = len(em.get('emails', []))
+    return f'''
     <div class="section">
       <div class="section-title">{icon('trending', 14)} Today at a Glance</div>
       <div class="kpi-strip">
@@ -662,13 +3225,14 @@ def render_home():
       </div>
     </div>'''
 
-    # ── SECTION 2: Today's Calendar ──
+def _home_calendar(d):
+    cal = d['cal']
     meetings = cal.get('meetings', [])
     free_slots = cal.get('free', [])
     ext_count = sum(1 for m in meetings if m['type'] == 'external')
     focus_count = sum(1 for m in meetings if m['type'] == 'focus')
 
-    html += f'''
+    html = f'''
     <div class="section">
       <div class="section-title">{icon('calendar', 14)} Today's Calendar
         <span style="font-size:11px;font-weight:400;color:var(--text2);text-transform:none">{len(meetings)} meetings · {ext_count} external · {focus_count} focus · {len(free_slots)} free slots</span>
@@ -689,21 +3253,24 @@ def render_home():
         html += '<div style="padding:12px;color:var(--text3);font-size:13px">No calendar data. <a href="/action?cmd=fetch-calendar">Fetch now</a></div>'
 
     html += '</div></div>'
+    return html
 
-    # ── SECTION 3: Action Items ──
+def _home_actions(d):
+    actions = d['actions']
     urgent = actions.get('urgent', [])
     medium = actions.get('medium', [])
 
-    if urgent or medium:
-        html += f'''
+    if not (urgent or medium):
+        return ''
+    html = f'''
     <div class="section">
       <div class="section-title">{icon('bolt', 14)} Action Items
         <span style="font-size:11px;font-weight:400;color:var(--text2);text-transform:none">{len(urgent)} urgent · {len(medium)} medium</span>
       </div>
       <div class="action-list">'''
 
-        for item in urgent[:8]:
-            html += f'''
+    for item in urgent[:8]:
+        html += f'''
         <div class="action-item">
           <span class="a-dot dot-red"></span>
           <span class="a-text">{esc(item["text"][:120])}</span>
@@ -711,8 +3278,8 @@ def render_home():
           <span class="a-owner">{esc(item["owner"][:30])}</span>
         </div>'''
 
-        for item in medium[:5]:
-            html += f'''
+    for item in medium[:5]:
+        html += f'''
         <div class="action-item">
           <span class="a-dot dot-yellow"></span>
           <span class="a-text">{esc(item["text"][:120])}</span>
@@ -720,17 +3287,19 @@ def render_home():
           <span class="a-owner">{esc(item["owner"][:30])}</span>
         </div>'''
 
-        html += '</div></div>'
+    html += '</div></div>'
+    return html
 
-    # ── SECTION 4: Charter Areas ──
-    if PROJECTS:
-        html += f'''
+def _home_projects(d):
+    if not PROJECTS:
+        return ''
+    html = f'''
     <div class="section">
       <div class="section-title">{icon('grid', 14)} Charter Areas</div>
       <div class="proj-grid">'''
 
-        for slug, proj in PROJECTS.items():
-            html += f'''
+    for slug, proj in PROJECTS.items():
+        html += f'''
         <a class="proj-tile" href="/project/{slug}">
           <h4 style="color:{proj['color']}">{esc(proj['name'])}</h4>
           <div class="proj-full">{esc(proj['full'])}</div>
@@ -738,12 +3307,14 @@ def render_home():
           <div class="proj-bar" style="background:{proj['color']};opacity:0.4"></div>
         </a>'''
 
-        html += '</div></div>'
+    html += '</div></div>'
+    return html
 
-    # ── SECTION 5: Recent Emails (collapsible) ──
-    em = emails_data
-    if em.get('emails'):
-        html += f'''
+def _home_emails(d):
+    em = d['emails']
+    if not em.get('emails'):
+        return ''
+    html = f'''
     <div class="section">
       <div class="section-title">{icon('mail', 14)} Emails Today
         <span style="font-size:11px;font-weight:400;color:var(--text2);text-transform:none">{len(em["emails"])} items · Fetched {em.get("fetched","")}</span>
@@ -751,9 +3322,9 @@ def render_home():
       </div>
       <div id="email-section" style="display:flex;flex-direction:column;gap:4px">'''
 
-        for e in em['emails'][:10]:
-            ch_badge = f'<span class="email-charter">{esc(e["charter"])}</span>' if e.get('charter') else ''
-            html += f'''
+    for e in em['emails'][:10]:
+        ch_badge = f'<span class="email-charter">{esc(e["charter"])}</span>' if e.get('charter') else ''
+        html += f'''
         <div class="email-row">
           <span class="email-time">{esc(e["time"])}</span>
           <span class="email-sender">{esc(e["sender"][:25])}</span>
@@ -761,51 +3332,106 @@ def render_home():
           {ch_badge}
         </div>'''
 
-        html += '</div></div>'
-
-    # ── SECTION 6: Signal Counts (compact) ──
-    if total_signals > 0:
-        parts = []
-        for k, v in sig_counts.items():
-            if v > 0:
-                parts.append(f'{k.replace("_", " ").title()}: {v}')
-        html += f'''
+    html += '</div></div>'
+    return html
+
+def _home_signals(d):
+    sig_counts = d['sig_counts']
+    if sum(sig_counts.values()) == 0:
+        return ''
+    parts = []
+    for k, v in sig_counts.items():
+        if v > 0:
+            parts.append(f'{k.replace("_", " ").title()}: {v}')
+    return f'''
     <div class="section">
       <div class="section-title">{icon('signal', 14)} Today's Signals
         <span style="font-size:11px;font-weight:400;color:var(--text2);text-transform:none">{" · ".join(parts)}</span>
       </div>
     </div>'''
 
+# Home sections: name → (change topics that affect it, renderer). Each is
+# served alone at /fragment/home/<name> so pages refresh only what changed.
+HOME_SECTIONS = {
+    'header': (('jobs',), _home_header),
+    'kpis': (('calendar', 'actions', 'emails', 'signals'), _home_kpis),
+    'calendar': (('calendar', 'signals'), _home_calendar),
+    'actions': (('actions',), _home_actions),
+    'projects': ((), _home_projects),
+    'emails': (('emails', 'signals'), _home_emails),
+    'signals': (('signals',), _home_signals),
+}
+
+def live_section(url, topics, inner):
+    """Wrap `inner` so the page re-fetches it from `url` on matching change events."""
+    if not topics:
+        return inner
+    return f'<div data-live="{esc(url)}" data-topics="{" ".join(topics)}">{inner}</div>'
+
+def render_home_section(name, date_str=None):
+    """One home section's HTML, or None for an unknown name."""
+    sec = HOME_SECTIONS.get(name)
+    return sec[1](_home_data(date_str)) if sec else None
+
+def render_home():
+    """The single command center page. Everything a PM needs at a glance."""
+    d = _home_data()
+    html = ''.join(live_section(f'/fragment/home/{name}', topics, fn(d))
+                   for name, (topics, fn) in HOME_SECTIONS.items())
     return html_page('Command Center', html, 'home')
 
+# ───────────────────────────────────────────────────────────────────────────
+# JSON API — section data under /api/v1/<name> (and /api/<name> for latest)
+# ───────────────────────────────────────────────────────────────────────────
+API_VERSION = 1
+
+def _api_home(date_str):
+    d = _home_data(date_str)
+    return {'calendar': d['cal'], 'actions': d['actions'], 'emails': d['emails'],
+            'signal_counts': d['sig_counts'], 'projects': sorted(PROJECTS)}
+
+# name → (data for a date (None = today), max-age seconds, matching HTML fragment)
+API_SECTIONS = {
+    'home': (_api_home, 30, None),
+    'calendar': (calendar_data, 60, 'calendar'),
+    'actions': (lambda date_str: actions_data(), 120, 'actions'),
+    'emails': (emails_data, 60, 'emails'),
+    'counts': (signal_counts_data, 60, 'signals'),
+}
+
+def api_section(name, date_str=None):
+    """(payload, max_age) for an API section, or None if unknown."""
+    sec = API_SECTIONS.get(name)
+    if not sec:
+        return None
+    data = sec[0](date_str)
+    return {'api': API_VERSION, 'section': name,
+            'date': date_str or datetime.now().strftime('%Y-%m-%d'), 'data': data}, sec[1]
+
 # ───────────────────────────────────────────────────────────────────────────
 # DAILY BRIEF
 # ───────────────────────────────────────────────────────────────────────────
 def render_brief(date_str=None):
     """Render the daily intelligence brief."""
-    if not date_str:
+    if not date_str or not re.fullmatch(r'\d{4}-\d{2}-\d{2}', date_str):
         date_str = datetime.now().strftime('%Y-%m-%d')
 
-    brief_md = parse_brief_md(date_str)
-    if not brief_md:
+    bp = brief_path(date_str)
+    if not bp:
         # Try previous days
         for i in range(1, 4):
             alt = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-            brief_md = parse_brief_md(alt)
-            if brief_md:
+            bp = brief_path(alt)
+            if bp:
                 date_str = alt
                 break
 
-    if not brief_md:
-        body = '''<div class="page-header"><h1>Daily Brief</h1></div>
-        <div style="padding:20px;background:var(--surface);border-radius:var(--radius);color:var(--text3)">
-          No brief found. <a href="/action?cmd=pipeline">Run pipeline</a> to generate.
-        </div>'''
+    if not bp:
+        today = datetime.now().strftime('%Y-%m-%d')
+        body = '<div class="page-header"><h1>Daily Brief</h1></div>' + live_section(
+            f'/fragment/brief?date={today}', ('brief',), render_brief_body(today))
         return html_page('Daily Brief', body, 'brief')
 
-    # Convert markdown to simple HTML
-    brief_html = md_to_html(brief_md)
-
     # Date navigation
     prev_date = (datetime.strptime(date_str, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d')
     next_date = (datetime.strptime(date_str, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
@@ -817,111 +3443,25 @@ def render_brief(date_str=None):
         <a href="/brief?date={prev_date}">← Prev</a> · {date_str} · <a href="/brief?date={next_date}">Next →</a>
       </div>
     </div>
-    <div class="brief-body">{brief_html}</div>'''
+    {live_section(f'/fragment/brief?date={date_str}', ('brief',), render_brief_body(date_str))}'''
 
     return html_page('Daily Brief', body, 'brief')
 
-def md_to_html(md):
-    """Simple markdown to HTML converter."""
-    lines = md.split('\n')
-    html_parts = []
-    in_table = False
-    in_list = False
-    in_code = False
-
-    for line in lines:
-        s = line.rstrip()
-
-        # Code blocks
-        if s.startswith('```'):
-            if in_code:
-                html_parts.append('</code></pre>')
-                in_code = False
-            else:
-                in_code = True
-                html_parts.append('<pre><code>')
-            continue
-        if in_code:
-            html_parts.append(esc(s))
-            continue
-
-        # Close list if not a list line
-        if in_list and not s.startswith('- ') and not s.startswith('* ') and not re.match(r'^\d+\.', s):
-            html_parts.append('</ul>')
-            in_list = False
-
-        # Close table
-        if in_table and '|' not in s:
-            html_parts.append('</table>')
-            in_table = False
-
-        # Headers
-        m = re.match(r'^(#{1,4})\s+(.+)', s)
-        if m:
-            level = len(m.group(1))
-            html_parts.append(f'<h{level}>{esc(m.group(2))}</h{level}>')
-            continue
-
-        # Table
-        if '|' in s and s.strip().startswith('|'):
-            cells = [c.strip() for c in s.split('|')[1:-1]]
-            if all(re.match(r'^[-:]+$', c) for c in cells if c):
-                continue  # separator row
-            if not in_table:
-                html_parts.append('<table>')
-                in_table = True
-                html_parts.append('<tr>' + ''.join(f'<th>{esc(c)}</th>' for c in cells) + '</tr>')
-            else:
-                html_parts.append('<tr>' + ''.join(f'<td>{_inline_md(c)}</td>' for c in cells) + '</tr>')
-            continue
-
-        # Lists
-        if s.startswith('- ') or s.startswith('* '):
-            if not in_list:
-                html_parts.append('<ul>')
-                in_list = True
-            html_parts.append(f'<li>{_inline_md(s[2:])}</li>')
-            continue
-
-        mn = re.match(r'^(\d+)\.\s+(.+)', s)
-        if mn:
-            if not in_list:
-                html_parts.append('<ul>')
-                in_list = True
-            html_parts.append(f'<li>{_inline_md(mn.group(2))}</li>')
-            continue
-
-        # Blockquote
-        if s.startswith('>'):
-            html_parts.append(f'<blockquote style="border-left:3px solid var(--accent);padding-left:12px;color:var(--text2);margin:8px 0">{_inline_md(s[1:].strip())}</blockquote>')
-            continue
-
-        # Horizontal rule
-        if re.match(r'^[-*_]{3,}$', s):
-            html_parts.append('<hr style="border:none;border-top:1px solid var(--border);margin:16px 0">')
-            continue
-
-        # Paragraph
-        if s.strip():
-            html_parts.append(f'<p>{_inline_md(s)}</p>')
-
-    if in_table:
-        html_parts.append('</table>')
-    if in_list:
-        html_parts.append('</ul>')
-    if in_code:
-        html_parts.append('</code></pre>')
-
-    return '\n'.join(html_parts)
+def render_brief_body(date_str):
+    """The brief for `date_str` as HTML (or a placeholder if it doesn't exist yet)."""
+    bp = brief_path(date_str)
+    if not bp:
+        return '''<div style="padding:20px;background:var(--surface);border-radius:var(--radius);color:var(--text3)">
+          No brief found. <a href="/action?cmd=pipeline">Run pipeline</a> to generate.
+        </div>'''
+    # Markdown → HTML, cached per file version
+    with stage('brief'):
+        brief_html = BRIEF_CACHE.get(bp, _render_brief_file)
+    return f'<div class="brief-body">{brief_html}</div>'
 
-def _inline_md(text):
-    """Convert inline markdown (bold, italic, code, links)."""
-    text = esc(text)
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-    text = re.sub(r'`(.+?)`', r'<code>\1</code>', text)
-    text = re.sub(r'~~(.+?)~~', r'<del>\1</del>', text)
-    return text
+def md_to_html(md):
+    """Markdown to HTML (single pass, shared with build_demo_pages)."""
+    return md_render.render(md)
 
 # ───────────────────────────────────────────────────────────────────────────
 # PROJECT DETAIL
@@ -932,7 +3472,8 @@ def render_project(slug):
     if not proj:
         return html_page('Not Found', '<h1>Project not found</h1>')
 
-    arts = _cached(f'arts_{slug}', lambda: scan_artifacts(proj['folder']), ttl=120)
+    with stage('scan'):
+        arts, more = ARTIFACTS.query(folder=proj['folder'], limit=20)
 
     # Metrics
     metrics_html = ''
@@ -954,14 +3495,18 @@ def render_project(slug):
     arts_html = ''
     if arts:
         arts_html = '<h3 style="font-size:14px;margin:16px 0 8px">Artifacts</h3>'
-        for a in arts[:20]:
+        for a in arts:
             arts_html += f'''
-          <a class="artifact-row" href="/open?path={urllib.parse.quote(a['path'])}" style="text-decoration:none;color:var(--text)">
-            {a['icon']}
-            <span class="a-name">{esc(a['name'])}</span>
-            <span class="a-date">{a['modified']}</span>
-            <span class="a-size">{a['size']}</span>
+          <a class="artifact-row" href="/file/{urllib.parse.quote(a.path)}" style="text-decoration:none;color:var(--text)">
+            {a.icon}
+            <span class="a-name">{esc(a.name)}</span>
+            <span class="a-date">{a.modified}</span>
+            <span class="a-size">{a.size}</span>
           </a>'''
+        if more:
+            browse = urllib.parse.urlencode({'folder': proj['folder']})
+            arts_html += f'''
+          <a href="/tools?{browse}#files" style="display:inline-block;margin-top:8px;font-size:12px">Browse all files →</a>'''
 
     body = f'''
     <div class="page-header">
@@ -984,8 +3529,8 @@ def render_project(slug):
 # ───────────────────────────────────────────────────────────────────────────
 # TOOLS & FILES
 # ───────────────────────────────────────────────────────────────────────────
-def render_tools():
-    """Tools, generators, and file browser."""
+def render_tools(qs=None):
+    """Tools, generators, and file browser (`qs`: file_query parameters)."""
     tools = [
         ('Run Full Pipeline', 'Execute daily orchestrator (cleanup → signals → brief → calendar)', 'pipeline', icon('play', 14)),
         ('Calculate Metrics', 'Recalculate project metrics', 'gen-metrics', icon('trending', 14)),
@@ -1016,99 +3561,682 @@ def render_tools():
 
     html += '</div></div>'
 
-    # File browser
-    arts = _cached('all_arts', scan_artifacts, ttl=120)
-    html += f'''
-    <div class="section">
-      <div class="section-title">{icon('folder', 14)} Recent Files <span style="font-size:11px;font-weight:400;color:var(--text2);text-transform:none">{len(arts)} artifacts</span></div>
-      <div style="max-height:500px;overflow-y:auto">'''
+    html += file_browser(qs or {})
+
+    return html_page('Tools & Files', html, 'tools')
 
-    for a in arts[:40]:
+def file_browser(qs):
+    """One page of the file browser: filters, rows and a cursor link to the next page."""
+    try:
+        q = file_query(qs)
+    except ValueError as e:
+        q, error = {'sort': 'recent', 'limit': 40}, str(e)
+    else:
+        error = ''
+    with stage('scan'):
+        arts, more = ARTIFACTS.query(**q)
+    params = {k: qs[k][0] for k in ('folder', 'ext', 'cat', 'since', 'until', 'sort', 'limit')
+              if qs.get(k, [''])[0]}
+    filtered = any(k in params for k in ('folder', 'ext', 'cat', 'since', 'until'))
+    count = f'{len(ARTIFACTS):,} artifacts' if not filtered else f'in {esc(params.get("folder", "selection"))}'
+
+    def options(name, values, labels):
+        cur = params.get(name, '')
+        return ''.join(f'<option value="{esc(v)}"{" selected" if v == cur else ""}>{esc(l)}</option>'
+                       for v, l in zip(values, labels))
+
+    folder = params.get('folder', '')
+    html = f'''
+    <div class="section" id="files">
+      <div class="section-title">{icon('folder', 14)} Files <span style="font-size:11px;font-weight:400;color:var(--text2);text-transform:none">{count}</span></div>
+      <form class="file-filters" method="get" action="/tools#files">
+        {f'<input type="hidden" name="folder" value="{esc(folder)}">' if folder else ''}
+        <select name="cat">{options('cat', [''] + sorted(ALL_FOLDERS), ['All folders'] + sorted(ALL_FOLDERS))}</select>
+        <select name="ext">{options('ext', ('',) + _EXT_NAMES, ('All types',) + _EXT_NAMES)}</select>
+        <input type="date" name="since" value="{esc(params.get('since', ''))}" title="Modified since">
+        <input type="date" name="until" value="{esc(params.get('until', ''))}" title="Modified until">
+        <select name="sort">{options('sort', ['recent', 'name', 'size'], ['Newest', 'Name', 'Largest'])}</select>
+        <button class="btn-sm" type="submit">Apply</button>
+        {'<a class="btn-sm" href="/tools#files">Clear</a>' if params else ''}
+      </form>'''
+    if error:
+        html += f'<p style="color:var(--red);font-size:12px">{esc(error)}</p>'
+    if not arts:
+        html += '<p style="color:var(--text2);font-size:12px">No matching files.</p>'
+    for a in arts:
         html += f'''
-        <a class="artifact-row" href="/open?path={urllib.parse.quote(a['path'])}" style="text-decoration:none;color:var(--text)">
-          {a['icon']}
-          <span class="a-name">{esc(a['name'])}</span>
-          <span class="a-date">{a['modified']}</span>
-          <span class="a-size">{a['size']}</span>
+        <a class="artifact-row" href="/file/{urllib.parse.quote(a.path)}" style="text-decoration:none;color:var(--text)">
+          {a.icon}
+          <span class="a-name">{esc(a.name)}</span>
+          <span class="a-date">{a.modified}</span>
+          <span class="a-size">{a.size}</span>
         </a>'''
+    nav = []
+    if qs.get('cursor'):
+        nav.append(f'<a href="/tools?{urllib.parse.urlencode(params)}#files">« First page</a>')
+    if more:
+        nav.append(f'<a href="/tools?{urllib.parse.urlencode({**params, "cursor": encode_cursor(more)})}#files">Next page →</a>')
+    if nav:
+        html += f'<div class="file-pager">{" · ".join(nav)}</div>'
+    html += '</div>'
+    return html
 
-    html += '</div></div>'
+# ───────────────────────────────────────────────────────────────────────────
+# JOBS — action runs and their live logs
+# ───────────────────────────────────────────────────────────────────────────
+_JOB_COLORS = {'queued': 'var(--text3)', 'running': 'var(--accent)', 'done': 'var(--green)',
+               'failed': 'var(--red)', 'timeout': 'var(--orange)', 'error': 'var(--red)'}
 
-    return html_page('Tools & Files', html, 'tools')
+def _job_state(job):
+    return f'<span style="color:{_JOB_COLORS.get(job.state, "var(--text2)")}">● {job.state}</span>'
+
+def render_jobs():
+    """Recent action runs."""
+    html = f'''
+    <div class="page-header">
+      <h1>Jobs</h1>
+      <div class="subtitle">Runs started from Tools and the pipeline button · logs in _Automation/logs/jobs</div>
+    </div>
+    <div class="section">
+      <div class="section-title">{icon('play', 14)} Recent Runs</div>'''
+    jobs = JOBS.jobs()
+    if not jobs:
+        html += '<p style="color:var(--text2)">No jobs yet — run one from <a href="/tools">Tools</a>.</p>'
+    for job in jobs:
+        started = datetime.fromtimestamp(job.started or job.created).strftime('%Y-%m-%d %H:%M:%S')
+        took = f'{(job.finished or _time.time()) - job.started:.0f}s' if job.started else ''
+        html += f'''
+      <a class="artifact-row" href="/jobs/{job.id}" style="text-decoration:none;color:var(--text)">
+        <span class="a-name">{esc(job.action)}</span>
+        <span class="a-date">{_job_state(job)}</span>
+        <span class="a-date">{started}</span>
+        <span class="a-size">{took}</span>
+      </a>'''
+    html += '</div>'
+    return html_page('Jobs', html, 'jobs')
+
+def render_job(jid):
+    """One job with a live tail of its output."""
+    job = JOBS.get(jid)
+    if not job:
+        return html_page('Not Found', '<h1>Job not found</h1><p><a href="/jobs">All jobs</a></p>', 'jobs')
+    lines, seq = JOBS.tail(job)
+    html = f'''
+    <div class="page-header">
+      <h1>{esc(job.action)}</h1>
+      <div class="subtitle"><span id="job-state">{_job_state(job)}</span> · {esc(' '.join(job.cmd))}
+        · <a href="{esc(job.redirect)}">Back</a> · <a href="/jobs">All jobs</a></div>
+    </div>
+    <pre class="job-log" id="job-log">{esc(''.join(l + chr(10) for l in lines))}</pre>
+    <script>
+    (function() {{
+      var after = {seq}, box = document.getElementById('job-log'), st = document.getElementById('job-state');
+      function poll() {{
+        fetch('/api/jobs/{job.id}/log?after=' + after).then(function(r) {{ return r.json(); }}).then(function(d) {{
+          if (d.lines.length) {{
+            var end = box.scrollTop + box.clientHeight >= box.scrollHeight - 4;
+            box.textContent += d.lines.join('\\n') + '\\n';
+            if (end) box.scrollTop = box.scrollHeight;
+          }}
+          after = d.next;
+          st.textContent = '● ' + d.state;
+          if (d.state === 'queued' || d.state === 'running') setTimeout(poll, 1000);
+        }}).catch(function() {{ setTimeout(poll, 3000); }});
+      }}
+      if ({'true' if job.active else 'false'}) setTimeout(poll, 500);
+    }})();
+    </script>'''
+    return html_page(f'Job — {job.action}', html, 'jobs')
+
+# ───────────────────────────────────────────────────────────────────────────
+# VALIDATORS — ETag inputs per route, computed without rendering
+# ───────────────────────────────────────────────────────────────────────────
+def file_stamp(*paths):
+    """(mtime_ns, size) of each path, None where missing — a cheap fingerprint."""
+    out = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+def _config_version():
+    """Config plus the code that renders pages: restarting with either
+    changed retires every ETag handed out before."""
+    h = hashlib.sha1(json.dumps(_CFG, sort_keys=True, default=str).encode('utf-8'))
+    h.update(repr(file_stamp(__file__, md_render.__file__)).encode())
+    return h.hexdigest()[:12]
+
+CONFIG_VERSION = _config_version()
+
+# Change topic → input files for a day (the same topics the watcher publishes)
+_TOPIC_FILES = {
+    'calendar': lambda day: [os.path.join(SIG, f'calendar_{day}.md')],
+    'emails': lambda day: [os.path.join(SIG, f'emails_{day}.md')],
+    'signals': lambda day: [os.path.join(SIG, f'{t}_{day}.md') for t in _SIGNAL_TYPES],
+    'actions': lambda day: [os.path.join(KB, 'Action_Items.md')],
+    'jobs': lambda day: [os.path.join(AUTO, 'logs', f'{datetime.now():%Y-%m-%d}.log')],
+    'brief': lambda day: [brief_path(day) or os.path.join(BRIEFS, f'{day}_Brief.md')],
+}
+
+# Change topic → the `_cached` keys holding today's parse of its files
+_TOPIC_KEYS = collections.defaultdict(set)
+for _rx, _keys, _topics in WATCH_RULES:
+    for _t in _topics:
+        _TOPIC_KEYS[_t].update(_keys)
+_STAMPS = {}  # topic → (day, stamp) its cached parse was last checked against
+_STAMPS_LOCK = threading.Lock()
+
+def topic_stamp(topic, day):
+    """Fingerprint of one topic's files for a day. When today's files differ
+    from the last fingerprint, the cached parse is dropped first, so a body
+    is never older than the ETag it is sent with (the cache may be inside
+    its TTL, or the watcher off or not yet polled). Signal days whose files
+    were archived are read from the store, so its files count too."""
+    paths = _TOPIC_FILES[topic](day) if topic in _TOPIC_FILES else []
+    if topic in ('calendar', 'emails', 'signals'):
+        paths = paths + [STORE.db_path, STORE.db_path + '-wal']
+    stamp = file_stamp(*paths)
+    keys = _TOPIC_KEYS.get(topic)
+    if keys and day == datetime.now().strftime('%Y-%m-%d'):
+        with _STAMPS_LOCK:
+            changed = _STAMPS.get(topic) != (day, stamp)
+            _STAMPS[topic] = (day, stamp)
+        if changed:
+            _invalidate(keys)
+    return stamp
+
+def topic_inputs(topics, date_str=None):
+    """Fingerprint of everything `topics` cover for a day."""
+    now = datetime.now()
+    day = date_str or now.strftime('%Y-%m-%d')
+    return (day, now.hour < 12, now.hour < 17, tuple(topic_stamp(t, day) for t in sorted(set(topics))))
+
+def page_inputs():
+    """Inputs of the chrome around every page: nav badges and the live-update version."""
+    return (FEED.version, JOBS.running(), topic_stamp('actions', datetime.now().strftime('%Y-%m-%d')))
+
+HOME_TOPICS = tuple(sorted({t for topics, _ in HOME_SECTIONS.values() for t in topics}))
+
+def home_inputs(name=None, date_str=None):
+    """The whole home page, or one of its sections."""
+    if name is None:
+        return (page_inputs(), topic_inputs(HOME_TOPICS))
+    return topic_inputs(HOME_SECTIONS[name][0], date_str)
+
+def api_inputs(name, date_str=None):
+    """A section of the JSON API: the topics of its matching home section."""
+    frag = API_SECTIONS[name][2]
+    return topic_inputs(HOME_SECTIONS[frag][0] if frag else HOME_TOPICS, date_str)
+
+def brief_inputs(date_str=None, fallback=True):
+    """The brief for a day; the page also falls back to the last three days."""
+    today = datetime.now()
+    if not date_str or not re.fullmatch(r'\d{4}-\d{2}-\d{2}', date_str):
+        date_str = today.strftime('%Y-%m-%d')
+    days = [date_str]
+    if fallback:
+        days += [(today - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(1, 4)]
+    return (page_inputs() if fallback else None, today.strftime('%Y-%m-%d'),
+            tuple(topic_stamp('brief', d) for d in days))
+
+def artifact_inputs():
+    """Version of the artifact index after a (throttled) refresh."""
+    ARTIFACTS.refresh()
+    return ARTIFACTS.version
+
+def jobs_inputs(jid=None):
+    """Job states and output positions; running jobs show elapsed seconds."""
+    if jid is not None:
+        job = JOBS.get(jid)
+        return job and (job.state, job.seq)
+    jobs = JOBS.jobs()
+    ticking = int(_time.time()) if any(j.state == 'running' for j in jobs) else None
+    return (tuple((j.id, j.state, j.seq) for j in jobs), ticking)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # HTTP SERVER
 # ═══════════════════════════════════════════════════════════════════════════
+_ROOT_REAL = os.path.realpath(ROOT)
+
+# Artifact extension → (Content-Type, shown inline by browsers)
+FILE_TYPES = {
+    '.pdf': ('application/pdf', True),
+    '.png': ('image/png', True), '.jpg': ('image/jpeg', True), '.jpeg': ('image/jpeg', True),
+    '.gif': ('image/gif', True), '.mp4': ('video/mp4', True),
+    '.html': ('text/html; charset=utf-8', True), '.md': ('text/plain; charset=utf-8', True),
+    '.docx': ('application/vnd.openxmlformats-officedocument.wordprocessingml.document', False),
+    '.pptx': ('application/vnd.openxmlformats-officedocument.presentationml.presentation', False),
+    '.xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', False),
+    '.doc': ('application/msword', False), '.ppt': ('application/vnd.ms-powerpoint', False),
+    '.xls': ('application/vnd.ms-excel', False),
+}
+
+def resolve_artifact(rel):
+    """Workspace-relative path → real path of the file, or None unless it is
+    an artifact (an EXTS file outside SKIP dirs) that really lives under ROOT.
+    '..', absolute paths and symlinks leading out of the workspace all fail."""
+    if not rel or '\0' in rel:
+        return None
+    parts = rel.replace('\\', '/').split('/')
+    if any(p in ('', '.', '..') or p in SKIP for p in parts):
+        return None
+    full = os.path.realpath(os.path.join(_ROOT_REAL, *parts))
+    try:
+        if os.path.commonpath([full, _ROOT_REAL]) != _ROOT_REAL:
+            return None
+    except ValueError:  # another drive
+        return None
+    if any(p in SKIP for p in os.path.relpath(full, _ROOT_REAL).split(os.sep)):
+        return None
+    if os.path.splitext(full)[1].lower() not in EXTS or not os.path.isfile(full):
+        return None
+    return full
+
+_BYTE_RANGE = re.compile(r'bytes=(\d*)-(\d*)')
+
+def byte_range(header, size):
+    """A single `Range: bytes=` span → (first, last) inclusive; False if it
+    can't be satisfied; None if malformed or multi-range (send everything)."""
+    m = _BYTE_RANGE.fullmatch(header.strip())
+    if not m or m.group(1) == m.group(2) == '':
+        return None
+    first, last = m.groups()
+    if first == '':  # suffix: the last N bytes
+        n = int(last)
+        return (max(0, size - n), size - 1) if n and size else False
+    first = int(first)
+    if first >= size:
+        return False
+    last = min(int(last), size - 1) if last else size - 1
+    return (first, last) if last >= first else None
+
 
 class BrainHandler(http.server.BaseHTTPRequestHandler):
     """Handles all HTTP requests for Brain OS."""
 
+    protocol_version = 'HTTP/1.1'  # keep-alive; every response sets Content-Length
+    timeout = PORTAL_CFG.get('keepalive_seconds', 5)  # idle keep-alive releases its worker
+
+    _status = '-'
+    _validators = ()  # ETag / Cache-Control for this response, set by _not_modified
+
     def log_message(self, format, *args):
         pass  # Suppress default access logs
 
-    def _send_html(self, html_content, code=200):
+    def log_request(self, code='-', size='-'):
+        self._status = code  # reported by the access log in do_GET
+
+    def end_headers(self):
+        # Don't let idle keep-alive connections hold workers others are queued for
+        if self.server.saturated():
+            self.send_header('Connection', 'close')
+        super().end_headers()
+
+    def _send_body(self, body, ctype, code=200, headers=()):
+        enc = None
+        if COMPRESS and len(body) >= COMPRESS_MIN and ctype.startswith(_COMPRESSIBLE):
+            enc = negotiate(self.headers.get('Accept-Encoding'))
+            if enc:
+                with stage('compress'):
+                    body = compress(body, enc)
         self.send_response(code)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_header('Content-type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        if enc:
+            self.send_header('Content-Encoding', enc)
+        if COMPRESS and ctype.startswith(_COMPRESSIBLE):
+            self.send_header('Vary', 'Accept-Encoding')
+        for k, v in headers:
+            self.send_header(k, v)
+        if code == 200:
+            for k, v in self._validators:
+                # Each encoding is its own representation with its own ETag
+                self.send_header(k, f'{v[:-1]}-{enc}"' if enc and k == 'ETag' else v)
+        timings = SERVER_TIMING and timing_header()
+        if timings:
+            self.send_header('Server-Timing', timings)
         self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.wfile.write(body)
+
+    def _send_html(self, html_content, code=200):
+        self._send_body(html_content.encode('utf-8'), 'text/html; charset=utf-8', code)
 
     def _send_json(self, data, code=200):
-        self.send_response(code)
-        self.send_header('Content-type', 'application/json')
+        self._send_body(json.dumps(data).encode('utf-8'), 'application/json', code)
+
+    def _not_modified(self, inputs, max_age=0):
+        """Derive this response's ETag from its `inputs` (plus the config
+        version and URL). If the client already holds it, answer 304 and
+        return True — the caller then skips rendering altogether."""
+        with stage('etag'):
+            raw = repr((CONFIG_VERSION, self._target, inputs)).encode('utf-8')
+            etag = f'"{hashlib.sha1(raw).hexdigest()[:20]}"'
+        cache = f'private, max-age={max_age}' if max_age else 'no-cache'
+        self._validators = (('ETag', etag), ('Cache-Control', cache))
+        if not self._client_has(etag):
+            return False
+        self.send_response(304)
+        for k, v in self._validators:
+            self.send_header(k, v)
+        if COMPRESS:
+            self.send_header('Vary', 'Accept-Encoding')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode('utf-8'))
+        return True
+
+    def _client_has(self, etag):
+        """Whether If-None-Match names `etag` in any of its encodings."""
+        sent = self.headers.get('If-None-Match')
+        if not sent:
+            return False
+        if sent.strip() == '*':
+            return True
+        for tag in sent.split(','):
+            tag = re.sub(r'-(?:br|gzip)"$', '"', tag.strip().removeprefix('W/'))
+            if tag == etag:
+                return True
+        return False
+
+    def _static(self, path):
+        """A /static asset: immutable, precompressed, 304 on revalidation."""
+        asset = STATIC.get(path)
+        if asset is None:
+            self._send_body(b'not found', 'text/plain; charset=utf-8', 404)
+            return
+        etag = f'"{asset.digest}"'
+        enc, body = asset.variant(self.headers.get('Accept-Encoding'))
+        fresh = self._client_has(etag)
+        self.send_response(304 if fresh else 200)
+        self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        self.send_header('ETag', f'"{asset.digest}-{enc}"' if enc else etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        if fresh:
+            self.end_headers()
+            return
+        self.send_header('Content-type', asset.ctype)
+        self.send_header('Content-Length', str(len(body)))
+        if enc:
+            self.send_header('Content-Encoding', enc)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_file(self, rel):
+        """Stream an artifact straight from disk with socket.sendfile. A single
+        Range span, If-None-Match / If-Modified-Since and If-Range are honoured.
+        Files are sandboxed so workspace HTML can't script the portal."""
+        full = resolve_artifact(rel)
+        try:
+            f = open(full, 'rb') if full else None
+        except OSError:
+            f = None
+        if f is None:
+            self._send_body(b'file not found', 'text/plain; charset=utf-8', 404)
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            etag = f'"{st.st_mtime_ns:x}-{size:x}"'
+            modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+            headers = (('ETag', etag), ('Last-Modified', modified),
+                       ('Cache-Control', 'private, no-cache'), ('Accept-Ranges', 'bytes'),
+                       ('X-Content-Type-Options', 'nosniff'), ('Content-Security-Policy', 'sandbox'))
+            if self._file_fresh(etag, st.st_mtime):
+                self.send_response(304)
+                for k, v in headers:
+                    self.send_header(k, v)
+                self.end_headers()
+                return
+            code, first, last = 200, 0, size - 1
+            # A stale If-Range means the client's partial copy is outdated: send it all
+            if self.headers.get('Range') and self.headers.get('If-Range', etag).strip() in (etag, modified):
+                span = byte_range(self.headers['Range'], size)
+                if span is False:
+                    self._send_body(b'', 'text/plain; charset=utf-8', 416,
+                                    (('Content-Range', f'bytes */{size}'),))
+                    return
+                if span:
+                    code, (first, last) = 206, span
+            ctype, inline = FILE_TYPES.get(os.path.splitext(full)[1].lower(),
+                                           ('application/octet-stream', False))
+            name = urllib.parse.quote(os.path.basename(full))
+            self.send_response(code)
+            self.send_header('Content-type', ctype)
+            self.send_header('Content-Length', str(last - first + 1))
+            if code == 206:
+                self.send_header('Content-Range', f'bytes {first}-{last}/{size}')
+            self.send_header('Content-Disposition',
+                             f"{'inline' if inline else 'attachment'}; filename*=UTF-8''{name}")
+            for k, v in headers:
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.flush()
+            if last >= first:
+                with stage('sendfile'):
+                    self.connection.sendfile(f, first, last - first + 1)
+
+    def _file_fresh(self, etag, mtime):
+        """If-None-Match wins; If-Modified-Since only counts without it."""
+        if self.headers.get('If-None-Match'):
+            return self._client_has(etag)
+        since = self.headers.get('If-Modified-Since')
+        if not since:
+            return False
+        try:
+            return int(mtime) <= email.utils.parsedate_to_datetime(since).timestamp()
+        except (TypeError, ValueError):
+            return False
 
     def _redirect(self, url):
         self.send_response(302)
         self.send_header('Location', url)
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
+    def _send_page(self, render, *args):
+        with stage('render'):
+            page = render(*args)
+        self._send_html(page)
+
     def do_GET(self):
-        parsed = urllib.parse.urlparse(self.path)
+        self._status = '-'
+        self._validators = ()
+        t0 = _time.perf_counter()
+        if SERVER_TIMING:
+            timing_begin()
+        try:
+            self._dispatch(self.path)
+        finally:
+            timing_end()
+            total = _time.perf_counter() - t0
+            if METRICS_ENABLED:
+                METRICS.observe_request(self.path, self._status, total)
+            if ACCESS_LOG:
+                print(f'  [{PORTAL_NAME}] GET {self.path} {self._status} {total * 1000:.1f}ms')
+
+    def _dispatch(self, target):
+        self._target = target
+        parsed = urllib.parse.urlparse(target)
         path = parsed.path.rstrip('/')
         qs = urllib.parse.parse_qs(parsed.query)
 
         # ── Pages ──
         if path == '' or path == '/':
-            self._send_html(render_home())
+            if not self._not_modified(home_inputs()):
+                self._send_page(render_home)
             return
 
         if path == '/brief':
             date = qs.get('date', [None])[0]
-            self._send_html(render_brief(date))
+            if not self._not_modified(brief_inputs(date)):
+                self._send_page(render_brief, date)
             return
 
         if path == '/tools':
-            self._send_html(render_tools())
+            if not self._not_modified((page_inputs(), artifact_inputs())):
+                self._send_page(render_tools, qs)
             return
 
         if path.startswith('/project/'):
             slug = path.split('/project/', 1)[1]
-            self._send_html(render_project(slug))
+            if not self._not_modified((page_inputs(), artifact_inputs())):
+                self._send_page(render_project, slug)
+            return
+
+        if path.startswith('/static/'):
+            self._static(path)
+            return
+
+        if path.startswith('/file/'):
+            self._send_file(urllib.parse.unquote(path[len('/file/'):]))
+            return
+
+        # ── Live updates ──
+        if path == '/events':
+            self._events(qs)
+            return
+
+        if path.startswith('/fragment/home/'):
+            date = qs.get('date', [None])[0]
+            if date and not re.fullmatch(r'\d{4}-\d{2}-\d{2}', date):
+                self._send_body(b'date must be YYYY-MM-DD', 'text/plain; charset=utf-8', 400)
+                return
+            name = path.split('/fragment/home/', 1)[1]
+            if name not in HOME_SECTIONS:
+                self._send_body(b'unknown section', 'text/plain; charset=utf-8', 404)
+                return
+            # no-cache: live updates refetch a section on change, so the
+            # browser must revalidate rather than reuse its copy
+            if not self._not_modified(home_inputs(name, date)):
+                with stage('render'):
+                    frag = render_home_section(name, date)
+                self._send_html(frag)
+            return
+
+        if path == '/fragment/brief':
+            date = qs.get('date', [''])[0]
+            if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', date):
+                date = datetime.now().strftime('%Y-%m-%d')
+            if not self._not_modified(brief_inputs(date, fallback=False), 60):
+                self._send_page(render_brief_body, date)
+            return
+
+        # ── Section data (versioned JSON) ──
+        m = re.fullmatch(r'/api(?:/v(\d+))?/(home|calendar|actions|emails|counts)', path)
+        if m and not (m.group(2) == 'counts' and not m.group(1)):
+            if m.group(1) and int(m.group(1)) != API_VERSION:
+                self._send_json({'error': 'unsupported API version', 'versions': [API_VERSION]}, 404)
+                return
+            date = qs.get('date', [None])[0]
+            if date and not re.fullmatch(r'\d{4}-\d{2}-\d{2}', date):
+                self._send_json({'error': 'date must be YYYY-MM-DD'}, 400)
+                return
+            name = m.group(2)
+            if not self._not_modified(api_inputs(name, date), API_SECTIONS[name][1]):
+                self._send_json(api_section(name, date)[0])
             return
 
         # ── API ──
         if path == '/api/search':
-            q = qs.get('q', [''])[0].lower()
-            if len(q) < 2:
-                self._send_json([])
+            if self._not_modified(artifact_inputs()):
                 return
-            arts = _cached('all_arts', scan_artifacts, ttl=120)
-            results = [{'name': a['name'], 'path': a['path'], 'icon': a['icon']}
-                       for a in arts if q in a['name'].lower() or q in a['path'].lower()]
-            self._send_json(results[:10])
+            q = qs.get('q', [''])[0]
+            results = [{'name': a.name, 'path': a.path, 'icon': a.icon}
+                       for a in ARTIFACTS.search(q, limit=10)]
+            self._send_json(results)
             return
 
-        # ── File open ──
-        if path == '/open':
-            fpath = qs.get('path', [''])[0]
-            full = os.path.join(ROOT, fpath)
-            if os.path.exists(full):
+        if path == '/api/files':
+            try:
+                q = file_query(qs)
+            except ValueError as e:
+                self._send_json({'error': str(e)}, 400)
+                return
+            if not self._not_modified(artifact_inputs()):
+                arts, more = ARTIFACTS.query(**q)
+                filtered = {'folder', 'exts', 'cat', 'since', 'until'} & q.keys()
+                self._send_json({'items': [a.to_dict() for a in arts],
+                                 'next': encode_cursor(more) if more else None,
+                                 'total': None if filtered else len(ARTIFACTS)})
+            return
+
+        if path == '/api/search/content':
+            q = qs.get('q', [''])[0]
+            self._send_json(TEXTS.search(q) if len(q.strip()) >= 2 else [])
+            return
+
+        if path in ('/api/signals', '/api/signals/counts'):
+            if self._not_modified(file_stamp(STORE.db_path, STORE.db_path + '-wal')):
+                return
+
+        if path == '/api/signals':
+            args = {k: qs.get(k, [None])[0] for k in ('type', 'since', 'until', 'charter', 'sender')}
+            try:
+                args['limit'] = max(1, min(5000, int(qs.get('limit', ['200'])[0])))
+            except ValueError:
+                args['limit'] = 200
+            self._send_json(STORE.query(**args))
+            return
+
+        if path == '/api/signals/counts':
+            self._send_json(STORE.daily_counts(qs.get('since', [None])[0], qs.get('until', [None])[0]))
+            return
+
+        if path == '/api/cache':
+            self._send_json(CACHE.snapshot())
+            return
+
+        if path == '/jobs':
+            if not self._not_modified((page_inputs(), jobs_inputs())):
+                self._send_page(render_jobs)
+            return
+
+        if path.startswith('/jobs/'):
+            jid = path.split('/jobs/', 1)[1]
+            if not self._not_modified((page_inputs(), jobs_inputs(jid))):
+                self._send_page(render_job, jid)
+            return
+
+        if path == '/api/jobs':
+            if not self._not_modified(jobs_inputs()):
+                self._send_json([j.to_dict() for j in JOBS.jobs()])
+            return
+
+        if path.startswith('/api/jobs/'):
+            jid, _, sub = path[len('/api/jobs/'):].partition('/')
+            job = JOBS.get(jid)
+            if not job or sub not in ('', 'log'):
+                self._send_json({'error': 'job not found'}, 404)
+            elif self._not_modified(jobs_inputs(jid)):
+                pass
+            elif sub == 'log':
                 try:
-                    os.startfile(full)
-                except Exception:
-                    pass
-            self._redirect('/')
+                    after = int(qs.get('after', ['0'])[0])
+                except ValueError:
+                    after = 0
+                lines, seq = JOBS.tail(job, after)
+                self._send_json({'lines': lines, 'next': seq, 'state': job.state})
+            else:
+                self._send_json(job.to_dict())
+            return
+
+        if path == '/metrics' and METRICS_ENABLED:
+            self._send_body(METRICS.render().encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8')
+            return
+
+        if path == '/api/kb/search':
+            q = qs.get('q', [''])[0]
+            try:
+                limit = max(1, min(50, int(qs.get('limit', ['10'])[0])))
+            except ValueError:
+                limit = 10
+            self._send_json(KB_INDEX.search(q, limit))
+            return
+
+        # ── File open ── (old links; artifacts are served at /file/<path>)
+        if path == '/open':
+            self._redirect('/file/' + urllib.parse.quote(qs.get('path', [''])[0]))
             return
 
         # ── Actions ──
@@ -1117,73 +4245,138 @@ class BrainHandler(http.server.BaseHTTPRequestHandler):
             self._handle_action(cmd)
             return
 
+        # ── Debug ──
+        if path == '/debug/profile' and PROFILE_ENDPOINT:
+            self._profile(qs)
+            return
+
         # 404
         self._send_html(html_page('Not Found', '<h1>404 — Page not found</h1><p><a href="/">Go home</a></p>'), 404)
 
-    def _handle_action(self, cmd):
-        """Execute commands and redirect."""
-        py_exe = os.path.join(ROOT, '.venv', 'Scripts', 'python.exe')
-        if not os.path.exists(py_exe):
-            py_exe = 'python'
-
-        actions = {
-            'pipeline': {
-                'cmd': ['powershell', '-NoProfile', '-File', os.path.join(AUTO, 'daily_orchestrator.ps1'), '-Force'],
-                'redirect': '/'
-            },
-            'cleanup': {
-                'cmd': ['powershell', '-NoProfile', '-File', os.path.join(AUTO, 'cleanup.ps1')],
-                'redirect': '/'
-            },
-            'snapshot': {
-                'cmd': ['powershell', '-NoProfile', '-File', os.path.join(AUTO, 'weekly_snapshot.ps1')],
-                'redirect': '/'
-            },
-            'gen-metrics': {
-                'cmd': [py_exe, os.path.join(AUTO, 'calculate_metrics.py')],
-                'redirect': '/tools'
-            },
-            'fetch-emails': {
-                'cmd': ['powershell', '-NoProfile', '-File', os.path.join(AUTO, 'fetch_emails.ps1')],
-                'redirect': '/'
-            },
-            'fetch-calendar': {
-                'cmd': ['powershell', '-NoProfile', '-File', os.path.join(AUTO, 'fetch_calendar.ps1')],
-                'redirect': '/'
-            },
-            'sync-instructions': {
-                'cmd': ['powershell', '-NoProfile', '-File', os.path.join(AUTO, 'sync_instructions.ps1')],
-                'redirect': '/tools'
-            },
-            'dryrun': {
-                'cmd': ['powershell', '-NoProfile', '-File', os.path.join(AUTO, 'daily_orchestrator.ps1'), '-DryRun', '-Force'],
-                'redirect': '/tools'
-            },
-        }
+    def _events(self, qs):
+        """Start an SSE stream and hand the connection to the change feed."""
+        since = self.headers.get('Last-Event-ID') or qs.get('since', [''])[0]
+        try:
+            since = int(since)
+        except ValueError:
+            since = None
+        if FEED.clients() >= FEED.max_clients:
+            self.send_response(503)
+            self.send_header('Retry-After', '30')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(b'retry: 5000\n\n')
+        self.close_connection = True
+        if FEED.attach(self.connection, since):
+            self.server.detach(self.request)
+
+    def _profile(self, qs):
+        """Run one GET of ?path= under cProfile and return its top frames.
+        Options: sort=cumulative|tottime|ncalls, limit=N, cold=1 (clear cache first)."""
+        target = qs.get('path', ['/'])[0] or '/'
+        if not target.startswith('/') or target.startswith(('/debug', '/action', '/open', '/file/', '/events')):
+            self._send_body(b'path must be a page or /api route\n', 'text/plain; charset=utf-8', 400)
+            return
+        sort = qs.get('sort', ['cumulative'])[0]
+        if sort not in ('cumulative', 'tottime', 'ncalls'):
+            sort = 'cumulative'
+        try:
+            limit = max(1, min(200, int(qs.get('limit', ['40'])[0])))
+        except ValueError:
+            limit = 40
+        if not _PROFILE_LOCK.acquire(blocking=False):
+            self._send_body(b'another profile is running\n', 'text/plain; charset=utf-8', 409)
+            return
+        # The profiled response is written to a buffer instead of the socket
+        wfile, close, own_target = self.wfile, self.close_connection, self._target
+        prof = cProfile.Profile()
+        try:
+            if qs.get('cold', ['0'])[0] == '1':
+                CACHE.clear()
+            self.wfile = io.BytesIO()
+            t0 = _time.perf_counter()
+            prof.enable()
+            try:
+                self._dispatch(target)
+            finally:
+                prof.disable()
+                elapsed = _time.perf_counter() - t0
+                response = self.wfile.getvalue()
+        finally:
+            self.wfile, self.close_connection = wfile, close
+            # The report must not carry the profiled page's ETag / Cache-Control
+            self._validators, self._target = (), own_target
+            _PROFILE_LOCK.release()
+        status = response.split(b'\r\n', 1)[0].decode('latin-1').partition(' ')[2]
+        out = io.StringIO()
+        out.write(f'GET {target} -> {status}, {elapsed * 1000:.1f} ms, {len(response):,} bytes\n\n')
+        pstats.Stats(prof, stream=out).sort_stats(sort).print_stats(limit)
+        self._send_body(out.getvalue().encode('utf-8'), 'text/plain; charset=utf-8')
 
+    def _handle_action(self, cmd):
+        """Start (or join) the job for an action and show its live log."""
         if cmd == 'brief':
             self._redirect('/brief')
             return
-
-        action = actions.get(cmd)
-        if not action:
+        if cmd not in ACTIONS:
             self._redirect('/')
             return
+        job, _ = JOBS.submit(cmd)
+        self._redirect(f'/jobs/{job.id}')
+
 
-        if 'cmd' in action:
-            # Clear relevant cache
-            with _cache_lock:
-                _cache.clear()
+_PROFILE_LOCK = threading.Lock()  # one profiled request at a time
+
+
+class BrainServer(http.server.HTTPServer):
+    """HTTP server that hands connections to a fixed pool of worker threads.
+
+    Accepted connections wait in a bounded queue; once it is full, new
+    connections get an immediate 503 with Retry-After instead of piling up.
+    """
+
+    def __init__(self, addr, handler, workers=8, queue_depth=32):
+        super().__init__(addr, handler)
+        self._pending = queue.Queue(maxsize=queue_depth)
+        self._detached = set()
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f'brain-http-{i}', daemon=True).start()
+
+    def saturated(self):
+        return not self._pending.empty()
+
+    def detach(self, request):
+        """Keep `request` open after its handler returns (it now belongs to the change feed)."""
+        self._detached.add(request)
+
+    def process_request(self, request, client_address):
+        try:
+            self._pending.put_nowait((request, client_address))
+        except queue.Full:
             try:
-                subprocess.Popen(
-                    action['cmd'], cwd=ROOT,
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
-                )
-            except Exception as e:
-                print(f'  [Action] {cmd} failed: {e}')
+                request.sendall(b'HTTP/1.1 503 Service Unavailable\r\nRetry-After: 2\r\n'
+                                b'Content-Length: 0\r\nConnection: close\r\n\r\n')
+            except OSError:
+                pass
+            self.shutdown_request(request)
 
-        self._redirect(action.get('redirect', '/'))
+    def _work(self):
+        while True:
+            request, client_address = self._pending.get()
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                if request in self._detached:
+                    self._detached.discard(request)
+                else:
+                    self.shutdown_request(request)
 
 
 def main():
@@ -1193,14 +4386,30 @@ def main():
     print(f'  ║  http://localhost:{PORT}                ║')
     print(f'  ╚═══════════════════════════════════════╝\n')
 
-    server = http.server.HTTPServer(('', PORT), BrainHandler)
+    server = BrainServer(('', PORT), BrainHandler,
+                         workers=PORTAL_CFG.get('workers', 8),
+                         queue_depth=PORTAL_CFG.get('queue_depth', 32))
     print(f'  [{PORTAL_NAME}] Serving on port {PORT}')
+    METRICS.gauge('brain_http_queue_depth', 'Accepted connections waiting for a worker.', server._pending.qsize)
+    METRICS.gauge('brain_http_workers', 'HTTP worker threads.', lambda: PORTAL_CFG.get('workers', 8))
+    if ARTIFACTS.start(ARTIFACTS_SNAPSHOT, PORTAL_CFG.get('snapshot_seconds', 300),
+                       PORTAL_CFG.get('restat_seconds', 300)):
+        print(f'  [{PORTAL_NAME}] Loaded {len(ARTIFACTS):,} artifacts from snapshot')
+        gc.freeze()  # the records are long-lived and acyclic: keep them out of every collection
+    WATCHER.start()
+    if WATCHER.active:
+        print(f'  [{PORTAL_NAME}] Watching workspace ({WATCHER.backend})')
+    TEXTS.start()
+    STORE.start()
+    JOBS.prune_logs()
 
     # Handle Ctrl+C gracefully
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print(f'\n  [{PORTAL_NAME}] Shutting down...')
+        JOBS.shutdown()
+        ARTIFACTS.save()
         server.shutdown()
 
 